@@ -0,0 +1,4 @@
+"""Benchmarks for contentful.cda, run as modules from the repository root, e.g.::
+
+    python -m benchmarks.raw_fields
+"""
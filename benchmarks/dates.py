@@ -0,0 +1,32 @@
+"""Benchmark comparing :func:`dateutil.parser.parse` with :class:`.dates.DateParser`,
+with and without memo, for dates in the formats returned by the API.
+
+Usage::
+
+    python -m benchmarks.dates [count] [distinct]
+"""
+from __future__ import print_function
+from contentful.cda.dates import DateParser
+from dateutil import parser
+import sys
+import timeit
+
+
+def main(count=20000, distinct=500):
+    values = ['2015-{0:02d}-{1:02d}T{2:02d}:13:37.808Z'.format(i % 12 + 1, i % 28 + 1, i % 24)
+              for i in range(distinct)]
+    values = [values[i % distinct] for i in range(count)]
+    print('{0} dates, {1} distinct'.format(count, distinct))
+
+    for name, parse in [('dateutil', parser.parse),
+                        ('DateParser', DateParser().parse),
+                        ('DateParser (memo)', DateParser(memo_size=distinct).parse)]:
+        start = timeit.default_timer()
+        for value in values:
+            parse(value)
+        duration = timeit.default_timer() - start
+        print('{0:<18} {1:>8.2f} ms   {2:>6.2f} us/date'.format(name, duration * 1000, duration * 1e6 / count))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
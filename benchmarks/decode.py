@@ -0,0 +1,46 @@
+"""Benchmark comparing the time spent decoding a response body with the time spent
+creating resources out of the decoded JSON, for every available decoder.
+
+Usage::
+
+    python -m benchmarks.decode [count] [repeat]
+"""
+from __future__ import print_function
+from benchmarks import payloads
+from contentful.cda.decoders import available_decoders
+from contentful.cda.serialization import ResourceFactory
+import json
+import sys
+import timeit
+
+
+def best_of(repeat, func):
+    """Run a function repeatedly, measuring the fastest run.
+
+    :param repeat: (int) Number of runs.
+    :param func: Function without arguments.
+    :return: Duration of the fastest run in seconds.
+    """
+    result = None
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        func()
+        duration = timeit.default_timer() - start
+        result = duration if result is None else min(result, duration)
+    return result
+
+
+def main(count=1000, repeat=10):
+    content = json.dumps(payloads.array(count)).encode('utf-8')
+    factory = ResourceFactory([])
+    print('{0} entries, {1:.1f} KiB'.format(count, len(content) / 1024.0))
+
+    for decoder in available_decoders():
+        decode = best_of(repeat, lambda: decoder.decode(content))
+        build = best_of(repeat, lambda: factory.from_json(decoder.decode(content))) - decode
+        print('{0:<8} decode {1:>8.2f} ms   build {2:>8.2f} ms   decode share {3:>5.1f} %'.format(
+            decoder.name, decode * 1000, build * 1000, 100 * decode / (decode + build)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
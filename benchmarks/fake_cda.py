@@ -0,0 +1,432 @@
+"""fake_cda module.
+
+Local HTTP server mimicking the parts of the Content Delivery API used by the client, for load
+testing without hitting the real CDN. Content is served from memory, either synthetic
+(:func:`FakeSpace.synthetic`) or recorded API responses (:func:`FakeSpace.load`).
+
+Supported endpoints are ``/spaces/{id}``, ``/spaces/{id}/entries``, ``/spaces/{id}/assets``,
+``/spaces/{id}/content_types`` and ``/spaces/{id}/sync``. Arrays honor the `skip`, `limit`,
+`include`, `content_type`, `sys.id` and `sys.id[in]` query parameters. Latency and rate limited
+(429) responses can be injected::
+
+    with FakeCDA(FakeSpace.synthetic(1000), latency=0.005, throttle_ratio=0.05) as server:
+        client = Client(server.space_id, 'token', endpoint=server.endpoint, secure=False)
+
+Usage::
+
+    python -m benchmarks.fake_cda [--port 8000] [--entries 1000] [--latency 0.005] [--throttle-ratio 0.05]
+"""
+from __future__ import print_function
+from benchmarks import payloads
+from contentful.cda import const
+from contentful.cda.fields import Boolean, Date, List, Number, Object, Text
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import random
+import threading
+import time
+
+
+CONTENT_TYPE_FIELD_TYPES = {
+    Text: 'Text', Number: 'Integer', Date: 'Date', Boolean: 'Boolean', List: 'Array', Object: 'Object'
+}
+
+
+class FakeSpace(object):
+    """Content of a space served by a :class:`.FakeCDA`.
+
+    **Attributes**:
+
+    - entries (list): JSON of all Entries, in order.
+    - assets (list): JSON of all Assets, in order.
+    - content_types (list): JSON of all Content Types.
+    - locale (str): Locale field values are served in, localized for synchronizations.
+    """
+    def __init__(self, entries=None, assets=None, content_types=None, locale=const.DEFAULT_LOCALE):
+        """FakeSpace constructor.
+
+        :param entries: (list) JSON of Entries, as returned by the API.
+        :param assets: (list) JSON of Assets, as returned by the API.
+        :param content_types: (list) JSON of Content Types, as returned by the API.
+        :param locale: (str) Locale of the field values.
+        :return: :class:`.FakeSpace` instance.
+        """
+        super(FakeSpace, self).__init__()
+        self.entries = entries or []
+        self.assets = assets or []
+        self.content_types = content_types or []
+        self.locale = locale
+        self.resources = {'Entry': {}, 'Asset': {}}
+        for resource in self.entries + self.assets:
+            self.resources[resource['sys']['type']][resource['sys']['id']] = resource
+
+    @classmethod
+    def synthetic(cls, count, fields=10, link_density=0.2, include_depth=1, assets=10):
+        """Create a space of `synthetic` Entries, see :func:`.payloads.synthetic_array`.
+
+        :param count: (int) Number of Entries, not counting those only linked to.
+        :param fields: (int) Number of fields per Entry.
+        :param link_density: (float) Share of fields linking to other Entries.
+        :param include_depth: (int) Number of levels of linked Entries.
+        :param assets: (int) Number of Assets.
+        :return: :class:`.FakeSpace` instance.
+        """
+        array = payloads.synthetic_array(count, fields, link_density, include_depth)
+        entries = array['items'] + array.get('includes', {}).get('Entry', [])
+        return cls(entries, [payloads.asset(i) for i in range(assets)],
+                   [cls.synthetic_content_type(fields, link_density)])
+
+    @staticmethod
+    def synthetic_content_type(fields=10, link_density=0.2):
+        """Create the JSON of the `synthetic` Content Type, see :func:`.payloads.synthetic_entry_class`.
+
+        :param fields: (int) Number of fields.
+        :param link_density: (float) Share of fields linking to other Entries.
+        :return: JSON dict.
+        """
+        link_ids, field_ids = payloads.synthetic_field_ids(fields, link_density)
+        result = []
+        for i, field_id in enumerate(link_ids):
+            if i % 2 == 0:
+                result.append({'id': field_id, 'name': field_id, 'type': 'Link', 'linkType': 'Entry'})
+            else:
+                result.append({'id': field_id, 'name': field_id, 'type': 'Array',
+                               'items': {'type': 'Link', 'linkType': 'Entry'}})
+        for i, field_id in enumerate(field_ids):
+            field_type = payloads.SYNTHETIC_FIELD_TYPES[i % len(payloads.SYNTHETIC_FIELD_TYPES)]
+            result.append({'id': field_id, 'name': field_id, 'type': CONTENT_TYPE_FIELD_TYPES[field_type]})
+
+        return {'sys': {'type': 'ContentType', 'id': 'synthetic'}, 'name': 'Synthetic',
+                'displayField': field_ids[0] if field_ids else None, 'fields': result}
+
+    @classmethod
+    def load(cls, *paths):
+        """Create a space out of recorded API responses.
+
+        Each file holds the JSON of an Array response (or a list of those), all items and
+        includes are collected, regardless of their type.
+
+        :param paths: (str) Paths of JSON files.
+        :return: :class:`.FakeSpace` instance.
+        """
+        responses = []
+        for path in paths:
+            with open(path) as f:
+                content = json.load(f)
+            responses.extend(content if isinstance(content, list) else [content])
+
+        resources = {'Entry': {}, 'Asset': {}, 'ContentType': {}}
+        for response in responses:
+            included = [item for items in response.get('includes', {}).values() for item in items]
+            for resource in response.get('items', []) + included:
+                resources.get(resource['sys']['type'], {}).setdefault(resource['sys']['id'], resource)
+
+        return cls(list(resources['Entry'].values()), list(resources['Asset'].values()),
+                   list(resources['ContentType'].values()))
+
+    def find(self, resource_type, params):
+        """Find the resources matching the `content_type`, `sys.id` and `sys.id[in]` query parameters.
+
+        :param resource_type: (str) Either `Entry` or `Asset`.
+        :param params: (dict) Query parameters.
+        :return: list of JSON dicts.
+        """
+        if 'sys.id' in params or 'sys.id[in]' in params:
+            ids = [params['sys.id']] if 'sys.id' in params else params['sys.id[in]'].split(',')
+            result = [self.resources[resource_type].get(resource_id) for resource_id in ids]
+            result = [resource for resource in result if resource is not None]
+        else:
+            result = self.entries if resource_type == 'Entry' else self.assets
+
+        content_type = params.get('content_type')
+        if content_type is not None:
+            result = [resource for resource in result
+                      if resource['sys'].get('contentType', {}).get('sys', {}).get('id') == content_type]
+        return result
+
+    def includes_for(self, items, depth):
+        """Collect the resources linked to by `items`, transitively up to `depth` levels.
+
+        :param items: (list) JSON of Entries.
+        :param depth: (int) Number of levels.
+        :return: dict of lists of JSON dicts, mapped by type.
+        """
+        seen = set(('Entry', item['sys']['id']) for item in items)
+        result = {}
+        level = items
+        for _ in range(depth):
+            found = []
+            for resource in level:
+                for link_type, resource_id in self.links_of(resource):
+                    linked = self.resources.get(link_type, {}).get(resource_id)
+                    if linked is not None and (link_type, resource_id) not in seen:
+                        seen.add((link_type, resource_id))
+                        result.setdefault(link_type, []).append(linked)
+                        found.append(linked)
+            level = found
+        return result
+
+    @staticmethod
+    def links_of(resource):
+        """Find all links within the fields of a resource, including links in lists.
+
+        :param resource: JSON dict.
+        :return: generator of `(link_type, resource_id)` tuples.
+        """
+        for value in resource.get('fields', {}).values():
+            for element in value if isinstance(value, list) else [value]:
+                sys = element.get('sys') if isinstance(element, dict) else None
+                if sys is not None and sys.get('type') == 'Link':
+                    yield sys['linkType'], sys['id']
+
+    def localized(self, resource):
+        """Create the JSON of a resource as returned by a synchronization, with localized field values.
+
+        :param resource: JSON dict.
+        :return: JSON dict.
+        """
+        fields = dict((field_id, {self.locale: value}) for field_id, value in resource.get('fields', {}).items())
+        return dict(resource, fields=fields)
+
+
+class FakeCDA(object):
+    """Local HTTP server serving the content of a :class:`.FakeSpace` like the Content Delivery API.
+
+    Each request is delayed by `latency` plus a random `jitter`, and answered with a rate limited
+    (429) response with a probability of `throttle_ratio`. The server handles requests on separate
+    threads, and runs on a background thread between :func:`start` and :func:`stop`.
+
+    **Attributes**:
+
+    - space (:class:`.FakeSpace`): Content served.
+    - space_id (str): Space ID expected in request paths.
+    - latency (float): Seconds every request is delayed by.
+    - jitter (float): Maximum number of seconds every request is additionally delayed by.
+    - throttle_ratio (float): Share of requests answered with a rate limited response.
+    - rate_limit_reset (int): Value of the ``X-Contentful-RateLimit-Reset`` header of rate limited responses.
+    - sync_page_size (int): Number of items per page of a synchronization.
+    - requests (int): Number of requests received.
+    - throttled (int): Number of rate limited responses.
+    """
+    def __init__(self, space, space_id='space', latency=0, jitter=0, throttle_ratio=0, rate_limit_reset=0,
+                 sync_page_size=100, host='127.0.0.1', port=0, seed=None):
+        """FakeCDA constructor.
+
+        :param space: :class:`.FakeSpace` instance.
+        :param space_id: (str) Space ID expected in request paths.
+        :param latency: (float) Seconds every request is delayed by.
+        :param jitter: (float) Maximum number of seconds every request is additionally delayed by.
+        :param throttle_ratio: (float) Share of requests answered with a rate limited response.
+        :param rate_limit_reset: (int) Value of the ``X-Contentful-RateLimit-Reset`` header, `None` to omit it.
+        :param sync_page_size: (int) Number of items per page of a synchronization.
+        :param host: (str) Host to listen on.
+        :param port: (int) Port to listen on, by default any free port.
+        :param seed: Optional seed for the random jitter and rate limiting.
+        :return: :class:`.FakeCDA` instance.
+        """
+        super(FakeCDA, self).__init__()
+        self.space = space
+        self.space_id = space_id
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_ratio = throttle_ratio
+        self.rate_limit_reset = rate_limit_reset
+        self.sync_page_size = sync_page_size
+        self.requests = 0
+        self.throttled = 0
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), FakeCDAHandler)
+        self.server.cda = self
+        self.thread = None
+
+    @property
+    def endpoint(self):
+        """Endpoint to configure a :class:`.Client` with, as `host:port`."""
+        host, port = self.server.server_address[:2]
+        return '{0}:{1}'.format(host, port)
+
+    def start(self):
+        """Start serving requests on a background thread.
+
+        :return: this :class:`.FakeCDA` instance for convenience.
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the listening socket."""
+        if self.thread is not None:
+            self.server.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def stats(self):
+        """Retrieve the server counters.
+
+        :return: dict with `requests` and `throttled` values.
+        """
+        with self.lock:
+            return {'requests': self.requests, 'throttled': self.throttled}
+
+    def respond(self, path, params):
+        """Create the response for a request.
+
+        :param path: (str) Request path.
+        :param params: (dict) Query parameters, with a single value per parameter.
+        :return: tuple of the HTTP status code, response headers and JSON body.
+        """
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            throttled = self.random.random() < self.throttle_ratio
+            if throttled:
+                self.throttled += 1
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if throttled:
+            headers = {} if self.rate_limit_reset is None else {
+                'X-Contentful-RateLimit-Reset': str(self.rate_limit_reset)}
+            return 429, headers, self.error('RateLimitExceeded', 'You have exceeded the rate limit.')
+
+        segments = path.strip('/').split('/')
+        if len(segments) < 2 or segments[0] != 'spaces' or segments[1] != self.space_id or len(segments) > 3:
+            return 404, {}, self.error('NotFound', 'The resource could not be found.')
+
+        resource = segments[2] if len(segments) == 3 else ''
+        try:
+            if resource == '':
+                return 200, {}, {'sys': {'type': 'Space', 'id': self.space_id}, 'name': 'Fake Space'}
+            elif resource == const.PATH_ENTRIES:
+                return 200, {}, self.array('Entry', params)
+            elif resource == const.PATH_ASSETS:
+                return 200, {}, self.array('Asset', params)
+            elif resource == const.PATH_CONTENT_TYPES:
+                return 200, {}, self.paginate(self.space.content_types, params)
+            elif resource == const.PATH_SYNC:
+                return 200, {}, self.sync(params)
+        except ValueError as e:
+            return 400, {}, self.error('BadRequest', str(e))
+
+        return 404, {}, self.error('NotFound', 'The resource could not be found.')
+
+    def array(self, resource_type, params):
+        result = self.paginate(self.space.find(resource_type, params), params)
+        depth = min(int(params.get('include', 1)), const.MAX_INCLUDE_DEPTH)
+        if resource_type == 'Entry' and depth > 0:
+            includes = self.space.includes_for(result['items'], depth)
+            if includes:
+                result['includes'] = includes
+        return result
+
+    @staticmethod
+    def paginate(resources, params):
+        skip = int(params.get('skip', 0))
+        limit = min(int(params.get('limit', 100)), const.MAX_PAGE_SIZE)
+        if skip < 0 or limit < 0:
+            raise ValueError('Invalid skip or limit.')
+        return {'sys': {'type': 'Array'}, 'total': len(resources), 'skip': skip, 'limit': limit,
+                'items': resources[skip:skip + limit]}
+
+    def sync(self, params):
+        """Create a page of a synchronization.
+
+        An initial synchronization pages through all Entries and Assets, tokens of later
+        synchronizations yield no changes.
+
+        :param params: (dict) Query parameters, either `initial` or `sync_token`.
+        :return: JSON dict.
+        """
+        if params.get('initial') == 'true':
+            offset = 0
+        elif params.get('sync_token', '').startswith('page'):
+            offset = int(params['sync_token'][len('page'):])
+        elif params.get('sync_token'):
+            offset = None
+        else:
+            raise ValueError('Either "initial" or a "sync_token" must be provided.')
+
+        resources = self.space.entries + self.space.assets
+        items = [] if offset is None else resources[offset:offset + self.sync_page_size]
+        result = {'sys': {'type': 'Array'}, 'items': [self.space.localized(item) for item in items]}
+
+        url = 'https://{0}/spaces/{1}/sync?sync_token={2}'
+        if offset is not None and offset + self.sync_page_size < len(resources):
+            result['nextPageUrl'] = url.format(const.CDA_ADDRESS, self.space_id,
+                                               'page{0}'.format(offset + self.sync_page_size))
+        else:
+            result['nextSyncUrl'] = url.format(const.CDA_ADDRESS, self.space_id, 'synced')
+        return result
+
+    @staticmethod
+    def error(error_id, message):
+        return {'sys': {'type': 'Error', 'id': error_id}, 'message': message}
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """HTTP server handling each request on a separate thread."""
+    daemon_threads = True
+
+
+class FakeCDAHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Request handler delegating to the :class:`.FakeCDA` of its server."""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True   # Headers and body are written separately
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+        status, headers, body = self.server.cda.respond(url.path, params)
+
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/vnd.contentful.delivery.v1+json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve synthetic or recorded content like the Content Delivery API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--space-id', default='space')
+    parser.add_argument('--entries', type=int, default=1000, help='number of synthetic Entries')
+    parser.add_argument('--recorded', nargs='*', default=None, help='JSON files of recorded Array responses')
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--throttle-ratio', type=float, default=0)
+    args = parser.parse_args(argv)
+
+    space = FakeSpace.load(*args.recorded) if args.recorded else FakeSpace.synthetic(args.entries)
+    server = FakeCDA(space, args.space_id, args.latency, args.jitter, args.throttle_ratio,
+                     host=args.host, port=args.port)
+    print('Serving {0} entries on http://{1}/spaces/{2}'.format(len(space.entries), server.endpoint, args.space_id))
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""Load test measuring the throughput and tail latency of a :class:`.Client` under concurrent callers.
+
+Requests are served by a local :class:`.fake_cda.FakeCDA`, with optional latency and rate
+limited responses, so the client (connection pooling, retries, decoding, resource creation
+and link resolution) is measured without hitting the real CDN. Every scenario is run with
+each of the given numbers of concurrent callers, sharing a single client::
+
+    python -m benchmarks.loadtest --scenario page --threads 1,4,16 --requests 500 --latency 0.005
+
+The server runs within the same process by default, sharing the interpreter with the client.
+For CPU bound scenarios, it can be started separately with the same number of Entries instead::
+
+    python -m benchmarks.fake_cda --port 8000 --entries 1000 &
+    python -m benchmarks.loadtest --endpoint 127.0.0.1:8000 --entries 1000
+
+Scenarios:
+
+- page: Fetch a random page of Entries, resolving links.
+- ids: Fetch 10 random Entries using a `sys.id[in]` query.
+- first: Fetch a single random Entry using `first()`.
+- assets: Fetch the first page of Assets.
+- sync: Perform an initial synchronization of the whole space.
+
+Usage::
+
+    python -m benchmarks.loadtest [--scenario page] [--threads 1,4,16] [--requests 500] [--entries 1000]
+                                  [--page-size 100] [--latency 0] [--jitter 0] [--throttle-ratio 0]
+                                  [--backoff 0.05] [--breakdown] [--endpoint HOST:PORT]
+"""
+from __future__ import print_function
+from benchmarks.fake_cda import FakeCDA, FakeSpace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contentful.cda.client import Client
+from contentful.cda.hooks import Histogram, HistogramCollector
+from contentful.cda.ratelimit import RetryPolicy
+from contentful.cda.resources import Asset, Entry
+import argparse
+import random
+import threading
+import timeit
+
+
+def fetch_page(client, space, rnd, page_size):
+    skip = rnd.randrange(0, max(1, len(space.entries) - page_size + 1))
+    return client.fetch(Entry).where({'skip': skip, 'limit': page_size}).all()
+
+
+def fetch_ids(client, space, rnd, page_size):
+    ids = [entry['sys']['id'] for entry in rnd.sample(space.entries, min(10, len(space.entries)))]
+    return client.fetch(Entry).where({'sys.id[in]': ','.join(ids), 'limit': len(ids)}).all()
+
+
+def fetch_first(client, space, rnd, page_size):
+    return client.fetch(Entry).where({'sys.id': rnd.choice(space.entries)['sys']['id']}).first()
+
+
+def fetch_assets(client, space, rnd, page_size):
+    return client.fetch(Asset).where({'limit': page_size}).all()
+
+
+def sync(client, space, rnd, page_size):
+    return client.sync(initial=True)
+
+
+SCENARIOS = {'page': fetch_page, 'ids': fetch_ids, 'first': fetch_first, 'assets': fetch_assets, 'sync': sync}
+
+
+def run(client, space, scenario, requests, threads, page_size=100, seed=0):
+    """Invoke a scenario `requests` times from `threads` concurrent callers sharing `client`.
+
+    :param client: :class:`.Client` instance configured for a :class:`.FakeCDA` serving `space`.
+    :param space: :class:`.FakeSpace` instance, used for picking random IDs and offsets.
+    :param scenario: (str) Name of the scenario, see :data:`SCENARIOS`.
+    :param requests: (int) Number of invocations of the scenario.
+    :param threads: (int) Number of concurrent callers.
+    :param page_size: (int) Number of resources per page.
+    :param seed: (int) Seed for picking random IDs and offsets.
+    :return: dict with `requests`, `errors`, `elapsed` seconds, `throughput` per second and
+        a `latency` summary in seconds (see :func:`.Histogram.summary`).
+    """
+    call = SCENARIOS[scenario]
+    latencies = Histogram(max_samples=requests)
+    errors = []
+    lock = threading.Lock()
+
+    def invoke(index):
+        rnd = random.Random(seed * requests + index)
+        start = timeit.default_timer()
+        try:
+            call(client, space, rnd, page_size)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+            return
+
+        duration = timeit.default_timer() - start
+        with lock:
+            latencies.add(duration)
+
+    start = timeit.default_timer()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(invoke, range(requests)))
+    elapsed = timeit.default_timer() - start
+
+    return {'requests': requests, 'errors': len(errors), 'elapsed': elapsed,
+            'throughput': (requests - len(errors)) / elapsed, 'latency': latencies.summary()}
+
+
+@contextmanager
+def serve(space, args):
+    """Start a :class:`.FakeCDA` for the duration of the load test, unless an external `endpoint` is used.
+
+    :return: the :class:`.FakeCDA` instance, `None` for an external endpoint.
+    """
+    if args.endpoint:
+        yield None
+        return
+
+    with FakeCDA(space, latency=args.latency, jitter=args.jitter, throttle_ratio=args.throttle_ratio,
+                 seed=0) as server:
+        yield server
+
+
+def ms(value):
+    return float('nan') if value is None else value * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure Client throughput and tail latency against a fake CDA.')
+    parser.add_argument('--scenario', default='page', choices=sorted(SCENARIOS))
+    parser.add_argument('--threads', default='1,4,16', help='comma separated numbers of concurrent callers')
+    parser.add_argument('--requests', type=int, default=500, help='invocations of the scenario per run')
+    parser.add_argument('--entries', type=int, default=1000, help='number of synthetic Entries served')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0, help='seconds every response is delayed by')
+    parser.add_argument('--jitter', type=float, default=0, help='maximum additional random delay in seconds')
+    parser.add_argument('--throttle-ratio', type=float, default=0, help='share of rate limited (429) responses')
+    parser.add_argument('--backoff', type=float, default=0.05, help='base delay in seconds of retries')
+    parser.add_argument('--breakdown', action='store_true', help='report client side timings per path')
+    parser.add_argument('--endpoint', default=None, help='HOST:PORT of a separately started fake CDA')
+    parser.add_argument('--space-id', default='space', help='space ID of a separately started fake CDA')
+    args = parser.parse_args(argv)
+
+    space = FakeSpace.synthetic(args.entries)
+    with serve(space, args) as server:
+        endpoint = args.endpoint or server.endpoint
+        space_id = args.space_id if server is None else server.space_id
+        print('{0} scenario, {1} requests per run, {2} entries served on {3}'.format(
+            args.scenario, args.requests, len(space.entries), endpoint))
+        print('{0:>8} {1:>10} {2:>9} {3:>9} {4:>9} {5:>9} {6:>7} {7:>9} {8:>6}'.format(
+            'threads', 'req/s', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'errors', 'requests', '429s'))
+
+        for threads in [int(value) for value in args.threads.split(',')]:
+            collector = HistogramCollector()
+            before = server.stats() if server is not None else None
+            client = Client(space_id, 'token', endpoint=endpoint, secure=False,
+                            pool_size=threads, retry_policy=RetryPolicy(backoff=args.backoff),
+                            observers=[collector] if args.breakdown else None)
+            with client:
+                result = run(client, space, args.scenario, args.requests, threads, args.page_size)
+
+            counts = ['-', '-']
+            if server is not None:
+                after = server.stats()
+                counts = [after['requests'] - before['requests'], after['throttled'] - before['throttled']]
+
+            latency = result['latency']
+            print('{0:>8} {1:>10.1f} {2:>9.2f} {3:>9.2f} {4:>9.2f} {5:>9.2f} {6:>7} {7:>9} {8:>6}'.format(
+                threads, result['throughput'], ms(latency['p50']), ms(latency['p90']), ms(latency['p99']),
+                ms(latency['max']), result['errors'], *counts))
+
+            for path, measurements in sorted(collector.summary().items()):
+                for name, summary in sorted(measurements.items()):
+                    if name.endswith('_time'):
+                        print('{0:>12} {1:<14} p50 {2:>8.2f} ms   p99 {3:>8.2f} ms'.format(
+                            path or '/', name, ms(summary['p50']), ms(summary['p99'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""payloads module.
+
+Deterministic synthetic CDA responses used as input for the benchmarks, either shaped like
+those of the `cat` Content Type of the demo space (:func:`array`), or of a configurable
+`synthetic` Content Type (:func:`synthetic_array` and :func:`synthetic_entry_class`).
+"""
+from contentful.cda.fields import Boolean, Date, Field, Link, List, Number, Object, Text
+from contentful.cda.resources import Entry
+
+
+def link(resource_id, link_type='Entry'):
+    return {'sys': {'type': 'Link', 'linkType': link_type, 'id': resource_id}}
+
+
+def entry(index, content_type='cat', friends=3):
+    """Create the JSON of a single Entry.
+
+    :param index: (int) Index of the Entry, used for deriving its ID and field values.
+    :param content_type: (str) Content Type ID.
+    :param friends: (int) Number of links to other Entries in the `friends` field.
+    :return: JSON dict.
+    """
+    return {
+        'sys': {
+            'type': 'Entry',
+            'id': 'cat{0}'.format(index),
+            'revision': 1,
+            'createdAt': '2013-06-27T22:46:19.513Z',
+            'updatedAt': '2013-09-04T09:19:39.027Z',
+            'locale': 'en-US',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        },
+        'fields': {
+            'name': 'Cat #{0}'.format(index),
+            'likes': ['rainbows', 'fish', 'yarn #{0}'.format(index % 7)],
+            'color': ['rainbow', 'gray', 'orange'][index % 3],
+            'lives': index % 9 + 1,
+            'birthday': '2011-04-{0:02d}T22:00:00+00:00'.format(index % 28 + 1),
+            'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 4,
+            'bestFriend': link('cat{0}'.format(index + 1)),
+            'friends': [link('cat{0}'.format(index + i)) for i in range(2, friends + 2)],
+            'image': link('image{0}'.format(index % 10), 'Asset')
+        }
+    }
+
+
+def asset(index):
+    """Create the JSON of a single Asset.
+
+    :param index: (int) Index of the Asset, used for deriving its ID.
+    :return: JSON dict.
+    """
+    return {
+        'sys': {'type': 'Asset', 'id': 'image{0}'.format(index), 'revision': 1},
+        'fields': {
+            'title': 'Image #{0}'.format(index),
+            'file': {'url': '//images.contentful.com/image{0}.png'.format(index), 'contentType': 'image/png',
+                     'fileName': 'image{0}.png'.format(index), 'details': {'size': 12345}}
+        }
+    }
+
+
+def array(count, includes=True, friends=3):
+    """Create the JSON of an Array of Entries, linking to each other and to Assets.
+
+    :param count: (int) Number of Entries in `items`.
+    :param includes: (bool) Indicates whether linked resources are contained in `includes`.
+    :param friends: (int) Number of links to other Entries per Entry.
+    :return: JSON dict.
+    """
+    result = {
+        'sys': {'type': 'Array'},
+        'total': count,
+        'skip': 0,
+        'limit': count,
+        'items': [entry(i, friends=friends) for i in range(count)]
+    }
+    if includes:
+        result['includes'] = {
+            'Entry': [entry(i, friends=friends) for i in range(count, count + friends + 1)],
+            'Asset': [asset(i) for i in range(10)]
+        }
+    return result
+
+
+SYNTHETIC_FIELD_TYPES = [Text, Number, Date, Boolean, List, Object]
+
+
+def synthetic_field_ids(fields, link_density):
+    """Determine the field IDs of the `synthetic` Content Type.
+
+    :param fields: (int) Number of fields.
+    :param link_density: (float) Share of fields linking to other Entries.
+    :return: tuple of the IDs of link fields and the IDs of other fields.
+    """
+    links = int(round(fields * link_density))
+    return (['link{0}'.format(i) for i in range(links)],
+            ['field{0}'.format(i) for i in range(fields - links)])
+
+
+def synthetic_entry_class(fields=10, link_density=0.2, localized=False):
+    """Create a custom Entry class for the `synthetic` Content Type.
+
+    :param fields: (int) Number of fields.
+    :param link_density: (float) Share of fields linking to other Entries.
+    :param localized: (bool) Indicates whether field values are localized, in which case
+        all fields are declared as :class:`.fields.Object`.
+    :return: :class:`.Entry` subclass.
+    """
+    link_ids, field_ids = synthetic_field_ids(fields, link_density)
+    attrs = {'__content_type__': 'synthetic'}
+    for i, field_id in enumerate(link_ids):
+        attrs[field_id] = Field(Object if localized else Link if i % 2 == 0 else List)
+    for i, field_id in enumerate(field_ids):
+        attrs[field_id] = Field(Object if localized else SYNTHETIC_FIELD_TYPES[i % len(SYNTHETIC_FIELD_TYPES)])
+    return type('Synthetic', (Entry,), attrs)
+
+
+def synthetic_value(field_type, index):
+    if field_type is Text:
+        return 'Value #{0} lorem ipsum dolor sit amet'.format(index)
+    elif field_type is Number:
+        return index
+    elif field_type is Date:
+        return '2015-{0:02d}-{1:02d}T{2:02d}:13:37.808Z'.format(index % 12 + 1, index % 28 + 1, index % 24)
+    elif field_type is Boolean:
+        return index % 2 == 0
+    elif field_type is List:
+        return ['tag{0}'.format(index % 10), 'tag{0}'.format(index % 7)]
+    return {'lat': 52.5 + index % 10, 'lon': 13.4, 'label': 'Object #{0}'.format(index)}
+
+
+def synthetic_entry(entry_id, index, link_ids, field_ids, targets, locales=None):
+    """Create the JSON of a single Entry of the `synthetic` Content Type.
+
+    Even link fields hold a single link, odd link fields a list of three links.
+
+    :param entry_id: (str) Entry ID.
+    :param index: (int) Index of the Entry, used for deriving field values and link targets.
+    :param link_ids: (list) IDs of link fields.
+    :param field_ids: (list) IDs of other fields.
+    :param targets: (list) IDs of the Entries links may point to.
+    :param locales: (list) Optional locales, field values are localized if provided.
+    :return: JSON dict.
+    """
+    fields = {}
+    for i, field_id in enumerate(link_ids):
+        if i % 2 == 0:
+            fields[field_id] = link(targets[(index + i) % len(targets)])
+        else:
+            fields[field_id] = [link(targets[(index + i + j) % len(targets)]) for j in range(3)]
+    for i, field_id in enumerate(field_ids):
+        fields[field_id] = synthetic_value(SYNTHETIC_FIELD_TYPES[i % len(SYNTHETIC_FIELD_TYPES)], index + i)
+
+    if locales:
+        fields = dict((k, dict((locale, v) for locale in locales)) for k, v in fields.items())
+
+    return {
+        'sys': {
+            'type': 'Entry',
+            'id': entry_id,
+            'revision': 1,
+            'createdAt': '2015-06-27T22:46:19.513Z',
+            'updatedAt': '2015-09-04T09:19:39.027Z',
+            'locale': locales[0] if locales else 'en-US',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'synthetic'}}
+        },
+        'fields': fields
+    }
+
+
+def synthetic_array(count, fields=10, link_density=0.2, include_depth=1, locales=None):
+    """Create the JSON of an Array of `synthetic` Entries.
+
+    Items link to Entries of the first level of `includes`, which in turn link to Entries of
+    the next level, up to `include_depth` levels. Entries of the last level link back to the items.
+    Every level of `includes` holds a quarter as many Entries as there are items.
+
+    :param count: (int) Number of Entries in `items`.
+    :param fields: (int) Number of fields per Entry.
+    :param link_density: (float) Share of fields linking to other Entries.
+    :param include_depth: (int) Number of levels of included Entries, `0` for no `includes`.
+    :param locales: (list) Optional locales, field values are localized if provided.
+    :return: JSON dict.
+    """
+    link_ids, field_ids = synthetic_field_ids(fields, link_density)
+    pool = max(1, count // 4)
+    levels = [['item{0}'.format(i) for i in range(count)]]
+    levels += [['include{0}-{1}'.format(depth, i) for i in range(pool)] for depth in range(1, include_depth + 1)]
+
+    entries = []
+    for depth, ids in enumerate(levels):
+        targets = levels[depth + 1] if depth + 1 < len(levels) else levels[0]
+        entries.append([synthetic_entry(entry_id, i, link_ids, field_ids, targets, locales)
+                        for i, entry_id in enumerate(ids)])
+
+    result = {
+        'sys': {'type': 'Array'},
+        'total': count,
+        'skip': 0,
+        'limit': count,
+        'items': entries[0]
+    }
+    if include_depth > 0:
+        result['includes'] = {'Entry': [entry for level in entries[1:] for entry in level]}
+    return result
@@ -0,0 +1,42 @@
+"""Allocation benchmark for creating Entries with and without copying `raw_fields`.
+
+Usage::
+
+    python -m benchmarks.raw_fields [count]
+"""
+from __future__ import print_function
+from benchmarks import payloads
+from contentful.cda.serialization import ResourceFactory
+import copy
+import sys
+import tracemalloc
+
+
+def measure(factory, payload):
+    """Create all resources of a payload, measuring the memory retained by them.
+
+    :param factory: :class:`.ResourceFactory` instance.
+    :param payload: JSON dict, consumed by the factory.
+    :return: tuple of retained and peak allocated bytes.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = factory.from_json(payload)
+    result.resolve_links()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained - before, peak - before
+
+
+def main(count=5000):
+    payload = payloads.array(count)
+    print('{0} entries'.format(count))
+    for name, factory in [('copy raw_fields', ResourceFactory([])),
+                          ('lazy raw_fields', ResourceFactory([], lazy_raw_fields=True))]:
+        retained, peak = measure(factory, copy.deepcopy(payload))
+        print('{0:<20} retained {1:>10.1f} KiB   peak {2:>10.1f} KiB'.format(name, retained / 1024.0, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
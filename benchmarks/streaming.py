@@ -0,0 +1,66 @@
+"""Benchmark comparing :func:`.RequestArray.all` with :func:`.RequestArray.stream` for a single
+large page, measuring the time to the first resource, the total time and the peak memory usage.
+
+Responses are served from memory, so only parsing is measured.
+
+Usage::
+
+    python -m benchmarks.streaming [count]
+"""
+from __future__ import print_function
+from benchmarks import payloads
+from contentful.cda.client import Client
+from contentful.cda.resources import Entry
+from requests import Response
+import json
+import sys
+import timeit
+import tracemalloc
+
+
+class MemoryHttpClient(object):
+    """Serves the same response body for every request."""
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response._content = self.content
+        response._content_consumed = True
+        return response
+
+
+def measure(iterate):
+    """Consume an iterable of resources, measuring time and peak memory.
+
+    :param iterate: Function returning an iterable of resources.
+    :return: tuple of the time to the first resource, the total time and the peak allocated bytes.
+    """
+    tracemalloc.start()
+    start = timeit.default_timer()
+    first = None
+    for _ in iterate():
+        if first is None:
+            first = timeit.default_timer() - start
+    total = timeit.default_timer() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main(count=1000):
+    content = json.dumps(payloads.array(count)).encode('utf-8')
+    client = Client('space', 'token', resolve_links=False, lazy_raw_fields=True)
+    client.dispatcher.httpclient = MemoryHttpClient(content)
+    print('{0} entries, {1:.1f} KiB'.format(count, len(content) / 1024.0))
+
+    for name, iterate in [('all', lambda: client.fetch(Entry).all().items),
+                          ('stream', lambda: client.fetch(Entry).stream())]:
+        first, total, peak = measure(iterate)
+        print('{0:<8} first item {1:>8.2f} ms   total {2:>8.2f} ms   peak {3:>10.1f} KiB'.format(
+            name, first * 1000, total * 1000, peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
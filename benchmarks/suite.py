@@ -0,0 +1,170 @@
+"""Benchmark suite for deserialization and link resolution.
+
+Times and measures the peak memory of :func:`.ResourceFactory.from_json` (plain and custom
+Entries), :func:`.ResourceFactory.create_entry` (plain and custom Entries) and
+:func:`.Array.resolve_links` for synthetic Arrays of increasing sizes (see :mod:`benchmarks.payloads`).
+
+Results can be saved and compared against a previous run, the comparison fails in case any
+benchmark got slower, or allocates more, than the given threshold::
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.25
+
+Usage::
+
+    python -m benchmarks.suite [--sizes 10,100,1000,10000] [--fields 10] [--link-density 0.2]
+                               [--include-depth 1] [--locales en-US,de-DE] [--repeat 5]
+                               [--save FILE] [--compare FILE] [--threshold 0.25]
+"""
+from __future__ import print_function
+from benchmarks import payloads
+from contentful.cda.serialization import ResourceFactory
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+
+
+class Case(object):
+    """Single benchmark, consisting of an untimed setup and a timed function.
+
+    **Attributes**:
+
+    - name (str): Name of the benchmark.
+    - setup: Function creating the argument of `run` out of the JSON of an Array.
+    - run: Function to be measured.
+    """
+    def __init__(self, name, setup, run):
+        super(Case, self).__init__()
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+    def measure(self, content, repeat):
+        """Measure the fastest of `repeat` runs, and the peak memory of a separate run.
+
+        :param content: (bytes) Encoded JSON of an Array, decoded anew for every run.
+        :param repeat: (int) Number of timed runs.
+        :return: dict with `time` in seconds and `peak` in bytes.
+        """
+        best = None
+        for _ in range(repeat):
+            arg = self.setup(json.loads(content.decode('utf-8')))
+            start = timeit.default_timer()
+            self.run(arg)
+            duration = timeit.default_timer() - start
+            best = duration if best is None else min(best, duration)
+
+        arg = self.setup(json.loads(content.decode('utf-8')))
+        tracemalloc.start()
+        result = self.run(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+
+        return {'time': best, 'peak': peak}
+
+
+def create_cases(entry_class):
+    """Create all benchmarks of the suite.
+
+    :param entry_class: Custom :class:`.Entry` subclass for the `synthetic` Content Type.
+    :return: list of :class:`.Case` instances.
+    """
+    plain = ResourceFactory([])
+    custom = ResourceFactory([entry_class])
+
+    def create_entries(factory):
+        return lambda items: [factory.create_entry(item) for item in items]
+
+    return [
+        Case('from_json', lambda payload: payload, plain.from_json),
+        Case('from_json custom', lambda payload: payload, custom.from_json),
+        Case('create_entry', lambda payload: payload['items'], create_entries(plain)),
+        Case('create_entry custom', lambda payload: payload['items'], create_entries(custom)),
+        Case('resolve_links', custom.from_json, lambda array: array.resolve_links())
+    ]
+
+
+def run(sizes, fields, link_density, include_depth, locales, repeat):
+    """Run all benchmarks, printing results as they become available.
+
+    :return: dict of results mapped by benchmark name and size (as str).
+    """
+    cases = create_cases(payloads.synthetic_entry_class(fields, link_density, localized=bool(locales)))
+    results = {}
+
+    print('{0:<22} {1:>6} {2:>12} {3:>12} {4:>12}'.format('benchmark', 'size', 'time (ms)', 'us/entry', 'peak (KiB)'))
+    for size in sizes:
+        payload = payloads.synthetic_array(size, fields, link_density, include_depth, locales)
+        content = json.dumps(payload).encode('utf-8')
+
+        for case in cases:
+            result = case.measure(content, repeat)
+            results.setdefault(case.name, {})[str(size)] = result
+            print('{0:<22} {1:>6} {2:>12.2f} {3:>12.2f} {4:>12.1f}'.format(
+                case.name, size, result['time'] * 1000, result['time'] * 1e6 / size, result['peak'] / 1024.0))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Compare results with a baseline.
+
+    :param results: (dict) Results as returned by :func:`run`.
+    :param baseline: (dict) Previous results.
+    :param threshold: (float) Tolerated relative increase of time and peak memory.
+    :return: list of descriptions of regressions.
+    """
+    regressions = []
+    for name, sizes in sorted(results.items()):
+        for size, result in sorted(sizes.items(), key=lambda item: int(item[0])):
+            previous = baseline.get(name, {}).get(size)
+            if previous is None:
+                continue
+
+            for metric in ('time', 'peak'):
+                if previous[metric] and result[metric] > previous[metric] * (1 + threshold):
+                    regressions.append('{0} ({1} entries): {2} {3:+.1f} %'.format(
+                        name, size, metric, 100.0 * (result[metric] / previous[metric] - 1)))
+
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Benchmark deserialization and link resolution.')
+    arg_parser.add_argument('--sizes', default='10,100,1000,10000', help='Comma separated numbers of entries.')
+    arg_parser.add_argument('--fields', type=int, default=10, help='Number of fields per entry.')
+    arg_parser.add_argument('--link-density', type=float, default=0.2, help='Share of fields linking to entries.')
+    arg_parser.add_argument('--include-depth', type=int, default=1, help='Number of levels of included entries.')
+    arg_parser.add_argument('--locales', default=None, help='Comma separated locales of localized field values.')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs per benchmark.')
+    arg_parser.add_argument('--save', default=None, help='Save results as JSON to the given file.')
+    arg_parser.add_argument('--compare', default=None, help='Compare results with a file saved previously.')
+    arg_parser.add_argument('--threshold', type=float, default=0.25, help='Tolerated relative regression.')
+    args = arg_parser.parse_args(argv)
+
+    results = run([int(size) for size in args.sizes.split(',')], args.fields, args.link_density,
+                  args.include_depth, args.locales.split(',') if args.locales else None, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+        if regressions:
+            print('\nRegressions exceeding {0:.0f} %:'.format(args.threshold * 100))
+            for regression in regressions:
+                print('  ' + regression)
+            return 1
+        print('\nNo regressions exceeding {0:.0f} %.'.format(args.threshold * 100))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
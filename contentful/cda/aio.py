@@ -0,0 +1,566 @@
+"""asyncio client module (Python 3.7+).
+
+Asynchronous counterparts of the classes provided by the :mod:`.client` module, sharing
+their configuration, error handling and :class:`.ResourceFactory`.
+
+Classes provided include:
+
+- :class:`.AsyncClient` - Asynchronous interface for retrieving resources from the Contentful Delivery API.
+
+- :class:`.AsyncDispatcher` - Class responsible for asynchronously invoking :class:`.AsyncRequest` instances.
+
+- :class:`.AsyncRequest` - Asynchronous API request representation.
+
+- :class:`.AsyncRequestArray` - Asynchronous request whose response may contain multiple resources.
+
+- :class:`.AsyncTransport` - Interface for asynchronous HTTP transports.
+
+- :class:`.AiohttpTransport` - Transport based on `aiohttp` (optional dependency).
+
+- :class:`.TransportResponse` - Response returned by an :class:`.AsyncTransport`.
+
+- :class:`.TransportStream` - Response of an :class:`.AsyncTransport` whose body is read on demand.
+
+- :class:`.AiohttpTransportStream` - Response of an :class:`.AiohttpTransport` whose body is read on demand.
+"""
+from . import const
+from . import utils
+from .client import Client, Config, Dispatcher, Request, RequestArray
+from .resources import Array, SyncResult
+from .streaming import ArrayStreamParser
+from timeit import default_timer
+import asyncio
+import json
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class TransportResponse(object):
+    """Response returned by an :class:`.AsyncTransport`.
+
+    Mirrors the parts of :class:`requests.Response` used by the :class:`.Dispatcher`.
+
+    **Attributes**:
+
+    - status_code (int): HTTP status code.
+    - content (bytes): Raw response body.
+    - headers (dict): Response headers.
+    """
+    def __init__(self, status_code, content, headers=None):
+        """TransportResponse constructor.
+
+        :param status_code: (int) HTTP status code.
+        :param content: (bytes) Raw response body.
+        :param headers: (dict) Optional response headers.
+        :return: :class:`.TransportResponse` instance.
+        """
+        super(TransportResponse, self).__init__()
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class TransportStream(object):
+    """Response of an :class:`.AsyncTransport` whose body is read on demand, see :func:`.AsyncTransport.stream`.
+
+    This implementation serves the body of a :class:`.TransportResponse` which has already been
+    received completely, transports supporting incremental reads provide their own subclass.
+
+    **Attributes**:
+
+    - status_code (int): HTTP status code.
+    - headers (dict): Response headers.
+    """
+    def __init__(self, response):
+        """TransportStream constructor.
+
+        :param response: (:class:`.TransportResponse`) Response whose body has been received completely.
+        :return: :class:`.TransportStream` instance.
+        """
+        super(TransportStream, self).__init__()
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    async def iter_content(self, chunk_size):
+        """Read the response body.
+
+        :param chunk_size: (int) Maximum number of bytes per chunk.
+        :return: asynchronous generator of chunks (bytes).
+        """
+        content = self.response.content
+        for offset in range(0, len(content), chunk_size):
+            yield content[offset:offset + chunk_size]
+
+    async def read(self):
+        """Read the whole response body, e.g. for reporting an error.
+
+        :return: :class:`.TransportResponse` instance.
+        """
+        return self.response
+
+    async def close(self):
+        """Release the connection of this response."""
+
+
+class AsyncTransport(object):
+    """Interface for asynchronous HTTP transports used by the :class:`.AsyncDispatcher`."""
+
+    async def get(self, url, params=None, headers=None):
+        """Issue a GET request.
+
+        :param url: (str) URL.
+        :param params: (dict) Optional query parameters.
+        :param headers: (dict) Optional request headers.
+        :return: :class:`.TransportResponse` instance.
+        """
+        raise NotImplementedError()
+
+    async def stream(self, url, params=None, headers=None):
+        """Issue a GET request whose response body is read on demand.
+
+        By default the response is retrieved completely using :func:`get`.
+
+        :param url: (str) URL.
+        :param params: (dict) Optional query parameters.
+        :param headers: (dict) Optional request headers.
+        :return: :class:`.TransportStream` instance, to be closed by the caller.
+        """
+        return TransportStream(await self.get(url, params=params, headers=headers))
+
+    async def close(self):
+        """Release any resources held by this transport."""
+
+
+class AiohttpTransport(AsyncTransport):
+    """:class:`.AsyncTransport` implementation based on an `aiohttp` client session."""
+
+    def __init__(self, session=None, pool_size=None):
+        """AiohttpTransport constructor.
+
+        :param session: Optional `aiohttp.ClientSession`, created on first use by default.
+        :param pool_size: (int) Maximum number of connections of the session created by this transport.
+        :return: :class:`.AiohttpTransport` instance.
+        """
+        super(AiohttpTransport, self).__init__()
+        if aiohttp is None:
+            raise ImportError('AiohttpTransport requires the "aiohttp" package to be installed.')
+
+        self.session = session
+        self.owns_session = session is None
+        self.pool_size = pool_size or const.POOL_SIZE
+
+    async def get(self, url, params=None, headers=None):
+        async with self.request(url, params, headers) as r:
+            return TransportResponse(r.status, await r.read(), dict(r.headers))
+
+    async def stream(self, url, params=None, headers=None):
+        return AiohttpTransportStream(await self.request(url, params, headers))
+
+    def request(self, url, params=None, headers=None):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size)
+            self.session = aiohttp.ClientSession(connector=connector)
+
+        params = dict((k, str(v)) for k, v in (params or {}).items())
+        return self.session.get(url, params=params, headers=headers)
+
+    async def close(self):
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+
+
+class AiohttpTransportStream(TransportStream):
+    """:class:`.TransportStream` reading the body of an `aiohttp` response incrementally."""
+
+    def __init__(self, response):
+        """AiohttpTransportStream constructor.
+
+        :param response: `aiohttp.ClientResponse` instance, whose body has not been read yet.
+        :return: :class:`.AiohttpTransportStream` instance.
+        """
+        super(AiohttpTransportStream, self).__init__(TransportResponse(response.status, b'', dict(response.headers)))
+        self.raw = response
+
+    async def iter_content(self, chunk_size):
+        async for chunk in self.raw.content.iter_chunked(chunk_size):
+            yield chunk
+
+    async def read(self):
+        return TransportResponse(self.status_code, await self.raw.read(), self.headers)
+
+    async def close(self):
+        self.raw.release()
+
+
+class AsyncClient(Client):
+    """Asynchronous interface for retrieving resources from the Contentful Delivery API.
+
+    Provides the same interface as :class:`.Client`, all methods issuing network requests
+    return awaitables::
+
+        async with AsyncClient('space-id', 'access-token') as client:
+            array = await client.fetch(Entry).all()
+            async for entry in client.fetch(Entry).iter_all():
+                dosomething(entry)
+
+    **Attributes**:
+
+    - dispatcher (:class:`.AsyncDispatcher`): Dispatcher for invoking requests.
+    - config (:class:`.Config`): Configuration container.
+    """
+    def __init__(self, space_id, access_token, custom_entries=None, secure=True, endpoint=None, resolve_links=True,
+                 transport=None, pool_size=None, identity_map=None, retry_policy=None, json_decoder=None,
+                 observers=None):
+        """AsyncClient constructor.
+
+        :param space_id: (str) Space ID.
+        :param access_token: (str) Access Token.
+        :param custom_entries: (list) Optional list of :class:`.Entry` subclasses.
+        :param secure: (bool) Indicates whether the connection should be encrypted or not.
+        :param endpoint: (str) Custom remote API endpoint.
+        :param resolve_links: (bool) Indicates whether or not to resolve links automatically.
+        :param transport: Optional :class:`.AsyncTransport`, by default an :class:`.AiohttpTransport` is created.
+        :param pool_size: (int) Maximum number of connections kept open by the default transport.
+        :param identity_map: Optional :class:`.cache.IdentityMap`, see :class:`.Client`.
+        :param retry_policy: Optional :class:`.ratelimit.RetryPolicy`, see :class:`.Client`.
+        :param json_decoder: Optional :class:`.decoders.JSONDecoder`, see :class:`.Client`.
+        :param observers: (list) Optional :class:`.hooks.RequestObserver` instances, see :class:`.Client`.
+        :return: :class:`AsyncClient` instance.
+        """
+        config = Config(space_id, access_token, custom_entries, secure, endpoint, resolve_links, pool_size=pool_size,
+                        identity_map=identity_map, retry_policy=retry_policy, json_decoder=json_decoder,
+                        observers=observers)
+        self.config = config
+        self.validate_config(config)
+        self.dispatcher = AsyncDispatcher(config, transport)
+
+    async def close(self):
+        """Release the connections held by this client, see :func:`.AsyncDispatcher.close`."""
+        await self.dispatcher.close()
+
+    def __enter__(self):
+        raise TypeError('AsyncClient must be used with "async with".')
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def fetch(self, resource_class):
+        """Construct an :class:`.AsyncRequestArray` for the given resource type, see :func:`.Client.fetch`.
+
+        :param resource_class: The type of resource to be fetched.
+        :return: :class:`.AsyncRequestArray` instance.
+        """
+        remote_path, params = self.query_for_class(resource_class)
+        return AsyncRequestArray(self.dispatcher, remote_path, self.config.resolve_links, params=params)
+
+    async def fetch_space(self):
+        """Fetch the Space associated with this client.
+
+        :return: :class:`.Space` result instance.
+        """
+        return await AsyncRequest(self.dispatcher, '').invoke()
+
+    async def sync(self, sync_token=None, initial=False, params=None):
+        """Synchronize the content of the Space, see :func:`.Client.sync`.
+
+        :param sync_token: (str) Token of a previous synchronization.
+        :param initial: (bool) Indicates whether to perform an initial synchronization.
+        :param params: (dict) Optional query parameters for an initial synchronization.
+        :return: :class:`.SyncResult` instance.
+        """
+        request_params = self.sync_params(sync_token, initial, params)
+        result = SyncResult(initial)
+
+        while request_params is not None:
+            page = await AsyncRequest(self.dispatcher, const.PATH_SYNC, request_params).invoke()
+            request_params = result.add_page(page)
+
+        return result
+
+    async def resolve(self, link_resource_type, resource_id, array=None):
+        """Resolve a link to a CDA resource, see :func:`.Client.resolve`.
+
+        :param link_resource_type: (str) Resource type as str.
+        :param resource_id: (str) Remote ID of the linked resource.
+        :param array: (:class:`.Array`) Optional array resource.
+        :return: :class:`.Resource` subclass, `None` if it cannot be retrieved.
+        """
+        result = self.resolve_locally(link_resource_type, resource_id, array)
+
+        if result is None:
+            clz = utils.class_for_type(link_resource_type)
+            result = await self.fetch(clz).where({'sys.id': resource_id}).first()
+
+        return result
+
+    async def resolve_array_links(self, array, max_workers=None):
+        """Resolve all links of an :class:`.Array`, fetching the missing resources in batches.
+
+        See :func:`.Client.resolve_array_links`, the chunked `sys.id[in]` requests are issued
+        concurrently, with at most `max_workers` requests in flight.
+
+        :param array: (:class:`.Array`) array resource.
+        :param max_workers: (int) Optional maximum number of concurrent requests,
+            defaults to :data:`.const.MAX_WORKERS`.
+        :return: the given :class:`.Array` instance for convenience.
+        """
+        semaphore = asyncio.Semaphore(max_workers or const.MAX_WORKERS)
+
+        async def invoke(request):
+            async with semaphore:
+                return await request.invoke()
+
+        for result in await asyncio.gather(*[invoke(request) for request in self.unresolved_link_requests(array)]):
+            array.include(result)
+
+        array.resolve_links(self.dispatcher.identity_map)
+        return array
+
+
+class AsyncDispatcher(Dispatcher):
+    """Responsible for asynchronously invoking :class:`.AsyncRequest` instances.
+
+    **Attributes**:
+
+    - httpclient (:class:`.AsyncTransport`): HTTP transport.
+    """
+    def __init__(self, config, transport=None):
+        """AsyncDispatcher constructor.
+
+        :param config: Configuration container.
+        :param transport: Optional :class:`.AsyncTransport`, by default an :class:`.AiohttpTransport` is created.
+        :return: :class:`.AsyncDispatcher` instance.
+        """
+        super(AsyncDispatcher, self).__init__(config, transport or AiohttpTransport(pool_size=config.pool_size))
+        self.owns_httpclient = transport is None
+
+    async def invoke(self, request):
+        """Invoke the given :class:`.AsyncRequest` instance.
+
+        :param request: :class:`.AsyncRequest` instance to invoke.
+        :return: :class:`.Resource` subclass.
+        """
+        url = self.url_for(request)
+        event = self.start_event(request, url)
+        try:
+            result = self.process_response(await self.send_async(url, request.params, event), event)
+        except Exception as e:
+            self.finish_event(event, e)
+            raise
+
+        self.finish_event(event)
+        return result
+
+    async def invoke_stream(self, request, chunk_size=None):
+        """Invoke the given :class:`.AsyncRequest` instance, parsing the response body incrementally.
+
+        See :func:`.Dispatcher.invoke_stream`, the body is read using :func:`.AsyncTransport.stream`.
+
+        :param request: :class:`.AsyncRequest` instance to invoke.
+        :param chunk_size: (int) Optional number of bytes read at a time,
+            defaults to :data:`.const.STREAM_CHUNK_SIZE`.
+        :return: asynchronous generator of `(key, value)` events, see :class:`.streaming.ArrayStreamParser`.
+        """
+        url = self.url_for(request)
+        event = self.start_event(request, url)
+        error = None
+        try:
+            r = await self.send_async(url, request.params, event, stream=True)
+            try:
+                if not 200 <= r.status_code < 300:
+                    self.check_response(await r.read())
+
+                parser = ArrayStreamParser()
+                async for chunk in r.iter_content(chunk_size or const.STREAM_CHUNK_SIZE):
+                    if event is not None:
+                        event.response_bytes += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+
+                for item in parser.close():
+                    yield item
+            finally:
+                await r.close()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.finish_event(event, error)
+
+    async def send_async(self, url, params, event=None, stream=False):
+        """Issue a GET request, retried according to the retry policy, see :func:`.Dispatcher.send`.
+
+        :param url: (str) URL.
+        :param params: (dict) Query parameters.
+        :param event: Optional :class:`.hooks.RequestEvent` to record network measurements in,
+            the response size is only recorded if not streamed.
+        :param stream: (bool) Indicates whether the response body should be read on demand.
+        :return: :class:`.TransportResponse` of the last attempt, :class:`.TransportStream` if streamed.
+        """
+        start = default_timer()
+        attempt = 0
+        while True:
+            if stream:
+                r = await self.httpclient.stream(url, params=params, headers=self.get_headers())
+            else:
+                r = await self.httpclient.get(url, params=params, headers=self.get_headers())
+            if not self.retry_policy.should_retry(attempt, r):
+                self.record_response(event, r, start, attempt + 1, 0 if stream else None)
+                return r
+
+            if stream:
+                await r.close()
+            await asyncio.sleep(self.retry_policy.delay(attempt, r))
+            attempt += 1
+
+    async def close(self):
+        """Close the transport, in case it was created by this dispatcher."""
+        if self.owns_httpclient:
+            await self.httpclient.close()
+
+
+class AsyncRequest(Request):
+    """Represents a single request, later to be invoked by an :class:`.AsyncDispatcher`."""
+
+    async def invoke(self):
+        """Invoke :class:`.AsyncRequest` instance using the associated :class:`.AsyncDispatcher`.
+
+        :return: Result instance as returned by the :class:`.AsyncDispatcher`.
+        """
+        return await self.dispatcher.invoke(self)
+
+
+class AsyncRequestArray(AsyncRequest, RequestArray):
+    """Represents a single asynchronous request for retrieving multiple resources from the API."""
+
+    async def all(self):
+        """Attempt to retrieve all available resources matching this request.
+
+        :return: Result instance as returned by the :class:`.AsyncDispatcher`.
+        """
+        result = await self.invoke()
+        if self.resolve_links:
+            self.dispatcher.resolve_links(self, result)
+
+        return result
+
+    async def iter_pages(self, page_size=None, shared_includes=False):
+        """Lazily retrieve all resources matching this request, one page at a time.
+
+        See :func:`.RequestArray.iter_pages`.
+
+        :param page_size: (int) Optional number of resources per page.
+        :param shared_includes: (bool) Indicates whether to pool resources across pages.
+        :return: asynchronous generator of :class:`.Array` instances.
+        """
+        skip, limit = self.page_bounds(page_size)
+        resolver = self.link_resolver() if shared_includes else None
+
+        while True:
+            if resolver is None:
+                page = await self.page(skip, limit).all()
+            else:
+                page = self.resolve_shared(resolver, await self.page(skip, limit).invoke())
+
+            count = len(page.items)
+            total = page.total
+            yield page
+
+            page = None  # Release the consumed page before requesting the next one.
+            skip += count
+            if count == 0 or skip >= total:
+                break
+
+    async def iter_all(self, page_size=None, shared_includes=False):
+        """Lazily retrieve all resources matching this request.
+
+        :param page_size: (int) Optional number of resources per page.
+        :param shared_includes: (bool) Indicates whether to pool resources across pages.
+        :return: asynchronous generator of :class:`.Resource` subclass instances.
+        """
+        async for page in self.iter_pages(page_size, shared_includes):
+            for item in page.items:
+                yield item
+            del page
+
+    async def all_pages(self, page_size=None, max_workers=None):
+        """Retrieve all resources matching this request as a single :class:`.Array`.
+
+        See :func:`.RequestArray.all_pages`, remaining pages are retrieved concurrently,
+        with at most `max_workers` requests in flight.
+
+        :param page_size: (int) Optional number of resources per page.
+        :param max_workers: (int) Optional maximum number of concurrent requests,
+            defaults to :data:`.const.MAX_WORKERS`.
+        :return: :class:`.Array` instance containing all matching resources.
+        """
+        skip, limit = self.page_bounds(page_size)
+
+        first = await self.page(skip, limit).invoke()
+        limit = first.limit or limit    # The API may cap the requested limit
+        semaphore = asyncio.Semaphore(max_workers or const.MAX_WORKERS)
+
+        async def fetch_page(offset):
+            async with semaphore:
+                return await self.page(offset, limit).invoke()
+
+        pages = await asyncio.gather(*[fetch_page(offset) for offset in range(skip + limit, first.total, limit)])
+        result = self.merge_pages([first] + list(pages))
+        if self.resolve_links:
+            self.dispatcher.resolve_links(self, result)
+
+        return result
+
+    async def stream(self, chunk_size=None):
+        """Retrieve the resources matching this request, parsing the response incrementally.
+
+        See :func:`.RequestArray.stream`, links are resolved in place after the last resource has been yielded::
+
+            async for entry in client.fetch(Entry).where({'limit': 1000}).stream():
+                dosomething(entry)
+
+        :param chunk_size: (int) Optional number of bytes read at a time,
+            defaults to :data:`.const.STREAM_CHUNK_SIZE`.
+        :return: asynchronous generator of :class:`.Resource` subclass instances.
+        """
+        array = Array()
+        array.items_mapped = {'Asset': {}, 'Entry': {}}
+
+        async for key, value in self.dispatcher.invoke_stream(self, chunk_size):
+            if key == 'items':
+                resource = self.dispatcher.create_resource(value)
+                if self.resolve_links:
+                    array.map_resource(resource)
+                yield resource
+            elif key == 'includes' and self.resolve_links:
+                self.dispatcher.resource_factory.process_array_includes(array, {'includes': value})
+
+        if self.resolve_links:
+            if self.dispatcher.identity_map is not None:
+                self.dispatcher.identity_map.add_all(array)
+            self.dispatcher.resolve_links(self, array)
+
+    async def first(self):
+        """Attempt to retrieve only the first resource matching this request.
+
+        :return: Result instance, or `None` if there are no matching resources.
+        """
+        result = await self.where({'limit': 1}).all()
+        return result.items[0] if result.total > 0 else None
@@ -0,0 +1,410 @@
+"""cache module.
+
+Classes provided include:
+
+- :class:`.ResponseCache` - In-process cache of API responses with TTL and LRU eviction.
+
+- :class:`.IdentityMap` - Bounded map of previously seen resources, used for resolving links.
+
+- :class:`.RequestCoalescer` - Lets concurrent identical requests share a single in-flight call.
+"""
+from . import const
+from .resources import Array, ResourceType
+from collections import OrderedDict
+import threading
+import time
+
+
+class CacheEntry(object):
+    """Single value held by a :class:`.ResponseCache`.
+
+    **Attributes**:
+
+    - value: Cached value.
+    - size (int): Approximate size of the value in bytes.
+    - expires (float): Timestamp after which the value is no longer fresh, `None` if it never expires.
+    - etag (str): Value of the ``ETag`` response header.
+    - last_modified (str): Value of the ``Last-Modified`` response header.
+    """
+    def __init__(self, value, size, expires, etag=None, last_modified=None):
+        super(CacheEntry, self).__init__()
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now):
+        return self.expires is None or now < self.expires
+
+    def can_revalidate(self):
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self):
+        """Create the headers for revalidating this entry with a conditional request.
+
+        :return: dict containing header values.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """In-process cache of API responses, bounded in memory and evicting least recently used values first.
+
+    Responses are cached per URL and normalized query parameters. Depending on `store`,
+    either the decoded JSON is kept (and resources are created anew for every hit, so they
+    can be safely modified), or the created resources themselves (shared between all hits).
+
+    Once expired, responses carrying an ``ETag`` or ``Last-Modified`` header are kept until evicted,
+    so they can be revalidated with a conditional request instead of being downloaded again.
+
+    Example::
+
+        cache = ResponseCache(max_size=32 * 1024 * 1024, ttl=60, path_ttls={'content_types': 3600})
+        client = Client('space-id', 'access-token', cache=cache)
+
+    **Attributes**:
+
+    - max_size (int): Maximum total size in bytes of all cached responses.
+    - ttl (float): Default number of seconds cached responses are fresh, `None` to never expire.
+    - path_ttls (dict): TTLs overriding the default, mapped by remote path (e.g. `entries`).
+    - store (str): Either :data:`STORE_JSON` or :data:`STORE_RESOURCES`.
+    - size (int): Current total size in bytes of all cached responses.
+    - hits (int): Number of lookups answered from the cache.
+    - misses (int): Number of lookups not answered from the cache.
+    - evictions (int): Number of responses evicted in order to stay within `max_size`.
+    - revalidations (int): Number of expired responses revalidated as not modified.
+    """
+    STORE_JSON = 'json'
+    STORE_RESOURCES = 'resources'
+
+    def __init__(self, max_size=None, ttl=const.CACHE_TTL, path_ttls=None, store=STORE_JSON):
+        """ResponseCache constructor.
+
+        :param max_size: (int) Optional maximum total size in bytes, defaults to :data:`.const.CACHE_MAX_SIZE`.
+        :param ttl: (float) Default number of seconds cached responses are fresh, `None` to never expire.
+        :param path_ttls: (dict) Optional TTLs overriding the default, mapped by remote path.
+        :param store: (str) Either :data:`STORE_JSON` or :data:`STORE_RESOURCES`.
+        :return: :class:`.ResponseCache` instance.
+        """
+        super(ResponseCache, self).__init__()
+        if store not in (ResponseCache.STORE_JSON, ResponseCache.STORE_RESOURCES):
+            raise ValueError('Invalid cache store \"{0}\".'.format(store))
+
+        self.max_size = max_size or const.CACHE_MAX_SIZE
+        self.ttl = ttl
+        self.path_ttls = path_ttls or {}
+        self.store = store
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.lock = threading.Lock()
+
+    @property
+    def stores_json(self):
+        return self.store == ResponseCache.STORE_JSON
+
+    @staticmethod
+    def key_for(url, params):
+        """Create a cache key for the given URL and query parameters.
+
+        :param url: (str) URL.
+        :param params: (dict) Query parameters.
+        :return: hashable cache key.
+        """
+        return url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+    def ttl_for(self, remote_path):
+        """Determine the TTL for responses of the given remote path.
+
+        :param remote_path: (str) API path.
+        :return: TTL in seconds, `None` if responses never expire.
+        """
+        return self.path_ttls.get(remote_path, self.ttl)
+
+    def get(self, key):
+        """Retrieve a fresh value from the cache.
+
+        :param key: Cache key as created by :func:`key_for`.
+        :return: Cached value, `None` in case of a miss.
+        """
+        entry, fresh = self.lookup(key)
+        return entry.value if fresh else None
+
+    def lookup(self, key):
+        """Retrieve an entry from the cache, which may be expired but still revalidatable.
+
+        Only fresh entries count as hits. Expired entries which cannot be revalidated are removed.
+
+        :param key: Cache key as created by :func:`key_for`.
+        :return: tuple of the :class:`.CacheEntry` (`None` in case of a miss) and whether it is fresh.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            fresh = entry is not None and entry.is_fresh(time.time())
+            if entry is not None and not fresh and not entry.can_revalidate():
+                self._remove(key)
+                entry = None
+
+            if not fresh:
+                self.misses += 1
+                return entry, False
+
+            self.entries[key] = self.entries.pop(key)   # Mark as most recently used
+            self.hits += 1
+            return entry, True
+
+    def set(self, key, value, size, remote_path, etag=None, last_modified=None):
+        """Store a value in the cache, evicting least recently used values as required.
+
+        Values larger than `max_size` are not stored.
+
+        :param key: Cache key as created by :func:`key_for`.
+        :param value: Value to store.
+        :param size: (int) Approximate size of the value in bytes.
+        :param remote_path: (str) API path, used for determining the TTL.
+        :param etag: (str) Optional ``ETag`` of the response.
+        :param last_modified: (str) Optional ``Last-Modified`` value of the response.
+        """
+        ttl = self.ttl_for(remote_path)
+        if size > self.max_size or ttl == 0:
+            return
+
+        expires = None if ttl is None else time.time() + ttl
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            while self.entries and self.size + size > self.max_size:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+            self.entries[key] = CacheEntry(value, size, expires, etag, last_modified)
+            self.size += size
+
+    def revalidated(self, key, entry, remote_path):
+        """Mark an expired entry as fresh again, after the API responded it has not been modified.
+
+        :param key: Cache key as created by :func:`key_for`.
+        :param entry: :class:`.CacheEntry` as returned by :func:`lookup`.
+        :param remote_path: (str) API path, used for determining the TTL.
+        """
+        ttl = self.ttl_for(remote_path)
+        with self.lock:
+            entry.expires = None if ttl is None else time.time() + ttl
+            if self.entries.get(key) is entry:
+                self.entries[key] = self.entries.pop(key)   # Mark as most recently used
+            self.revalidations += 1
+
+    def clear(self):
+        """Remove all values from the cache."""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Retrieve the cache counters.
+
+        :return: dict with `hits`, `misses`, `evictions`, `revalidations`, `entries` and `size` values.
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'revalidations': self.revalidations, 'entries': len(self.entries), 'size': self.size}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.size -= entry.size
+
+
+class IdentityMap(object):
+    """Bounded map of previously seen Entries and Assets, evicting least recently used resources first.
+
+    Resources are kept by type, ID and revision, only the latest known revision of a resource
+    is retained. When provided to a :class:`.Client`, all retrieved resources are added, and links
+    are resolved from the map before issuing any network requests::
+
+        client = Client('space-id', 'access-token', identity_map=IdentityMap(max_size=10000))
+
+    **Attributes**:
+
+    - max_size (int): Maximum number of resources.
+    - hits (int): Number of lookups answered from the map.
+    - misses (int): Number of lookups not answered from the map.
+    """
+    def __init__(self, max_size=const.IDENTITY_MAP_SIZE):
+        """IdentityMap constructor.
+
+        :param max_size: (int) Maximum number of resources.
+        :return: :class:`.IdentityMap` instance.
+        """
+        super(IdentityMap, self).__init__()
+        self.max_size = max_size
+        self.resources = OrderedDict()
+        self.revisions = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def add(self, resource):
+        """Add an Entry or Asset, replacing any older revision of it.
+
+        Resources of other types, and older revisions of already known resources are ignored.
+
+        :param resource: :class:`.Resource` subclass.
+        """
+        resource_type = resource.sys.get('type')
+        if resource_type not in (ResourceType.Entry.value, ResourceType.Asset.value):
+            return
+
+        identity = (resource_type, resource.sys['id'])
+        revision = resource.sys.get('revision') or 0
+
+        with self.lock:
+            known = self.revisions.get(identity)
+            if known is not None:
+                if known > revision:
+                    return
+                del self.resources[identity + (known,)]
+
+            self.resources[identity + (revision,)] = resource
+            self.revisions[identity] = revision
+
+            while len(self.resources) > self.max_size:
+                key, _ = self.resources.popitem(last=False)
+                del self.revisions[key[:2]]
+
+    def add_all(self, result):
+        """Add all Entries and Assets of a result, including resources included by an :class:`.Array`.
+
+        :param result: :class:`.Resource` subclass as returned by the :class:`.ResourceFactory`.
+        """
+        if isinstance(result, Array):
+            for resources in result.items_mapped.values():
+                for resource in resources.values():
+                    self.add(resource)
+        else:
+            self.add(result)
+
+    def get(self, resource_type, resource_id):
+        """Retrieve the latest known revision of a resource.
+
+        :param resource_type: (str) Resource type as str.
+        :param resource_id: (str) Resource ID.
+        :return: :class:`.Resource` subclass, `None` if not known.
+        """
+        identity = (resource_type, resource_id)
+        with self.lock:
+            revision = self.revisions.get(identity)
+            if revision is None:
+                self.misses += 1
+                return None
+
+            key = identity + (revision,)
+            resource = self.resources[key] = self.resources.pop(key)   # Mark as most recently used
+            self.hits += 1
+            return resource
+
+    def clear(self):
+        """Remove all resources from the map."""
+        with self.lock:
+            self.resources.clear()
+            self.revisions.clear()
+
+    def __len__(self):
+        return len(self.resources)
+
+
+class InFlightCall(object):
+    """Call in progress within a :class:`.RequestCoalescer`, shared by all identical concurrent calls.
+
+    **Attributes**:
+
+    - result: Return value of the call, once done.
+    - error (Exception): Exception raised by the call, if any.
+    - done (:class:`threading.Event`): Set once the call has completed.
+    """
+    def __init__(self):
+        super(InFlightCall, self).__init__()
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class RequestCoalescer(object):
+    """Lets concurrent identical requests share a single in-flight call (single-flight).
+
+    The first caller of a key (the leader) performs the call, callers of the same key arriving
+    while it is in flight (followers) wait for it and receive the same result, or the same
+    exception. Once the call has completed, the next caller of the key performs a new call.
+
+    **Attributes**:
+
+    - coalesced (int): Number of calls answered by sharing the call of another caller.
+    """
+    def __init__(self):
+        """RequestCoalescer constructor.
+
+        :return: :class:`.RequestCoalescer` instance.
+        """
+        super(RequestCoalescer, self).__init__()
+        self.calls = {}
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url, params, headers=None):
+        """Create a key identifying a request by URL, normalized query parameters and headers.
+
+        :param url: (str) URL.
+        :param params: (dict) Query parameters.
+        :param headers: (dict) Optional request headers.
+        :return: hashable key.
+        """
+        return ResponseCache.key_for(url, params) + (tuple(sorted((headers or {}).items())),)
+
+    def call(self, key, function):
+        """Invoke `function`, unless a call of the same key is already in flight.
+
+        :param key: Hashable key, e.g. as created by :func:`key_for`.
+        :param function: Function without arguments performing the call.
+        :return: tuple of the result and whether it was shared from another caller.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = InFlightCall()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def __len__(self):
+        return len(self.calls)
@@ -11,25 +11,45 @@ Classes provided include:
 - :class:`.Request` - API request representation.
 
 - :class:`.RequestArray` - Request whose response may contain multiple resources.
+
+- :class:`.SyncRequest` - Request for a single page of a synchronization.
 """
 from . import utils
 from . import const
+from .cache import RequestCoalescer
 from .errors import ErrorMapping, ApiError
+from .decoders import default_decoder
+from .hooks import RequestEvent
+from .ratelimit import RetryPolicy
 from .serialization import ResourceFactory
-from .resources import Entry
+from .resources import Array, Entry, LinkResolver, SyncResult
+from .sessions import create_session
+from .streaming import ArrayStreamParser
 from .version import __version__
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer
+import copy
+import time
 
 
 class Client(object):
     """Interface for retrieving resources from the Contentful Delivery API.
 
+    A single client can be shared by any number of threads: its configuration is not modified after
+    construction, requests are immutable (see :class:`.Request`), the pooled session, cache, identity
+    map, limiter and coalescer are safe to use concurrently, and the :class:`.ResourceFactory` holds
+    no state besides its configuration. Resources are not synchronized, those shared between threads
+    (e.g. through an identity map or a cache storing resources) should not be modified.
+
     **Attributes**:
 
     - dispatcher (:class:`.Dispatcher`): Dispatcher for invoking requests.
     - config (:class:`.Config`): Configuration container.
     """
-    def __init__(self, space_id, access_token, custom_entries=None, secure=True, endpoint=None, resolve_links=True):
+    def __init__(self, space_id, access_token, custom_entries=None, secure=True, endpoint=None, resolve_links=True,
+                 session=None, pool_size=None, keep_alive=True, cache=None, identity_map=None, retry_policy=None,
+                 limiter=None, lazy_fields=False, lazy_raw_fields=False, json_decoder=None, date_parser=None,
+                 observers=None, coalesce_requests=True):
         """Client constructor.
 
         :param space_id: (str) Space ID.
@@ -40,13 +60,51 @@ class Client(object):
         :param secure: (bool) Indicates whether the connection should be encrypted or not.
         :param endpoint: (str) Custom remote API endpoint.
         :param resolve_links: (bool) Indicates whether or not to resolve links automatically.
+        :param session: Optional :class:`requests.Session` to issue requests with, may be shared
+            across multiple clients, see :func:`.sessions.create_session`. By default the client
+            creates a session of its own.
+        :param pool_size: (int) Maximum number of connections kept open by the client's own session.
+        :param keep_alive: (bool) Indicates whether the client's own session keeps connections open.
+        :param cache: Optional :class:`.cache.ResponseCache` for caching responses, may be shared across clients.
+        :param identity_map: Optional :class:`.cache.IdentityMap` keeping all retrieved resources,
+            consulted when resolving links before issuing any network requests.
+        :param retry_policy: Optional :class:`.ratelimit.RetryPolicy`, by default rate limited
+            requests are retried once the rate limit resets.
+        :param limiter: Optional :class:`.ratelimit.AdaptiveConcurrencyLimiter` limiting the number
+            of concurrent requests of this client.
+        :param lazy_fields: (bool) Indicates whether field values of custom Entry subclasses are
+            converted on first access of the attribute, rather than when the Entry is created.
+        :param lazy_raw_fields: (bool) Indicates whether `raw_fields` of Entries are rebuilt on first
+            access, rather than copied when the Entry is created, saving memory if they are not used.
+        :param json_decoder: Optional :class:`.decoders.JSONDecoder` for decoding response bodies,
+            by default the fastest decoder available is used (see :func:`.decoders.default_decoder`).
+        :param date_parser: Optional :class:`.dates.DateParser` for values of `Date` fields,
+            e.g. with a memo for timestamps repeated across many Entries.
+        :param observers: (list) Optional :class:`.hooks.RequestObserver` instances notified about
+            the lifecycle and timings of all requests, e.g. a :class:`.hooks.HistogramCollector`.
+        :param coalesce_requests: (bool) Indicates whether identical requests issued concurrently by
+            several threads share a single HTTP request, see :class:`.cache.RequestCoalescer`.
         :return: :class:`Client` instance.
         """
         super(Client, self).__init__()
-        config = Config(space_id, access_token, custom_entries, secure, endpoint, resolve_links)
+        config = Config(space_id, access_token, custom_entries, secure, endpoint, resolve_links,
+                        pool_size=pool_size, keep_alive=keep_alive, cache=cache, identity_map=identity_map,
+                        retry_policy=retry_policy, limiter=limiter, lazy_fields=lazy_fields,
+                        lazy_raw_fields=lazy_raw_fields, json_decoder=json_decoder, date_parser=date_parser,
+                        observers=observers, coalesce_requests=coalesce_requests)
         self.config = config
         self.validate_config(config)
-        self.dispatcher = Dispatcher(config, requests)
+        self.dispatcher = Dispatcher(config, session)
+
+    def close(self):
+        """Release the connections held by this client, see :func:`.Dispatcher.close`."""
+        self.dispatcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @staticmethod
     def validate_config(config):
@@ -84,20 +142,29 @@ class Client(object):
         :param resource_class: The type of resource to be fetched.
         :return: :class:`.Request` instance.
         """
+        remote_path, params = self.query_for_class(resource_class)
+        return RequestArray(self.dispatcher, remote_path, self.config.resolve_links, params=params)
+
+    @staticmethod
+    def query_for_class(resource_class):
+        """Infer the API path and query parameters for fetching resources of the given type.
+
+        :param resource_class: The type of resource to be fetched.
+        :return: tuple of the remote path (str) and query parameters (dict or `None`).
+        """
         if issubclass(resource_class, Entry):
             params = None
             content_type = getattr(resource_class, '__content_type__', None)
             if content_type is not None:
                 params = {'content_type': resource_class.__content_type__}
-            return RequestArray(self.dispatcher, utils.path_for_class(resource_class), self.config.resolve_links,
-                                params=params)
+            return utils.path_for_class(resource_class), params
 
         else:
             remote_path = utils.path_for_class(resource_class)
             if remote_path is None:
                 raise Exception('Invalid resource type \"{0}\".'.format(resource_class))
 
-            return RequestArray(self.dispatcher, remote_path, self.config.resolve_links)
+            return remote_path, None
 
     def fetch_space(self):
         """Fetch the Space associated with this client.
@@ -106,24 +173,62 @@ class Client(object):
         """
         return Request(self.dispatcher, '').invoke()
 
+    def sync(self, sync_token=None, initial=False, params=None):
+        """Synchronize the content of the Space, following all pages of the response.
+
+        Either perform an initial synchronization, retrieving all published Entries and Assets,
+        or provide the `sync_token` of a previous synchronization in order to retrieve only
+        the changes since then (including deletions)::
+
+            result = client.sync(initial=True)
+            ...
+            result = client.sync(result.sync_token)
+
+        :param sync_token: (str) Token of a previous synchronization, see :attr:`.SyncResult.sync_token`.
+        :param initial: (bool) Indicates whether to perform an initial synchronization.
+        :param params: (dict) Optional query parameters for an initial synchronization, e.g. `type`.
+        :return: :class:`.SyncResult` instance.
+        """
+        request_params = self.sync_params(sync_token, initial, params)
+        result = SyncResult(initial)
+
+        while request_params is not None:
+            page = SyncRequest(self.dispatcher, const.PATH_SYNC, request_params).invoke()
+            request_params = result.add_page(page)
+
+        return result
+
+    @staticmethod
+    def sync_params(sync_token=None, initial=False, params=None):
+        """Create the query parameters for the first page of a synchronization.
+
+        :param sync_token: (str) Token of a previous synchronization.
+        :param initial: (bool) Indicates whether to perform an initial synchronization.
+        :param params: (dict) Optional query parameters for an initial synchronization.
+        :return: dict of query parameters.
+        """
+        if initial:
+            return dict(params or {}, initial='true')
+        elif sync_token is not None:
+            return {'sync_token': sync_token}
+
+        raise Exception('Either \"initial\" or a \"sync_token\" must be provided.')
+
     def resolve(self, link_resource_type, resource_id, array=None):
         """Resolve a link to a CDA resource.
 
         Provided an `array` argument, attempt to retrieve the resource from the `mapped_items`
-        section of that array (containing both included and regular resources), in case the
-        resource cannot be found in the array (or if no `array` was provided) - attempt to fetch
-        the resource from the API by issuing a network request.
+        section of that array (containing both included and regular resources), otherwise
+        attempt to retrieve it from the identity map of the client (if configured). In case the
+        resource cannot be found locally - attempt to fetch the resource from the API by issuing
+        a network request.
 
         :param link_resource_type: (str) Resource type as str.
         :param resource_id: (str) Remote ID of the linked resource.
         :param array: (:class:`.Array`) Optional array resource.
         :return: :class:`.Resource` subclass, `None` if it cannot be retrieved.
         """
-        result = None
-
-        if array is not None:
-            container = array.items_mapped.get(link_resource_type)
-            result = container.get(resource_id)
+        result = self.resolve_locally(link_resource_type, resource_id, array)
 
         if result is None:
             clz = utils.class_for_type(link_resource_type)
@@ -131,6 +236,66 @@ class Client(object):
 
         return result
 
+    def resolve_array_links(self, array, max_workers=None):
+        """Resolve all links of an :class:`.Array`, fetching the missing resources in batches.
+
+        Links which cannot be resolved from within the array are grouped by link type, and
+        the linked resources are retrieved using `sys.id[in]` queries, chunked in order to stay
+        within URL length limits (see :func:`.utils.chunk_ids`). Retrieved resources are added to
+        the `items_mapped` of the array, and the links are then replaced by the actual resources.
+
+        :param array: (:class:`.Array`) array resource.
+        :param max_workers: (int) Optional maximum number of concurrent requests,
+            see :func:`.Dispatcher.max_workers`.
+        :return: the given :class:`.Array` instance for convenience.
+        """
+        requests = self.unresolved_link_requests(array)
+
+        if requests:
+            workers = min(self.dispatcher.max_workers(max_workers), len(requests))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(lambda request: request.invoke(), requests):
+                    array.include(result)
+
+        array.resolve_links(self.dispatcher.identity_map)
+        return array
+
+    def unresolved_link_requests(self, array):
+        """Construct requests retrieving the resources of all links of an :class:`.Array` not resolvable locally.
+
+        :param array: (:class:`.Array`) array resource.
+        :return: list of :class:`.RequestArray` instances, using chunked `sys.id[in]` queries.
+        """
+        ids = {}
+        for link_type, resource_id in array.unresolved_links(self.dispatcher.identity_map):
+            ids.setdefault(link_type, []).append(resource_id)
+
+        requests = []
+        for link_type, resource_ids in ids.items():
+            clz = utils.class_for_type(link_type)
+            for chunk in utils.chunk_ids(sorted(resource_ids)):
+                requests.append(self.fetch(clz).where({'sys.id[in]': ','.join(chunk), 'limit': len(chunk)}))
+
+        return requests
+
+    def resolve_locally(self, link_resource_type, resource_id, array=None):
+        """Attempt to resolve a link to a CDA resource without issuing any network requests.
+
+        :param link_resource_type: (str) Resource type as str.
+        :param resource_id: (str) Remote ID of the linked resource.
+        :param array: (:class:`.Array`) Optional array resource.
+        :return: :class:`.Resource` subclass, `None` if it cannot be found.
+        """
+        result = None
+        if array is not None:
+            result = array.items_mapped.get(link_resource_type).get(resource_id)
+
+        identity_map = self.dispatcher.identity_map
+        if result is None and identity_map is not None:
+            result = identity_map.get(link_resource_type, resource_id)
+
+        return result
+
     def resolve_resource_link(self, resource_link, array=None):
         """Convenience method for resolving links given a :class:`.resources.ResourceLink` object.
 
@@ -157,7 +322,10 @@ class Client(object):
 
 class Config(object):
     """Configuration container for :class:`.Client` objects."""
-    def __init__(self, space_id, access_token, custom_entries, secure, endpoint, resolve_links):
+    def __init__(self, space_id, access_token, custom_entries, secure, endpoint, resolve_links,
+                 pool_size=None, keep_alive=True, cache=None, identity_map=None, retry_policy=None, limiter=None,
+                 lazy_fields=False, lazy_raw_fields=False, json_decoder=None, date_parser=None, observers=None,
+                 coalesce_requests=True):
         """Config constructor.
 
         :param space_id: (str) Space ID.
@@ -168,6 +336,18 @@ class Config(object):
         :param secure: (bool) Indicates whether the connection should be encrypted or not.
         :param endpoint: (str) Custom remote API endpoint.
         :param resolve_links: (bool) Indicates whether or not to resolve links automatically.
+        :param pool_size: (int) Maximum number of connections kept open per host.
+        :param keep_alive: (bool) Indicates whether connections should be kept open between requests.
+        :param cache: Optional :class:`.cache.ResponseCache` instance.
+        :param identity_map: Optional :class:`.cache.IdentityMap` instance.
+        :param retry_policy: Optional :class:`.ratelimit.RetryPolicy` instance.
+        :param limiter: Optional :class:`.ratelimit.AdaptiveConcurrencyLimiter` instance.
+        :param lazy_fields: (bool) Indicates whether to convert field values on first access.
+        :param lazy_raw_fields: (bool) Indicates whether to rebuild `raw_fields` on first access.
+        :param json_decoder: Optional :class:`.decoders.JSONDecoder` instance.
+        :param date_parser: Optional :class:`.dates.DateParser` instance.
+        :param observers: (list) Optional :class:`.hooks.RequestObserver` instances.
+        :param coalesce_requests: (bool) Indicates whether concurrent identical requests share a single HTTP request.
         :return: Config instance.
         """
         super(Config, self).__init__()
@@ -177,6 +357,18 @@ class Config(object):
         self.secure = secure
         self.endpoint = endpoint or const.CDA_ADDRESS
         self.resolve_links = resolve_links
+        self.pool_size = pool_size or const.POOL_SIZE
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.identity_map = identity_map
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter = limiter
+        self.lazy_fields = lazy_fields
+        self.lazy_raw_fields = lazy_raw_fields
+        self.json_decoder = json_decoder or default_decoder()
+        self.date_parser = date_parser
+        self.observers = list(observers or [])
+        self.coalesce_requests = coalesce_requests
 
 
 class Dispatcher(object):
@@ -186,21 +378,38 @@ class Dispatcher(object):
 
     - config (:class:`.Config`): Configuration settings.
     - resource_factory (:class:`.ResourceFactory`): Factory to use for generating resources out of JSON responses.
-    - httpclient (module): HTTP client module.
+    - httpclient: HTTP client, a :class:`requests.Session` or any object providing a compatible `get()` method.
     - base_url (str): Base URL of the remote endpoint.
     - user_agent (str): ``User-Agent`` header to pass with requests.
+    - cache (:class:`.cache.ResponseCache`): Optional response cache.
+    - identity_map (:class:`.cache.IdentityMap`): Optional identity map, all created resources are added to it.
+    - retry_policy (:class:`.ratelimit.RetryPolicy`): Policy for retrying rate limited requests.
+    - limiter (:class:`.ratelimit.AdaptiveConcurrencyLimiter`): Optional limiter of concurrent requests.
+    - json_decoder (:class:`.decoders.JSONDecoder`): Decoder for response bodies.
+    - observers (list): :class:`.hooks.RequestObserver` instances notified about all requests.
+    - coalescer (:class:`.cache.RequestCoalescer`): Optional coalescer of concurrent identical requests.
     """
-    def __init__(self, config, httpclient):
+    def __init__(self, config, httpclient=None):
         """Dispatcher constructor.
 
         :param config: Configuration container.
-        :param httpclient: HTTP client.
+        :param httpclient: Optional HTTP client, by default a pooled session is created
+            according to the `pool_size` and `keep_alive` configuration.
         :return: :class:`.Dispatcher` instance.
         """
         super(Dispatcher, self).__init__()
         self.config = config
-        self.resource_factory = ResourceFactory(config.custom_entries)
-        self.httpclient = httpclient
+        self.resource_factory = ResourceFactory(config.custom_entries, config.lazy_fields, config.lazy_raw_fields,
+                                                config.date_parser)
+        self.owns_httpclient = httpclient is None
+        self.httpclient = httpclient or create_session(config.pool_size, config.keep_alive)
+        self.cache = config.cache
+        self.identity_map = config.identity_map
+        self.retry_policy = config.retry_policy
+        self.limiter = config.limiter
+        self.json_decoder = config.json_decoder
+        self.observers = config.observers
+        self.coalescer = RequestCoalescer() if config.coalesce_requests else None
         self.user_agent = 'contentful.py/{0}'.format(__version__)
 
         scheme = 'https' if config.secure else 'http'
@@ -212,16 +421,315 @@ class Dispatcher(object):
         :param request: :class:`.Request` instance to invoke.
         :return: :class:`.Resource` subclass.
         """
-        url = '{0}/{1}'.format(self.base_url, request.remote_path)
-        r = self.httpclient.get(url, params=request.params, headers=self.get_headers())
-        if 200 <= r.status_code < 300:
-            return self.resource_factory.from_json(r.json())
+        url = self.url_for(request)
+        event = self.start_event(request, url)
+        try:
+            result = self.execute(request, url, event)
+        except Exception as e:
+            self.finish_event(event, e)
+            raise
+
+        self.finish_event(event)
+        return result
+
+    def execute(self, request, url, event=None):
+        """Retrieve the result of a :class:`.Request`, either from the cache or by issuing an HTTP request.
+
+        :param request: :class:`.Request` instance.
+        :param url: (str) URL of the request.
+        :param event: Optional :class:`.hooks.RequestEvent` to record measurements in.
+        :return: :class:`.Resource` subclass.
+        """
+        if self.cache is None or not request.cacheable:
+            r = self.send(url, request.params, self.get_headers(), event=event)
+            return self.process_response(r, event)
+
+        key = self.cache.key_for(url, request.params)
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return self.load_cached(entry.value, event)
+
+        headers = self.get_headers()
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+
+        r = self.send(url, request.params, headers, event=event)
+        if r.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, entry, request.remote_path)
+            return self.load_cached(entry.value, event)
+
+        self.check_response(r)
+        json = self.decode(r, event)
+        if self.cache.stores_json:
+            value = copy.deepcopy(json)
+            result = self.create_resource(json, event)
+        else:
+            value = result = self.create_resource(json, event)
+
+        self.cache.set(key, value, len(r.content), request.remote_path,
+                       etag=r.headers.get('ETag'), last_modified=r.headers.get('Last-Modified'))
+        return result
+
+    def load_cached(self, value, event=None):
+        """Create a resource out of a value held by the cache.
+
+        :param value: Cached JSON dict or resource.
+        :param event: Optional :class:`.hooks.RequestEvent` to record measurements in.
+        :return: :class:`.Resource` subclass.
+        """
+        if event is not None:
+            event.cached = True
+
+        if self.cache.stores_json:
+            return self.create_resource(copy.deepcopy(value), event)
+
+        if self.identity_map is not None:
+            self.identity_map.add_all(value)
+        return value
+
+    def create_resource(self, json, event=None):
+        """Create a resource out of JSON data, adding it to the identity map (if configured).
+
+        :param json: JSON dict.
+        :param event: Optional :class:`.hooks.RequestEvent` to record the build time in.
+        :return: :class:`.Resource` subclass.
+        """
+        start = default_timer()
+        result = self.resource_factory.from_json(json)
+        if self.identity_map is not None:
+            self.identity_map.add_all(result)
+
+        if event is not None:
+            event.build_time = default_timer() - start
+        return result
+
+    def resolve_links(self, request, array, resolver=None):
+        """Resolve the links of an :class:`.Array` locally, reporting the time spent to the observers.
+
+        :param request: :class:`.Request` instance which retrieved the array.
+        :param array: :class:`.Array` instance.
+        :param resolver: Optional :class:`.LinkResolver`, by default links are resolved
+            using the array itself and the identity map (if configured).
+        """
+        start = default_timer()
+        if resolver is None:
+            array.resolve_links(self.identity_map)
         else:
+            resolver.resolve(array.items)
+
+        if self.observers:
+            event = RequestEvent(request.remote_path, dict(request.params), self.url_for(request))
+            event.resolve_time = default_timer() - start
+            for observer in self.observers:
+                observer.links_resolved(event)
+
+    def start_event(self, request, url):
+        """Create a :class:`.hooks.RequestEvent` for a request and notify the observers it started.
+
+        :param request: :class:`.Request` instance.
+        :param url: (str) URL of the request.
+        :return: :class:`.hooks.RequestEvent` instance, `None` if there are no observers.
+        """
+        if not self.observers:
+            return None
+
+        event = RequestEvent(request.remote_path, dict(request.params), url)
+        for observer in self.observers:
+            observer.request_started(event)
+        return event
+
+    def finish_event(self, event, error=None):
+        """Notify the observers a request has finished.
+
+        :param event: :class:`.hooks.RequestEvent` as returned by :func:`start_event`, may be `None`.
+        :param error: Optional exception raised by the request.
+        """
+        if event is None:
+            return
+
+        event.total_time = default_timer() - event.started
+        event.error = error
+        for observer in self.observers:
+            observer.request_finished(event)
+
+    @staticmethod
+    def record_response(event, r, start, attempts, response_bytes=None):
+        """Record the network measurements of a request.
+
+        :param event: :class:`.hooks.RequestEvent` instance, may be `None`.
+        :param r: Response object of the last attempt.
+        :param start: (float) Timer value before the first attempt.
+        :param attempts: (int) Number of attempts.
+        :param response_bytes: (int) Size of the response body, by default the length of its content.
+        """
+        if event is None:
+            return
+
+        event.network_time = default_timer() - start
+        event.attempts = attempts
+        event.status_code = r.status_code
+        event.response_bytes = len(r.content) if response_bytes is None else response_bytes
+
+    def invoke_stream(self, request, chunk_size=None):
+        """Invoke the given :class:`.Request` instance, parsing the response body incrementally.
+
+        The response is neither cached nor turned into resources, see :func:`.RequestArray.stream`.
+
+        :param request: :class:`.Request` instance to invoke.
+        :param chunk_size: (int) Optional number of bytes read at a time,
+            defaults to :data:`.const.STREAM_CHUNK_SIZE`.
+        :return: generator of `(key, value)` events, see :class:`.streaming.ArrayStreamParser`.
+        """
+        url = self.url_for(request)
+        event = self.start_event(request, url)
+        error = None
+        try:
+            r = self.send(url, request.params, self.get_headers(), stream=True, event=event)
+            try:
+                self.check_response(r)
+                parser = ArrayStreamParser()
+                for chunk in r.iter_content(chunk_size or const.STREAM_CHUNK_SIZE):
+                    if event is not None:
+                        event.response_bytes += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+
+                for item in parser.close():
+                    yield item
+            finally:
+                r.close()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.finish_event(event, error)
+
+    def send(self, url, params, headers, stream=False, event=None):
+        """Issue a GET request, sharing the response with identical requests of other threads in flight.
+
+        Unless disabled, concurrent identical requests (same URL, query parameters and headers)
+        are coalesced into a single HTTP request (see :class:`.cache.RequestCoalescer`), all callers
+        receive the same response object. As its body has already been read, every caller still
+        decodes it and creates resources of its own. Streamed requests are never coalesced.
+
+        :param url: (str) URL.
+        :param params: (dict) Query parameters.
+        :param headers: (dict) Request headers.
+        :param stream: (bool) Indicates whether the response body should be read on demand.
+        :param event: Optional :class:`.hooks.RequestEvent` to record network measurements in.
+        :return: Response object.
+        """
+        if stream or self.coalescer is None:
+            return self.send_with_retries(url, params, headers, stream, event)
+
+        start = default_timer()
+        key = self.coalescer.key_for(url, params, headers)
+        r, shared = self.coalescer.call(key, lambda: self.send_with_retries(url, params, headers, event=event))
+        if shared and event is not None:
+            self.record_response(event, r, start, 0)
+            event.coalesced = True
+        return r
+
+    def send_with_retries(self, url, params, headers, stream=False, event=None):
+        """Issue a GET request, subject to the limiter and retried according to the retry policy.
+
+        :param url: (str) URL.
+        :param params: (dict) Query parameters.
+        :param headers: (dict) Request headers.
+        :param stream: (bool) Indicates whether the response body should be read on demand.
+        :param event: Optional :class:`.hooks.RequestEvent` to record network measurements in,
+            the response size is only recorded if not streamed.
+        :return: Response object of the last attempt.
+        """
+        kwargs = {'stream': True} if stream else {}
+        start = default_timer()
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+
+            throttled = None
+            try:
+                r = self.httpclient.get(url, params=params, headers=headers, **kwargs)
+                throttled = r.status_code == 429
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(throttled)
+
+            if not self.retry_policy.should_retry(attempt, r):
+                self.record_response(event, r, start, attempt + 1, 0 if stream else None)
+                return r
+
+            if stream:
+                r.close()
+            time.sleep(self.retry_policy.delay(attempt, r))
+            attempt += 1
+
+    def max_workers(self, max_workers=None):
+        """Determine the number of threads for retrieving resources concurrently.
+
+        :param max_workers: (int) Optional explicit number of threads.
+        :return: `max_workers` if provided, otherwise the `maximum` of the limiter if
+            configured, or :data:`.const.MAX_WORKERS`.
+        """
+        if max_workers:
+            return max_workers
+        elif self.limiter is not None:
+            return self.limiter.maximum
+
+        return const.MAX_WORKERS
+
+    def url_for(self, request):
+        """Create the full URL for the given :class:`.Request` instance.
+
+        :param request: :class:`.Request` instance.
+        :return: URL as str.
+        """
+        return '{0}/{1}'.format(self.base_url, request.remote_path)
+
+    def process_response(self, r, event=None):
+        """Create a resource out of a response, or raise an :class:`.ApiError` for unsuccessful responses.
+
+        :param r: Response object.
+        :param event: Optional :class:`.hooks.RequestEvent` to record measurements in.
+        :return: :class:`.Resource` subclass.
+        """
+        self.check_response(r)
+        return self.create_resource(self.decode(r, event), event)
+
+    def decode(self, r, event=None):
+        """Decode the raw body of a response using the configured :class:`.decoders.JSONDecoder`.
+
+        :param r: Response object.
+        :param event: Optional :class:`.hooks.RequestEvent` to record the decode time in.
+        :return: Decoded JSON data.
+        """
+        start = default_timer()
+        result = self.json_decoder.decode(r.content)
+        if event is not None:
+            event.decode_time = default_timer() - start
+        return result
+
+    @staticmethod
+    def check_response(r):
+        """Raise an :class:`.ApiError` in case the given response is not successful.
+
+        :param r: Response object.
+        """
+        if not 200 <= r.status_code < 300:
             if r.status_code in ErrorMapping.mapping:
                 raise ErrorMapping.mapping[r.status_code](r)
             else:
                 raise ApiError(r)
 
+    def close(self):
+        """Close the HTTP client, in case it was created by this dispatcher.
+
+        Sessions provided explicitly are left open, as they may be shared with other clients.
+        """
+        if self.owns_httpclient:
+            self.httpclient.close()
+
     def get_headers(self):
         """Create and return a base set of headers to be carried with all requests.
 
@@ -231,7 +739,17 @@ class Dispatcher(object):
 
 
 class Request(object):
-    """Represents a single request, later to be invoked by a :class:`.Dispatcher`."""
+    """Represents a single request, later to be invoked by a :class:`.Dispatcher`.
+
+    Requests are immutable once created, methods refining a request return a new one, so
+    a request may be invoked, refined and shared by multiple threads.
+
+    **Attributes**:
+
+    - cacheable (bool): Indicates whether responses to this request may be cached.
+    """
+    cacheable = True
+
     def __init__(self, dispatcher, remote_path, params=None):
         """Request constructor.
 
@@ -243,7 +761,7 @@ class Request(object):
         super(Request, self).__init__()
         self.dispatcher = dispatcher
         self.remote_path = remote_path
-        self.params = params or {}
+        self.params = dict(params or {})
 
     def invoke(self):
         """Invoke :class:`.Request` instance using the associated :class:`.Dispatcher`.
@@ -267,24 +785,211 @@ class RequestArray(Request):
         """
         result = self.invoke()
         if self.resolve_links:
-            result.resolve_links()
+            self.dispatcher.resolve_links(self, result)
 
         return result
 
+    def iter_pages(self, page_size=None, shared_includes=False):
+        """Lazily retrieve all resources matching this request, one page at a time.
+
+        Pages are requested using the `skip` and `limit` query parameters, until the `total`
+        reported by the API is reached. Each page is only requested once the previous one has
+        been consumed, and no reference to it is kept afterwards.
+
+        By default links are resolved per page. With `shared_includes`, the resources of all pages
+        are pooled by a :class:`.LinkResolver` instead, so links are also resolved using resources
+        of previous pages, transitively up to the `include` depth of this request, and resources
+        appearing on several pages are shared.
+
+        :param page_size: (int) Optional number of resources per page, defaults to
+            the `limit` parameter of this request or :data:`.const.MAX_PAGE_SIZE`.
+        :param shared_includes: (bool) Indicates whether to pool resources across pages.
+        :return: generator of :class:`.Array` instances.
+        """
+        skip, limit = self.page_bounds(page_size)
+        resolver = self.link_resolver() if shared_includes else None
+
+        while True:
+            if resolver is None:
+                page = self.page(skip, limit).all()
+            else:
+                page = self.resolve_shared(resolver, self.page(skip, limit).invoke())
+
+            count = len(page.items)
+            total = page.total
+            yield page
+
+            page = None  # Release the consumed page before requesting the next one.
+            skip += count
+            if count == 0 or skip >= total:
+                break
+
+    def iter_all(self, page_size=None, shared_includes=False):
+        """Lazily retrieve all resources matching this request.
+
+        Example::
+
+            for entry in client.fetch(Entry).iter_all(page_size=1000):
+                dosomething(entry)
+
+        Links are resolved per page, unless `shared_includes` is set, see :func:`.iter_pages`.
+
+        :param page_size: (int) Optional number of resources per page.
+        :param shared_includes: (bool) Indicates whether to pool resources across pages.
+        :return: generator of :class:`.Resource` subclass instances.
+        """
+        for page in self.iter_pages(page_size, shared_includes):
+            for item in page.items:
+                yield item
+            del page
+
+    def all_pages(self, page_size=None, max_workers=None):
+        """Retrieve all resources matching this request as a single :class:`.Array`.
+
+        The first page is retrieved in order to find out the `total` number of resources,
+        the remaining pages are then retrieved concurrently using a bounded pool of threads.
+        All pages are merged in order, including their `items_mapped`, so links can be resolved
+        across pages.
+
+        :param page_size: (int) Optional number of resources per page, defaults to
+            the `limit` parameter of this request or :data:`.const.MAX_PAGE_SIZE`.
+        :param max_workers: (int) Optional maximum number of concurrent requests,
+            see :func:`.Dispatcher.max_workers`.
+        :return: :class:`.Array` instance containing all matching resources.
+        """
+        skip, limit = self.page_bounds(page_size)
+
+        first = self.page(skip, limit).invoke()
+        limit = first.limit or limit    # The API may cap the requested limit
+        offsets = list(range(skip + limit, first.total, limit))
+        pages = [first]
+
+        if offsets:
+            workers = min(self.dispatcher.max_workers(max_workers), len(offsets))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages.extend(executor.map(lambda offset: self.page(offset, limit).invoke(), offsets))
+
+        result = self.merge_pages(pages)
+        if self.resolve_links:
+            self.dispatcher.resolve_links(self, result)
+
+        return result
+
+    def merge_pages(self, pages):
+        """Merge pages of this request into a new :class:`.Array`.
+
+        The pages themselves are left unchanged, as they may be shared by a :class:`.cache.ResponseCache`.
+
+        :param pages: list of :class:`.Array` instances, the first one being the first page.
+        :return: :class:`.Array` instance containing the resources of all pages, in order.
+        """
+        result = Array(pages[0].sys)
+        result.skip = pages[0].skip
+        result.total = pages[0].total
+        for page in pages:
+            result.merge(page)
+
+        result.limit = len(result.items)
+        return result
+
+    def page(self, skip, limit):
+        """Construct a new request of the same type for a single page of this request.
+
+        :param skip: (int) Number of resources to skip.
+        :param limit: (int) Maximum number of resources in the page.
+        :return: :class:`.RequestArray` instance.
+        """
+        return self.where({'skip': skip, 'limit': limit})
+
+    def link_resolver(self):
+        """Create a :class:`.LinkResolver` for the pages of this request.
+
+        :return: :class:`.LinkResolver` resolving links up to the `include` depth of this request,
+            or :data:`.const.MAX_INCLUDE_DEPTH` if not specified.
+        """
+        depth = max(1, int(self.params.get('include', const.MAX_INCLUDE_DEPTH)))
+        return LinkResolver(depth, self.dispatcher.identity_map)
+
+    def resolve_shared(self, resolver, page):
+        """Add a page to a :class:`.LinkResolver` and resolve its links, if enabled.
+
+        :param resolver: :class:`.LinkResolver` instance.
+        :param page: :class:`.Array` instance.
+        :return: :class:`.Array` instance referencing the pooled resources, see :func:`.LinkResolver.add`.
+        """
+        page = resolver.add(page)
+        if self.resolve_links:
+            self.dispatcher.resolve_links(self, page, resolver)
+        return page
+
+    def page_bounds(self, page_size=None):
+        """Determine the `skip` offset of the first page and the `limit` of every page.
+
+        :param page_size: (int) Optional number of resources per page, defaults to
+            the `limit` parameter of this request or :data:`.const.MAX_PAGE_SIZE`.
+        :return: tuple of `skip` and `limit` values.
+        """
+        limit = int(page_size or self.params.get('limit') or const.MAX_PAGE_SIZE)
+        skip = int(self.params.get('skip') or 0)
+        return skip, limit
+
+    def stream(self, chunk_size=None):
+        """Retrieve the resources matching this request, parsing the response incrementally.
+
+        Each resource is yielded as soon as it has been received, rather than once the whole
+        response has been received and decoded, which lowers the time to the first resource and
+        the peak memory usage for large pages::
+
+            for entry in client.fetch(Entry).where({'limit': 1000, 'include': 10}).stream():
+                dosomething(entry)
+
+        Included resources are only received after all items, links are therefore resolved in
+        place after the last resource has been yielded. Responses are never cached.
+
+        :param chunk_size: (int) Optional number of bytes read at a time,
+            defaults to :data:`.const.STREAM_CHUNK_SIZE`.
+        :return: generator of :class:`.Resource` subclass instances.
+        """
+        array = Array()
+        array.items_mapped = {'Asset': {}, 'Entry': {}}
+
+        for key, value in self.dispatcher.invoke_stream(self, chunk_size):
+            if key == 'items':
+                resource = self.dispatcher.create_resource(value)
+                if self.resolve_links:
+                    array.map_resource(resource)
+                yield resource
+            elif key == 'includes' and self.resolve_links:
+                self.dispatcher.resource_factory.process_array_includes(array, {'includes': value})
+
+        if self.resolve_links:
+            if self.dispatcher.identity_map is not None:
+                self.dispatcher.identity_map.add_all(array)
+            self.dispatcher.resolve_links(self, array)
+
     def first(self):
         """Attempt to retrieve only the first resource matching this request.
 
         :return: Result instance, or `None` if there are no matching resources.
         """
-        self.params['limit'] = 1
-        result = self.all()
+        result = self.where({'limit': 1}).all()
         return result.items[0] if result.total > 0 else None
 
     def where(self, params):
-        """Set a dict of parameters to be passed to the API when invoking this request.
+        """Construct a new request of the same type, passing additional parameters to the API.
+
+        This request is left unchanged, so a base request can be shared and refined::
+
+            cats = client.fetch(Cat).where({'include': 2})
+            nyancat = cats.where({'sys.id': 'nyancat'}).first()
 
-        :param params: (dict) query parameters.
-        :return: this :class:`.RequestArray` instance for convenience.
+        :param params: (dict) query parameters, overriding those of this request.
+        :return: new :class:`.RequestArray` instance.
         """
-        self.params = dict(self.params, **params)   # params overrides self.params
-        return self
\ No newline at end of file
+        return self.__class__(self.dispatcher, self.remote_path, self.resolve_links,
+                              params=dict(self.params, **params))   # params overrides self.params
+
+
+class SyncRequest(Request):
+    """Represents a request for a single page of a synchronization, responses are never cached."""
+    cacheable = False
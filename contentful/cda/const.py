@@ -2,6 +2,26 @@
 
 CDA_ADDRESS = 'cdn.contentful.com'
 
+DEFAULT_LOCALE = 'en-US'
+
 PATH_ASSETS = 'assets'
 PATH_ENTRIES = 'entries'
-PATH_CONTENT_TYPES = 'content_types'
\ No newline at end of file
+PATH_CONTENT_TYPES = 'content_types'
+PATH_SYNC = 'sync'
+
+MAX_PAGE_SIZE = 1000
+MAX_WORKERS = 4
+MAX_IDS_QUERY_LENGTH = 6000
+MAX_INCLUDE_DEPTH = 10
+POOL_SIZE = 10
+STREAM_CHUNK_SIZE = 64 * 1024
+
+CACHE_MAX_SIZE = 64 * 1024 * 1024
+CACHE_TTL = 60
+IDENTITY_MAP_SIZE = 10000
+HISTOGRAM_SIZE = 1000
+
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 60
+MAX_CONCURRENCY = 32
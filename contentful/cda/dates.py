@@ -0,0 +1,121 @@
+"""dates module.
+
+Classes provided include:
+
+- :class:`.DateParser` - Parser of ISO-8601 dates as returned by the API, with an optional bounded memo.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from dateutil import parser, tz
+import re
+import threading
+
+
+class DateParser(object):
+    """Parser of ISO-8601 dates as returned by the API.
+
+    Dates in the strict formats emitted by the API (e.g. ``2015-01-01``, ``2015-01-01T10:00``
+    or ``2015-01-01T10:00:00.000Z``) are parsed using a regular expression, any other values
+    are passed on to :func:`dateutil.parser.parse`. UTC dates are created with a
+    :class:`dateutil.tz.tzutc` time zone, other offsets with a :class:`dateutil.tz.tzoffset`.
+
+    As parsed dates are immutable, they can be memoized, which pays off when the same
+    timestamps appear in many Entries::
+
+        date_parser = DateParser(memo_size=4096)
+        date_parser.parse('2015-01-01T10:00:00.000Z')
+
+    Instances are callable, as a shorthand for :func:`parse`. Pickled or copied instances start
+    with an empty memo.
+
+    **Attributes**:
+
+    - memo_size (int): Maximum number of memoized dates, `0` to disable the memo.
+    """
+    ISO_8601 = re.compile(r'(\d{4})-(\d{2})-(\d{2})'
+                          r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,9}))?)?(Z|[+-]\d{2}(?::?\d{2})?)?)?$')
+
+    UTC = tz.tzutc()
+
+    def __init__(self, memo_size=0):
+        """DateParser constructor.
+
+        :param memo_size: (int) Maximum number of memoized dates, `0` to disable the memo.
+        :return: :class:`.DateParser` instance.
+        """
+        super(DateParser, self).__init__()
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'memo_size': self.memo_size}
+
+    def __setstate__(self, state):
+        self.__init__(state['memo_size'])
+
+    def __call__(self, value):
+        return self.parse(value)
+
+    def parse(self, value):
+        """Parse a date.
+
+        :param value: Date as str, other values are converted to str first.
+        :return: :class:`datetime.datetime` instance.
+        :raises ValueError: in case the value is not a valid date.
+        """
+        if not isinstance(value, str):
+            value = str(value)
+
+        if not self.memo_size:
+            return DateParser.parse_value(value)
+
+        result = self.memo.get(value)
+        if result is None:
+            result = DateParser.parse_value(value)
+            with self.lock:
+                self.memo[value] = result
+                while len(self.memo) > self.memo_size:
+                    self.memo.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def parse_value(value):
+        """Parse a date without consulting any memo.
+
+        :param value: (str) Date.
+        :return: :class:`datetime.datetime` instance.
+        :raises ValueError: in case the value is not a valid date.
+        """
+        match = DateParser.ISO_8601.match(value)
+        if match is None:
+            return parser.parse(value)
+
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day),
+                            int(hour or 0), int(minute or 0), int(second or 0),
+                            int(fraction[:6].ljust(6, '0')) if fraction else 0,
+                            DateParser.tzinfo_for(offset))
+        except ValueError:
+            return parser.parse(value)   # Raise the same error as dateutil for out of range values
+
+    @staticmethod
+    def tzinfo_for(offset):
+        """Create the time zone for an ISO-8601 offset.
+
+        :param offset: (str) Offset (e.g. ``Z``, ``+02:00`` or ``-0530``), `None` for naive dates.
+        :return: :class:`datetime.tzinfo` instance, `None` for naive dates.
+        """
+        if offset is None:
+            return None
+        elif offset == 'Z':
+            return DateParser.UTC
+
+        digits = offset[1:].replace(':', '')
+        seconds = int(digits[:2]) * 3600 + int(digits[2:] or 0) * 60
+        if seconds == 0:
+            return DateParser.UTC
+
+        return tz.tzoffset(None, -seconds if offset[0] == '-' else seconds)
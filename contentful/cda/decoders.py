@@ -0,0 +1,94 @@
+"""decoders module.
+
+Classes provided include:
+
+- :class:`.JSONDecoder` - Decoder based on the standard library `json` module.
+
+- :class:`.OrjsonDecoder` - Decoder based on `orjson` (optional dependency).
+
+- :class:`.UjsonDecoder` - Decoder based on `ujson` (optional dependency).
+
+Functions provided include:
+
+- :func:`available_decoders` - Create all decoders whose dependencies are installed.
+
+- :func:`default_decoder` - Create the fastest decoder available.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONDecoder(object):
+    """Decodes raw response bodies, using the standard library `json` module.
+
+    Decoders are used by the :class:`.Dispatcher` and may be provided through the `json_decoder`
+    argument of a :class:`.Client`. Custom decoders only need to implement :func:`decode`.
+    """
+    name = 'json'
+
+    def decode(self, content):
+        """Decode a raw response body.
+
+        :param content: (bytes) UTF-8 encoded JSON.
+        :return: Decoded JSON data.
+        :raises ValueError: in case the content is not valid JSON.
+        """
+        return json.loads(content.decode('utf-8'))
+
+
+class OrjsonDecoder(JSONDecoder):
+    """Decodes raw response bodies using `orjson`."""
+    name = 'orjson'
+
+    def __init__(self):
+        super(OrjsonDecoder, self).__init__()
+        if orjson is None:
+            raise ImportError('OrjsonDecoder requires the "orjson" package to be installed.')
+
+    def decode(self, content):
+        return orjson.loads(content)
+
+
+class UjsonDecoder(JSONDecoder):
+    """Decodes raw response bodies using `ujson`."""
+    name = 'ujson'
+
+    def __init__(self):
+        super(UjsonDecoder, self).__init__()
+        if ujson is None:
+            raise ImportError('UjsonDecoder requires the "ujson" package to be installed.')
+
+    def decode(self, content):
+        return ujson.loads(content)
+
+
+def available_decoders():
+    """Create an instance of every decoder whose dependencies are installed, fastest first.
+
+    :return: list of :class:`.JSONDecoder` instances.
+    """
+    result = []
+    if orjson is not None:
+        result.append(OrjsonDecoder())
+    if ujson is not None:
+        result.append(UjsonDecoder())
+    result.append(JSONDecoder())
+    return result
+
+
+def default_decoder():
+    """Create the fastest decoder available, i.e. based on `orjson` or `ujson` if installed,
+    the standard library otherwise.
+
+    :return: :class:`.JSONDecoder` instance.
+    """
+    return available_decoders()[0]
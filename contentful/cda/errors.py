@@ -33,6 +33,19 @@ def api_exception(http_code):
     return wrapper
 
 
+def rate_limit_reset(response):
+    """Parse the ``X-Contentful-RateLimit-Reset`` header of a response.
+
+    :param response: Response object.
+    :return: (float) Number of seconds until the rate limit resets, `None` if missing or invalid.
+    """
+    reset = response.headers.get('X-Contentful-RateLimit-Reset')
+    try:
+        return None if reset is None else float(reset)
+    except ValueError:
+        return None
+
+
 @api_exception(400)
 class BadRequest(ApiError):
     """Bad Request"""
@@ -53,6 +66,16 @@ class NotFound(ApiError):
     """Not Found"""
 
 
+@api_exception(429)
+class RateLimitExceeded(ApiError):
+    """Rate Limit Exceeded"""
+
+    @property
+    def reset_time(self):
+        """Number of seconds until the rate limit resets, `None` if unknown, see :func:`rate_limit_reset`."""
+        return rate_limit_reset(self.result)
+
+
 @api_exception(500)
 class ServerError(ApiError):
     """Internal Server Error"""
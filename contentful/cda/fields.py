@@ -47,10 +47,23 @@ class Field(object):
         self.field_id = field_id
 
     def __get__(self, instance, owner):
+        pending = getattr(instance, '_cf_cda_pending', None)
+        if pending and self.field_id in pending:
+            # Lazily convert the raw value on first access, see :class:`.ResourceFactory`.
+            converter = pending.get(self.field_id)
+            value = instance.fields.get(self.field_id)
+            if value is not None:
+                self.__set__(instance, value if converter is None else converter(value))
+            pending.pop(self.field_id, None)
+
         dct = Field.dict_for_instance(instance)
         return None if dct is None else dct.get(self.field_id, None)
 
     def __set__(self, instance, value):
+        pending = getattr(instance, '_cf_cda_pending', None)
+        if pending:
+            pending.pop(self.field_id, None)
+
         dct = Field.dict_for_instance(instance)
 
         if dct is None:
@@ -70,6 +83,10 @@ class FieldOwner(type):
     a valid `__content_type__` attribute specified, otherwise raise an exception.
     In addition, iterate through all of the class attributes, identify any :class:`.Field`-typed
     attributes and keep those in a dict under the class's `__entry_fields__` attribute.
+
+    Unless declared explicitly, custom Entry classes get empty `__slots__`, so their instances
+    stay as compact as :class:`.Entry` instances, with field values kept in a single dict.
+    Classes setting `__dynamic_attributes__ = True` get a `__dict__` for arbitrary attributes instead.
     """
     def __new__(mcs, name, bases, attrs):
         is_custom = name != 'Entry'
@@ -88,6 +105,8 @@ class FieldOwner(type):
             raise AttributeError('Class {0} does not have a __content_type__ specified.'.format(name))
 
         attrs['__entry_fields__'] = fields
+        if is_custom and '__slots__' not in attrs:
+            attrs['__slots__'] = ('__dict__',) if attrs.get('__dynamic_attributes__') else ()
         return super(FieldOwner, mcs).__new__(mcs, name, bases, attrs)
 
 
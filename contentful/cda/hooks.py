@@ -0,0 +1,243 @@
+"""hooks module.
+
+Classes provided include:
+
+- :class:`.RequestEvent` - Measurements of a single request, passed to observers.
+
+- :class:`.RequestObserver` - Interface for observing the lifecycle of requests.
+
+- :class:`.Histogram` - Bounded sample of measurements, reporting percentiles.
+
+- :class:`.HistogramCollector` - Observer collecting histograms of measurements per remote path.
+"""
+from . import const
+from collections import deque
+from timeit import default_timer
+import math
+import threading
+
+
+class RequestEvent(object):
+    """Measurements of a single request, passed to :class:`.RequestObserver` instances.
+
+    Measurements are filled in as the request progresses, those not taken are `None`.
+    All times are in seconds.
+
+    **Attributes**:
+
+    - remote_path (str): API path of the request.
+    - params (dict): Query parameters of the request.
+    - url (str): URL of the request.
+    - started (float): Timer value when the request started, see :func:`timeit.default_timer`.
+    - status_code (int): HTTP status code of the last response.
+    - response_bytes (int): Size of the last response body.
+    - attempts (int): Number of HTTP requests issued, including retries.
+    - cached (bool): Indicates whether the result was taken from the response cache.
+    - coalesced (bool): Indicates whether the response was shared from an identical concurrent request.
+    - network_time (float): Time spent issuing HTTP requests, including retries, or waiting for
+      the response of an identical concurrent request.
+    - decode_time (float): Time spent decoding the response body.
+    - build_time (float): Time spent creating resources by the :class:`.ResourceFactory`.
+    - resolve_time (float): Time spent resolving links locally.
+    - total_time (float): Time from start to end of the request.
+    - error (Exception): Error raised by the request, if any.
+    """
+    def __init__(self, remote_path, params, url=None):
+        """RequestEvent constructor.
+
+        :param remote_path: (str) API path of the request.
+        :param params: (dict) Query parameters of the request.
+        :param url: (str) Optional URL of the request.
+        :return: :class:`.RequestEvent` instance.
+        """
+        super(RequestEvent, self).__init__()
+        self.remote_path = remote_path
+        self.params = params
+        self.url = url
+        self.started = default_timer()
+        self.status_code = None
+        self.response_bytes = None
+        self.attempts = 0
+        self.cached = False
+        self.coalesced = False
+        self.network_time = None
+        self.decode_time = None
+        self.build_time = None
+        self.resolve_time = None
+        self.total_time = None
+        self.error = None
+
+    def measurements(self):
+        """Retrieve all measurements taken, including the response size.
+
+        :return: dict of values mapped by attribute name.
+        """
+        names = ('network_time', 'decode_time', 'build_time', 'resolve_time', 'total_time', 'response_bytes')
+        return dict((name, getattr(self, name)) for name in names if getattr(self, name) is not None)
+
+
+class RequestObserver(object):
+    """Interface for observing the lifecycle of requests, all methods do nothing by default.
+
+    Observers provided to a :class:`.Client` are notified synchronously by the thread issuing the
+    request, and should therefore be cheap and thread-safe::
+
+        class SlowRequestLogger(RequestObserver):
+            def request_finished(self, event):
+                if event.total_time > 1:
+                    log.warning('Slow request to %s: %s', event.url, event.measurements())
+
+        client = Client('space-id', 'access-token', observers=[SlowRequestLogger()])
+    """
+
+    def request_started(self, event):
+        """Called before a request is issued.
+
+        :param event: :class:`.RequestEvent` instance, carrying only the request details.
+        """
+
+    def request_finished(self, event):
+        """Called once a request has finished, successfully or not (see `error`).
+
+        :param event: :class:`.RequestEvent` instance.
+        """
+
+    def links_resolved(self, event):
+        """Called once the links of an :class:`.Array` have been resolved locally.
+
+        :param event: :class:`.RequestEvent` instance of the request which retrieved
+            the array, carrying only the `resolve_time`.
+        """
+
+
+class Histogram(object):
+    """Bounded sample of measurements, keeping the most recent ones for computing percentiles.
+
+    **Attributes**:
+
+    - samples (deque): Most recent measurements.
+    - count (int): Number of all measurements added.
+    - total (float): Sum of all measurements added.
+    - maximum (float): Largest measurement added, `None` if there are none.
+    """
+    def __init__(self, max_samples=const.HISTOGRAM_SIZE):
+        """Histogram constructor.
+
+        :param max_samples: (int) Maximum number of recent measurements kept.
+        :return: :class:`.Histogram` instance.
+        """
+        super(Histogram, self).__init__()
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0
+        self.maximum = None
+
+    def add(self, value):
+        """Add a measurement.
+
+        :param value: (float) Measurement.
+        """
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, percent):
+        """Compute a percentile of the recent measurements (nearest rank).
+
+        :param percent: (float) Percentile between 0 and 100, e.g. `99`.
+        :return: measurement, `None` if there are none.
+        """
+        if not self.samples:
+            return None
+
+        ordered = sorted(self.samples)
+        rank = int(math.ceil(percent / 100.0 * len(ordered)))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+    def summary(self):
+        """Summarize the measurements.
+
+        :return: dict with `count`, `mean`, `p50`, `p90`, `p99` and `max` values.
+        """
+        return {'count': self.count, 'mean': self.total / self.count if self.count else None,
+                'p50': self.percentile(50), 'p90': self.percentile(90), 'p99': self.percentile(99),
+                'max': self.maximum}
+
+
+class HistogramCollector(RequestObserver):
+    """Observer collecting in-memory histograms of request measurements per remote path.
+
+    Example::
+
+        collector = HistogramCollector()
+        client = Client('space-id', 'access-token', observers=[collector])
+        ...
+        collector.histogram('entries', 'total_time').percentile(99)
+        collector.summary()     # {'entries': {'total_time': {'p50': ..., 'p99': ...}, ...}}
+
+    **Attributes**:
+
+    - max_samples (int): Maximum number of recent measurements kept per histogram.
+    - key: Function mapping a :class:`.RequestEvent` to the key measurements are grouped by,
+      by default its `remote_path`.
+    - histograms (dict): :class:`.Histogram` instances mapped by key and measurement name.
+    """
+    def __init__(self, max_samples=const.HISTOGRAM_SIZE, key=None):
+        """HistogramCollector constructor.
+
+        :param max_samples: (int) Maximum number of recent measurements kept per histogram.
+        :param key: Optional function mapping a :class:`.RequestEvent` to the key measurements
+            are grouped by, e.g. `lambda event: (event.remote_path, event.params.get('content_type'))`.
+        :return: :class:`.HistogramCollector` instance.
+        """
+        super(HistogramCollector, self).__init__()
+        self.max_samples = max_samples
+        self.key = key or (lambda event: event.remote_path)
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def request_finished(self, event):
+        self.record(event)
+
+    def links_resolved(self, event):
+        self.record(event)
+
+    def record(self, event):
+        """Add all measurements of an event to the histograms of its key.
+
+        :param event: :class:`.RequestEvent` instance.
+        """
+        key = self.key(event)
+        with self.lock:
+            for name, value in event.measurements().items():
+                histogram = self.histograms.get((key, name))
+                if histogram is None:
+                    histogram = self.histograms[(key, name)] = Histogram(self.max_samples)
+                histogram.add(value)
+
+    def histogram(self, key, name):
+        """Retrieve the histogram of a measurement.
+
+        :param key: Key as returned by the `key` function, by default the remote path.
+        :param name: (str) Measurement name, e.g. `total_time`, see :func:`.RequestEvent.measurements`.
+        :return: :class:`.Histogram` instance, `None` if nothing has been measured.
+        """
+        return self.histograms.get((key, name))
+
+    def summary(self):
+        """Summarize all histograms.
+
+        :return: dict of summaries (see :func:`.Histogram.summary`) mapped by key and measurement name.
+        """
+        result = {}
+        with self.lock:
+            for (key, name), histogram in self.histograms.items():
+                result.setdefault(key, {})[name] = histogram.summary()
+        return result
+
+    def clear(self):
+        """Remove all histograms."""
+        with self.lock:
+            self.histograms.clear()
@@ -0,0 +1,123 @@
+"""ratelimit module.
+
+Classes provided include:
+
+- :class:`.RetryPolicy` - Policy for retrying rate limited or failed requests.
+
+- :class:`.AdaptiveConcurrencyLimiter` - Limiter adapting the number of concurrent requests to the rate limit.
+"""
+from . import const
+from .errors import rate_limit_reset
+import random
+import threading
+
+
+class RetryPolicy(object):
+    """Policy for retrying rate limited or failed requests using exponential backoff with jitter.
+
+    In case the API provides the ``X-Contentful-RateLimit-Reset`` header, the request is retried
+    once the rate limit resets instead.
+
+    **Attributes**:
+
+    - max_retries (int): Maximum number of retries per request.
+    - backoff (float): Base delay in seconds, doubled for every retry.
+    - max_backoff (float): Maximum delay in seconds.
+    - statuses (tuple): HTTP status codes of responses to retry.
+    """
+    def __init__(self, max_retries=const.MAX_RETRIES, backoff=const.RETRY_BACKOFF,
+                 max_backoff=const.RETRY_MAX_BACKOFF, statuses=(429,)):
+        """RetryPolicy constructor.
+
+        :param max_retries: (int) Maximum number of retries per request, 0 disables retries.
+        :param backoff: (float) Base delay in seconds, doubled for every retry.
+        :param max_backoff: (float) Maximum delay in seconds.
+        :param statuses: (tuple) HTTP status codes of responses to retry, e.g. `(429, 500, 502, 503, 504)`.
+        :return: :class:`.RetryPolicy` instance.
+        """
+        super(RetryPolicy, self).__init__()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+
+    def should_retry(self, attempt, response):
+        """Determine whether a request should be retried.
+
+        :param attempt: (int) Number of retries performed so far.
+        :param response: Response object.
+        :return: bool
+        """
+        return attempt < self.max_retries and response.status_code in self.statuses
+
+    def delay(self, attempt, response):
+        """Determine the number of seconds to wait before retrying a request.
+
+        :param attempt: (int) Number of retries performed so far.
+        :param response: Response object.
+        :return: delay in seconds.
+        """
+        reset = rate_limit_reset(response)
+        if reset is not None:
+            # Spread retries of concurrent requests past the reset
+            return min(self.max_backoff, reset + random.uniform(0, self.backoff))
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """Limiter adapting the number of concurrent requests to the rate limit (AIMD).
+
+    The limit is increased additively (by one per round of successful requests), and decreased
+    multiplicatively whenever a request is rate limited. When provided to a :class:`.Client`,
+    all of its requests are subject to the limiter, and concurrent retrieval of pages or links
+    runs with up to `maximum` threads::
+
+        client = Client('space-id', 'access-token', limiter=AdaptiveConcurrencyLimiter())
+
+    **Attributes**:
+
+    - limit (float): Current limit of concurrent requests.
+    - minimum (int): Lower bound of the limit.
+    - maximum (int): Upper bound of the limit.
+    - decrease (float): Factor the limit is multiplied with for rate limited requests.
+    - in_flight (int): Number of requests currently in flight.
+    """
+    def __init__(self, initial=const.MAX_WORKERS, minimum=1, maximum=const.MAX_CONCURRENCY, decrease=0.5):
+        """AdaptiveConcurrencyLimiter constructor.
+
+        :param initial: (int) Initial limit of concurrent requests.
+        :param minimum: (int) Lower bound of the limit.
+        :param maximum: (int) Upper bound of the limit.
+        :param decrease: (float) Factor the limit is multiplied with for rate limited requests.
+        :return: :class:`.AdaptiveConcurrencyLimiter` instance.
+        """
+        super(AdaptiveConcurrencyLimiter, self).__init__()
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Wait until another request may be issued."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled=None):
+        """Mark a request as completed, adapting the limit to its outcome.
+
+        :param throttled: (bool) Indicates whether the request was rate limited,
+            `None` in case the outcome is unknown (e.g. the request failed), in which
+            case the limit is left unchanged.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            elif throttled is not None:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify_all()
@@ -6,6 +6,8 @@ Classes provided include:
 
 - :class:`Array` - Collection of multiple :class:`.Resource` instances.
 
+- :class:`LinkResolver` - Resolves links transitively, using a pool of resources shared across pages.
+
 - :class:`Asset` - CDA Asset.
 
 - :class:`ContentType` - CDA Content Type.
@@ -14,16 +16,70 @@ Classes provided include:
 
 - :class:`Space` - CDA Space.
 
+- :class:`DeletedAsset` - CDA Asset deleted since a previous synchronization.
+
+- :class:`DeletedEntry` - CDA Entry deleted since a previous synchronization.
+
+- :class:`SyncPage` - Single page of a synchronization response.
+
+- :class:`SyncResult` - Outcome of a synchronization.
+
 - :class:`ResourceType` - Enum of CDA resource types.
 """
 
 from enum import Enum
-from six import with_metaclass
-from .fields import FieldOwner, MultipleAssets, MultipleEntries
+from six import string_types, with_metaclass
+from six.moves.urllib.parse import urlparse, parse_qs
+from . import const
+from .fields import FieldOwner
+
+
+def _slot_names(clz):
+    """Collect the names of all attributes declared in `__slots__` of a class and its bases.
+
+    :param clz: Class.
+    :return: list of attribute names, excluding `__dict__` and `__weakref__`.
+    """
+    result = []
+    for base in clz.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        for name in [slots] if isinstance(slots, string_types) else slots:
+            if name not in ('__dict__', '__weakref__') and name not in result:
+                result.append(name)
+    return result
+
+
+def _get_state(obj):
+    """Collect the attributes of an instance using `__slots__`, as pickled by `__getstate__`.
+
+    :param obj: Instance.
+    :return: dict of attribute values mapped by name, including those of its `__dict__`, if any.
+    """
+    state = dict(getattr(obj, '__dict__', {}))
+    for name in _slot_names(obj.__class__):
+        if hasattr(obj, name):
+            state[name] = getattr(obj, name)
+    return state
+
+
+def _set_state(obj, state):
+    """Restore the attributes of an instance as collected by :func:`_get_state`.
+
+    :param obj: Instance.
+    :param state: (dict) Attribute values mapped by name.
+    """
+    for name, value in state.items():
+        setattr(obj, name, value)
 
 
 class Resource(object):
-    """Base CDA resource class."""
+    """Base CDA resource class.
+
+    Resources use `__slots__` to keep their memory footprint small, they can be pickled
+    using any protocol nonetheless.
+    """
+    __slots__ = ('sys', '__weakref__')
+
     def __init__(self, sys=None):
         """Resource constructor.
 
@@ -33,6 +89,12 @@ class Resource(object):
         super(Resource, self).__init__()
         self.sys = sys or {}
 
+    def __getstate__(self):
+        return _get_state(self)
+
+    def __setstate__(self, state):
+        _set_state(self, state)
+
     def __repr__(self):
         """Custom representation.
 
@@ -63,6 +125,8 @@ class Array(Resource):
     - items (list): Resources contained within the response.
     - items_mapped (dict): All contained resources mapped by Assets/Entries using the resource ID.
     """
+    __slots__ = ('limit', 'skip', 'total', 'items', 'items_mapped')
+
     def __init__(self, sys=None):
         """Array constructor.
 
@@ -84,31 +148,192 @@ class Array(Resource):
         # Proxy to the `items` attribute
         return self.items[index]
 
-    def _resolve_resource_link(self, link):
-        return self.items_mapped[link.link_type].get(link.resource_id)
+    def map_resource(self, resource):
+        """Map the given resource under `items_mapped` by its type and ID.
+
+        :param resource: :class:`.Asset` or :class:`.Entry` instance, other types are ignored.
+        """
+        key = None
+
+        if isinstance(resource, Asset):
+            key = 'Asset'
+        elif isinstance(resource, Entry):
+            key = 'Entry'
+
+        if key is not None:
+            self.items_mapped.setdefault(key, {})[resource.sys['id']] = resource
+
+    def merge(self, other):
+        """Merge the items and included resources of another :class:`.Array` into this one.
+
+        Items of `other` are appended to the `items` of this array. In case a resource appears
+        both as an item and as an included resource, the item instance takes precedence.
+
+        :param other: (:class:`.Array`) array to merge.
+        """
+        self.include(other)
+        self.items.extend(other.items)
+        for item in other.items:
+            self.map_resource(item)
+
+    def include(self, other):
+        """Add all resources of another :class:`.Array` to the `items_mapped` of this one.
 
-    def resolve_links(self):
+        The `items` of this array are not modified, resources already mapped take precedence.
+
+        :param other: (:class:`.Array`) array to include.
+        """
+        for key, resources in other.items_mapped.items():
+            mapped = self.items_mapped.setdefault(key, {})
+            for resource_id, resource in resources.items():
+                mapped.setdefault(resource_id, resource)
+
+    def unresolved_links(self, identity_map=None):
+        """Collect all links of contained Entries which cannot be resolved locally.
+
+        :param identity_map: (:class:`.cache.IdentityMap`) Optional identity map to resolve links from.
+        :return: set of (link type, resource ID) tuples.
+        """
+        result = set()
+        for entry in self.items_mapped.get('Entry', {}).values():
+            for container, key in entry.link_positions():
+                link = container[key]
+                if isinstance(link, ResourceLink) and self._resolve_resource_link(link, identity_map) is None:
+                    result.add((link.link_type, link.resource_id))
+
+        return result
+
+    def _resolve_resource_link(self, link, identity_map=None):
+        result = self.items_mapped.get(link.link_type, {}).get(link.resource_id)
+        if result is None and identity_map is not None:
+            result = identity_map.get(link.link_type, link.resource_id)
+        return result
+
+    def resolve_links(self, identity_map=None):
         """Attempt to resolve all internal links (locally).
 
          In case the linked resources are found either as members of the array or within
          the `includes` element, those will be replaced and reference the actual resources.
+         Otherwise, if an identity map is provided, previously seen resources are looked up there.
          No network calls will be performed.
+
+         Only the positions of links recorded when the Entries were created are visited,
+         see :func:`.Entry.link_positions`.
+
+        :param identity_map: (:class:`.cache.IdentityMap`) Optional identity map to resolve links from.
+        """
+        for entry in self.items_mapped.get('Entry', {}).values():
+            for container, key in entry.link_positions():
+                link = container[key]
+                if not isinstance(link, ResourceLink):
+                    continue
+
+                resolved = self._resolve_resource_link(link, identity_map)
+                if resolved is not None:
+                    entry.replace_link(container, key, resolved)
+
+
+class LinkResolver(object):
+    """Resolves links transitively up to a maximum depth, using a pool of resources shared across pages.
+
+    Every page of a paginated query is added to the pool, resources appearing on several pages
+    (e.g. Entries included by many pages) are only kept once and shared by all pages. Links of
+    the items of a page are resolved using the pool, then links of the linked Entries and so on,
+    up to `depth` levels, visiting every Entry at most once so cycles are handled safely::
+
+        resolver = LinkResolver(depth=2)
+        for page in pages:
+            page = resolver.add(page)
+            resolver.resolve(page.items)
+
+    **Attributes**:
+
+    - depth (int): Maximum number of levels of links to resolve, `1` only resolves links of the given resources.
+    - identity_map (:class:`.cache.IdentityMap`): Optional identity map to resolve links from.
+    - resources (dict): Pooled resources mapped by type and ID.
+    """
+    def __init__(self, depth=const.MAX_INCLUDE_DEPTH, identity_map=None):
+        """LinkResolver constructor.
+
+        :param depth: (int) Maximum number of levels of links to resolve, defaults to :data:`.const.MAX_INCLUDE_DEPTH`.
+        :param identity_map: (:class:`.cache.IdentityMap`) Optional identity map to resolve links from.
+        :return: :class:`.LinkResolver` instance.
+        """
+        super(LinkResolver, self).__init__()
+        self.depth = depth
+        self.identity_map = identity_map
+        self.resources = {'Asset': {}, 'Entry': {}}
+
+    def add(self, array):
+        """Add all resources of an :class:`.Array` to the pool.
+
+        Resources already pooled take precedence. The given array is left unchanged, as it may be
+        shared (e.g. by a :class:`.cache.ResponseCache`), a new array referencing the pooled
+        instances is returned instead.
+
+        :param array: (:class:`.Array`) array to add.
+        :return: :class:`.Array` instance with the `items` and `items_mapped` of the given array,
+            referencing the pooled instances.
+        """
+        result = Array(array.sys)
+        result.limit = array.limit
+        result.skip = array.skip
+        result.total = array.total
+
+        for key, resources in array.items_mapped.items():
+            pooled = self.resources.setdefault(key, {})
+            mapped = result.items_mapped.setdefault(key, {})
+            for resource_id, resource in resources.items():
+                mapped[resource_id] = pooled.setdefault(resource_id, resource)
+
+        result.items = [self.resources.get(item.sys.get('type'), {}).get(item.sys.get('id'), item)
+                        for item in array.items]
+        return result
+
+    def get(self, resource_type, resource_id):
+        """Retrieve a resource from the pool, or the identity map.
+
+        :param resource_type: (str) Resource type as str.
+        :param resource_id: (str) Resource ID.
+        :return: :class:`.Resource` subclass, `None` if not found.
+        """
+        result = self.resources.get(resource_type, {}).get(resource_id)
+        if result is None and self.identity_map is not None:
+            result = self.identity_map.get(resource_type, resource_id)
+        return result
+
+    def resolve(self, resources):
+        """Resolve links of the given resources, and transitively of linked Entries, up to `depth` levels.
+
+        No network calls will be performed, links which cannot be resolved are left in place.
+
+        :param resources: iterable of :class:`.Resource` subclass instances.
         """
-        for resource in self.items_mapped['Entry'].values():
-            for dct in [getattr(resource, '_cf_cda', {}), resource.fields]:
-                for k, v in dct.items():
-                    if isinstance(v, ResourceLink):
-                        resolved = self._resolve_resource_link(v)
-                        if resolved is not None:
-                            dct[k] = resolved
-                    elif isinstance(v, (MultipleAssets, MultipleEntries, list)):
-                        for idx, ele in enumerate(v):
-                            if not isinstance(ele, ResourceLink):
-                                break
+        visited = set()
+        level = [resource for resource in resources if isinstance(resource, Entry)]
+
+        for _ in range(self.depth):
+            linked = []
+            for entry in level:
+                if id(entry) in visited:
+                    continue
+                visited.add(id(entry))
 
-                            resolved = self._resolve_resource_link(ele)
-                            if resolved is not None:
-                                v[idx] = resolved
+                for container, key in entry.link_positions():
+                    value = container[key]
+                    if isinstance(value, ResourceLink):
+                        resolved = self.get(value.link_type, value.resource_id)
+                        if resolved is None:
+                            continue
+                        entry.replace_link(container, key, resolved)
+                        value = resolved
+
+                    if isinstance(value, Entry) and id(value) not in visited:
+                        linked.append(value)
+
+            if not linked:
+                break
+            level = linked
 
 
 class Asset(Resource):
@@ -120,6 +345,8 @@ class Asset(Resource):
     - url (str): URL.
     - mimeType (str): MIME type.
     """
+    __slots__ = ('fields', 'url', 'mimeType')
+
     def __init__(self, sys=None):
         """Asset constructor.
 
@@ -142,6 +369,8 @@ class ContentType(Resource):
     - user_description (str): Description of the Content Type.
     - fields (dict): Content Type fields, mapped by field IDs.
     """
+    __slots__ = ('display_field', 'name', 'user_description', 'fields')
+
     def __init__(self, sys=None):
         """Content Type constructor.
 
@@ -161,6 +390,7 @@ class Entry(with_metaclass(FieldOwner, Resource)):
     **Attributes**:
 
     - fields (dict): Entry fields.
+    - raw_fields (dict): Entry fields as returned from the API, i.e. containing unresolved links.
 
     It is possible to define custom :class:`.Entry` models using the following syntax::
 
@@ -180,6 +410,8 @@ class Entry(with_metaclass(FieldOwner, Resource)):
         inferred from the field's, as in the other fields).
 
     """
+    __slots__ = ('fields', '_raw_fields', '_cf_links', '_cf_cda', '_cf_cda_pending')
+
     def __init__(self, sys=None):
         """Entry constructor.
 
@@ -189,6 +421,83 @@ class Entry(with_metaclass(FieldOwner, Resource)):
         super(Entry, self).__init__(sys)
         self.fields = {}
         self.raw_fields = {}
+        self._cf_links = None
+
+    @property
+    def raw_fields(self):
+        """Entry fields as returned from the API.
+
+        If set to `None` (see :class:`.ResourceFactory`), they are rebuilt out of `fields`
+        on first access, turning both :class:`.ResourceLink` instances and resolved resources back into links.
+
+        :return: dict containing the raw field values.
+        """
+        if self._raw_fields is None:
+            self._raw_fields = dict((k, Entry.raw_value(v)) for k, v in self.fields.items())
+        return self._raw_fields
+
+    @raw_fields.setter
+    def raw_fields(self, value):
+        self._raw_fields = value
+
+    def link_positions(self):
+        """Find the positions of all links within `fields`, either top level values or elements of lists.
+
+        Positions are recorded by the :class:`.ResourceFactory` when the Entry is created, otherwise
+        `fields` are searched for :class:`.ResourceLink` instances. Positions remain valid once links
+        have been resolved.
+
+        :return: list of `(container, key)` tuples, `container[key]` being the link.
+        """
+        if self._cf_links is None:
+            links = []
+            for k, v in self.fields.items():
+                if isinstance(v, ResourceLink):
+                    links.append((self.fields, k))
+                elif isinstance(v, list):
+                    links.extend((v, idx) for idx, ele in enumerate(v) if isinstance(ele, ResourceLink))
+            return links
+
+        return self._cf_links
+
+    def replace_link(self, container, key, resource):
+        """Replace the link at one of the positions returned by :func:`link_positions` with the linked resource.
+
+        :param container: Container of the link, either `fields` or a list.
+        :param key: Key or index of the link within the container.
+        :param resource: :class:`.Resource` subclass, the linked resource.
+        """
+        link = container[key]
+        container[key] = resource
+
+        # Single links are held both by `fields` and the converted values of custom Entries,
+        # within a list in case of `List` fields.
+        converted = getattr(self, '_cf_cda', None)
+        if converted and container is self.fields:
+            value = converted.get(key)
+            if value is link:
+                converted[key] = resource
+            elif isinstance(value, list):
+                for idx, ele in enumerate(value):
+                    if ele is link:
+                        value[idx] = resource
+
+    @staticmethod
+    def raw_value(value):
+        """Create a copy of a field value as returned from the API.
+
+        :param value: Field value.
+        :return: Value with links in their JSON representation.
+        """
+        if isinstance(value, ResourceLink):
+            return value.to_json()
+        elif isinstance(value, Resource):
+            return ResourceLink.json_for(value.sys['type'], value.sys['id'])
+        elif isinstance(value, list):
+            return [Entry.raw_value(v) for v in value]
+        elif isinstance(value, dict):
+            return dict((k, Entry.raw_value(v)) for k, v in value.items())
+        return value
 
 
 class Space(Resource):
@@ -197,6 +506,8 @@ class Space(Resource):
     Attributes:
       name (str): Name of the Space.
     """
+    __slots__ = ('name',)
+
     def __init__(self, sys=None):
         """Space constructor.
 
@@ -207,11 +518,118 @@ class Space(Resource):
         self.name = None
 
 
+class DeletedAsset(Resource):
+    """CDA resource of type DeletedAsset, only carrying system attributes."""
+    __slots__ = ()
+
+
+class DeletedEntry(Resource):
+    """CDA resource of type DeletedEntry, only carrying system attributes."""
+    __slots__ = ()
+
+
+class SyncPage(Resource):
+    """Single page of a synchronization response.
+
+    **Attributes**:
+
+    - items (list): Resources contained within the page.
+    - next_page_url (str): URL of the next page, `None` for the last page.
+    - next_sync_url (str): URL for the next synchronization, only set for the last page.
+    """
+    __slots__ = ('items', 'next_page_url', 'next_sync_url')
+
+    def __init__(self, sys=None):
+        """SyncPage constructor.
+
+        :param sys: (dict) resource system attributes.
+        :return: :class:`.SyncPage` instance.
+        """
+        super(SyncPage, self).__init__(sys)
+        self.items = []
+        self.next_page_url = None
+        self.next_sync_url = None
+
+    def __iter__(self):
+        # Proxy to the `items` attribute
+        return iter(self.items)
+
+    @staticmethod
+    def token_from_url(url):
+        """Extract the `sync_token` query parameter of a synchronization URL.
+
+        :param url: (str) URL.
+        :return: sync token as str.
+        """
+        return parse_qs(urlparse(url).query)['sync_token'][0]
+
+
+class SyncResult(object):
+    """Outcome of a synchronization, merging all of its pages.
+
+    Entries and Assets are considered added either for an initial synchronization,
+    or when published for the first time (i.e. at `sys.revision` 1), otherwise they are
+    considered updated. Fields of synchronized Entries and Assets contain values for all locales.
+
+    **Attributes**:
+
+    - initial (bool): Indicates whether this is the result of an initial synchronization.
+    - items (list): All resources in the order returned by the API.
+    - added (list): :class:`.Entry` and :class:`.Asset` instances added since the previous synchronization.
+    - updated (list): :class:`.Entry` and :class:`.Asset` instances updated since the previous synchronization.
+    - deleted (list): :class:`.DeletedEntry` and :class:`.DeletedAsset` instances.
+    - next_sync_url (str): URL for the next synchronization.
+    - sync_token (str): Token for the next synchronization, see :func:`.Client.sync`.
+    """
+    def __init__(self, initial):
+        """SyncResult constructor.
+
+        :param initial: (bool) Indicates whether this is the result of an initial synchronization.
+        :return: :class:`.SyncResult` instance.
+        """
+        super(SyncResult, self).__init__()
+        self.initial = initial
+        self.items = []
+        self.added = []
+        self.updated = []
+        self.deleted = []
+        self.next_sync_url = None
+        self.sync_token = None
+
+    def __iter__(self):
+        # Proxy to the `items` attribute
+        return iter(self.items)
+
+    def add_page(self, page):
+        """Add the resources of a :class:`.SyncPage` to this result.
+
+        :param page: :class:`.SyncPage` instance.
+        :return: query parameters for retrieving the next page, `None` if this was the last page.
+        """
+        for item in page.items:
+            self.items.append(item)
+            if isinstance(item, (DeletedAsset, DeletedEntry)):
+                self.deleted.append(item)
+            elif self.initial or item.sys.get('revision') == 1:
+                self.added.append(item)
+            else:
+                self.updated.append(item)
+
+        if page.next_sync_url is not None:
+            self.next_sync_url = page.next_sync_url
+            self.sync_token = SyncPage.token_from_url(page.next_sync_url)
+            return None
+
+        return {'sync_token': SyncPage.token_from_url(page.next_page_url)}
+
+
 class ResourceType(Enum):
     """Enum of CDA resource types."""
     Array = 'Array'
     Asset = 'Asset'
     ContentType = 'ContentType'
+    DeletedAsset = 'DeletedAsset'
+    DeletedEntry = 'DeletedEntry'
     Entry = 'Entry'
     Link = 'Link'
     Space = 'Space'
@@ -219,6 +637,8 @@ class ResourceType(Enum):
 
 class ResourceLink(object):
     """Represents a link to a CDA resource."""
+    __slots__ = ('resource_id', 'link_type')
+
     def __init__(self, sys):
         """ResourceLink constructor.
 
@@ -228,4 +648,27 @@ class ResourceLink(object):
         super(ResourceLink, self).__init__()
 
         self.resource_id = sys['id']
-        self.link_type = sys['linkType']
\ No newline at end of file
+        self.link_type = sys['linkType']
+
+    def __getstate__(self):
+        return _get_state(self)
+
+    def __setstate__(self, state):
+        _set_state(self, state)
+
+    def to_json(self):
+        """Create the JSON representation of this link.
+
+        :return: JSON dict.
+        """
+        return ResourceLink.json_for(self.link_type, self.resource_id)
+
+    @staticmethod
+    def json_for(link_type, resource_id):
+        """Create the JSON representation of a link.
+
+        :param link_type: (str) Type of the linked resource.
+        :param resource_id: (str) ID of the linked resource.
+        :return: JSON dict.
+        """
+        return {'sys': {'type': ResourceType.Link.value, 'linkType': link_type, 'id': resource_id}}
\ No newline at end of file
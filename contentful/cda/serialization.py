@@ -5,31 +5,100 @@ Classes provided include:
 :class:`ResourceFactory` - Factory for generating :class:`.resources.Resource` subclasses out of JSON data.
 """
 from .fields import Boolean, Date, Number, Object, Symbol, Text, List, MultipleAssets, MultipleEntries
-from .resources import ResourceType, Array, Entry, Asset, Space, ContentType, ResourceLink
-from dateutil import parser
+from .resources import ResourceType, Array, Entry, Asset, Space, ContentType, ResourceLink, SyncPage
+from .resources import DeletedAsset, DeletedEntry
+from .dates import DateParser
 import ast
 import copy
 
 
+def _convert_boolean(value):
+    return value if isinstance(value, bool) else bool(value)
+
+
+def _convert_number(value):
+    return value if isinstance(value, int) else int(value)
+
+
+def _convert_object(value):
+    return value if isinstance(value, dict) else ast.literal_eval(value)
+
+
+def _convert_text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+def _convert_list(value):
+    return value if isinstance(value, list) else [value]
+
+
 class ResourceFactory(object):
     """Factory for generating :class:`.resources.Resource` subclasses out of JSON data.
 
+    A factory is safe to use from multiple threads, as its attributes are not modified after
+    construction (the memo of the `date_parser` is synchronized). With `lazy_fields`, concurrent
+    first accesses of a field of the same Entry may both convert the value, with the same result.
+
     Attributes:
       entries_mapping (dict): Mapping of Content Type IDs to custom Entry subclasses.
+      lazy_fields (bool): Indicates whether field values of custom Entry subclasses are converted
+        on first access of the attribute, rather than when the Entry is created. Such Entries keep
+        the converters of their pending fields, taken from the plan, but no reference to the factory.
+      lazy_raw_fields (bool): Indicates whether `raw_fields` of Entries are rebuilt on first access,
+        rather than copied when the Entry is created.
+      date_parser (:class:`.dates.DateParser`): Parser for values of `Date` fields.
+      plans (dict): Conversion plans of custom Entry subclasses mapped by Content Type ID,
+        see :func:`plan_for`.
+    """
+    CONVERTERS = {
+        Boolean: _convert_boolean,
+        Number: _convert_number,
+        Object: _convert_object,
+        Text: _convert_text,
+        Symbol: _convert_text,
+        List: _convert_list,
+        MultipleAssets: _convert_list,
+        MultipleEntries: _convert_list
+    }
+    """Converter functions mapped by field type, values of other field types are not converted.
+
+    No need to convert :class:`.fields.Link` types as the expected value should be
+    of type :class:`.resources.ResourceLink` for links.
     """
-    def __init__(self, custom_entries):
+
+    DATE_PARSER = DateParser()
+
+    def __init__(self, custom_entries, lazy_fields=False, lazy_raw_fields=False, date_parser=None):
         """ResourceFactory constructor.
 
         :param custom_entries: list of custom Entry subclasses.
+        :param lazy_fields: (bool) Indicates whether to convert field values on first access.
+        :param lazy_raw_fields: (bool) Indicates whether to rebuild `raw_fields` on first access.
+        :param date_parser: Optional :class:`.dates.DateParser`, e.g. with a memo for repeated dates.
         :return: ResourceFactory instance.
         """
         super(ResourceFactory, self).__init__()
+        self.lazy_fields = lazy_fields
+        self.lazy_raw_fields = lazy_raw_fields
+        self.date_parser = date_parser or DateParser()
 
         self.entries_mapping = {}
+        self.plans = {}
         if custom_entries is not None:
             for c in custom_entries:
                 ct = c.__content_type__
                 self.entries_mapping[ct] = c
+                self.plans[ct] = self.plan_for(c)
+
+        self.creators = {
+            ResourceType.Array.value: self._create_array_or_sync_page,
+            ResourceType.Entry.value: self.create_entry,
+            ResourceType.Asset.value: ResourceFactory.create_asset,
+            ResourceType.ContentType.value: ResourceFactory.create_content_type,
+            ResourceType.Space.value: ResourceFactory.create_space,
+            ResourceType.DeletedEntry.value: lambda json: DeletedEntry(json['sys']),
+            ResourceType.DeletedAsset.value: lambda json: DeletedAsset(json['sys'])
+        }
 
     def from_json(self, json):
         """Create resource out of JSON data.
@@ -37,18 +106,48 @@ class ResourceFactory(object):
         :param json: JSON dict.
         :return: Resource with a type defined by the given JSON data.
         """
-        res_type = json['sys']['type']
-
-        if ResourceType.Array.value == res_type:
-            return self.create_array(json)
-        elif ResourceType.Entry.value == res_type:
-            return self.create_entry(json)
-        elif ResourceType.Asset.value == res_type:
-            return ResourceFactory.create_asset(json)
-        elif ResourceType.ContentType.value == res_type:
-            return ResourceFactory.create_content_type(json)
-        elif ResourceType.Space.value == res_type:
-            return ResourceFactory.create_space(json)
+        creator = self.creators.get(json['sys']['type'])
+        return None if creator is None else creator(json)
+
+    def plan_for(self, clazz):
+        """Create the conversion plan of a custom Entry subclass.
+
+        :param clazz: Custom :class:`.resources.Entry` subclass.
+        :return: list of `(attribute, field_id, converter)` tuples, `converter` being `None`
+            for values which are not converted.
+        """
+        return [(attribute, field.field_id, self.converter_for(field.field_type))
+                for attribute, field in clazz.__entry_fields__.items()]
+
+    def converter_for(self, field_type):
+        """Find the converter function for a field type.
+
+        :param field_type: :class:`.fields.FieldType` subclass.
+        :return: function converting a single value, `None` if values are not converted.
+        """
+        if field_type is Date:
+            return self.date_parser
+        return ResourceFactory.CONVERTERS.get(field_type)
+
+    @staticmethod
+    def to_json(resource):
+        """Create JSON data out of an :class:`.resources.Entry`, :class:`.resources.Asset`
+        or :class:`.resources.ContentType`, the inverse of :func:`from_json`.
+
+        Entries are serialized using their `raw_fields`, i.e. links are not resolved.
+
+        :param resource: Resource instance.
+        :return: JSON dict.
+        """
+        if isinstance(resource, Entry):
+            return {'sys': resource.sys, 'fields': resource.raw_fields}
+        elif isinstance(resource, Asset):
+            return {'sys': resource.sys, 'fields': resource.fields}
+        elif isinstance(resource, ContentType):
+            return {'sys': resource.sys, 'name': resource.name, 'displayField': resource.display_field,
+                    'fields': [dict(field, id=field_id) for field_id, field in resource.fields.items()]}
+
+        raise Exception('Cannot serialize resource \"{0}\".'.format(resource))
 
     @staticmethod
     def _extract_link(obj):
@@ -61,42 +160,56 @@ class ResourceFactory(object):
 
         return None
 
-    def create_entry(self, json):
+    def create_entry(self, json, localized=False):
         """Create :class:`.resources.Entry` from JSON.
 
         :param json: JSON dict.
+        :param localized: (bool) Indicates whether the fields contain values for all locales
+            (as returned by the synchronization API), in which case a plain :class:`.resources.Entry`
+            is created even if a custom Entry subclass is registered for the Content Type.
         :return: Entry instance.
         """
         sys = json['sys']
         ct = sys['contentType']['sys']['id']
         fields = json['fields']
-        raw_fields = copy.deepcopy(fields)
+        raw_fields = None if self.lazy_raw_fields else copy.deepcopy(fields)
 
-        # Replace links with :class:`.resources.ResourceLink` objects.
+        # Replace links with :class:`.resources.ResourceLink` objects, recording their positions.
+        links = []
         for k, v in fields.items():
             link = ResourceFactory._extract_link(v)
             if link is not None:
                 fields[k] = link
+                links.append((fields, k))
             elif isinstance(v, list):
                 for idx, ele in enumerate(v):
                     link = ResourceFactory._extract_link(ele)
                     if link is not None:
                         v[idx] = link
-
-        if ct in self.entries_mapping:
-            clazz = self.entries_mapping[ct]
-            result = clazz()
-
-            for k, v in clazz.__entry_fields__.items():
-                field_value = fields.get(v.field_id)
-                if field_value is not None:
-                    setattr(result, k, ResourceFactory.convert_value(field_value, v))
+                        links.append((v, idx))
+
+        if ct in self.entries_mapping and not localized:
+            result = self.entries_mapping[ct]()
+            plan = self.plans[ct]
+
+            if self.lazy_fields:
+                # Set up the dict of converted values now, so concurrent first accesses share it.
+                result._cf_cda = {}
+                result._cf_cda_pending = dict((field_id, converter) for _, field_id, converter in plan)
+            else:
+                values = {}
+                for _, field_id, converter in plan:
+                    value = fields.get(field_id)
+                    if value is not None:
+                        values[field_id] = value if converter is None else converter(value)
+                result._cf_cda = values
         else:
             result = Entry()
 
         result.sys = sys
         result.fields = fields
         result.raw_fields = raw_fields
+        result._cf_links = links
 
         return result
 
@@ -108,10 +221,10 @@ class ResourceFactory(object):
         :return: Asset instance.
         """
         result = Asset(json['sys'])
-        file_dict = json['fields']['file']
+        file_dict = json['fields'].get('file') or {}
         result.fields = json['fields']
-        result.url = file_dict['url']
-        result.mimeType = file_dict['contentType']
+        result.url = file_dict.get('url')
+        result.mimeType = file_dict.get('contentType')
         return result
 
     @staticmethod
@@ -145,45 +258,20 @@ class ResourceFactory(object):
         return result
 
     @staticmethod
-    def convert_value(value, field):
+    def convert_value(value, field, date_parser=None):
         """Given a :class:`.fields.Field` and a value, ensure that the value matches the given type, otherwise
         attempt to convert it.
 
         :param value: field value.
         :param field: :class:`.fields.Field` instance.
+        :param date_parser: Optional :class:`.dates.DateParser` for `Date` fields.
         :return: Result value.
         """
-        clz = field.field_type
-
-        if clz is Boolean:
-            if not isinstance(value, bool):
-                return bool(value)
-
-        elif clz is Date:
-            if not isinstance(value, str):
-                value = str(value)
-            return parser.parse(value)
+        if field.field_type is Date:
+            return (date_parser or ResourceFactory.DATE_PARSER).parse(value)
 
-        elif clz is Number:
-            if not isinstance(value, int):
-                return int(value)
-
-        elif clz is Object:
-            if not isinstance(value, dict):
-                return ast.literal_eval(value)
-
-        elif clz is Text or clz is Symbol:
-            if not isinstance(value, str):
-                return str(value)
-
-        elif clz is List or clz is MultipleAssets or clz is MultipleEntries:
-            if not isinstance(value, list):
-                return [value]
-
-        # No need to convert :class:`.fields.Link` types as the expected value
-        # should be of type :class:`.resources.ResourceLink` for links.
-
-        return value
+        converter = ResourceFactory.CONVERTERS.get(field.field_type)
+        return value if converter is None else converter(value)
 
     # Array
     def process_array_items(self, array, json):
@@ -195,17 +283,8 @@ class ResourceFactory(object):
         :param json: Raw JSON dictionary.
         """
         for item in json['items']:
-            key = None
             processed = self.from_json(item)
-
-            if isinstance(processed, Asset):
-                key = 'Asset'
-            elif isinstance(processed, Entry):
-                key = 'Entry'
-
-            if key is not None:
-                array.items_mapped[key][processed.sys['id']] = processed
-
+            array.map_resource(processed)
             array.items.append(processed)
 
     def process_array_includes(self, array, json):
@@ -223,6 +302,29 @@ class ResourceFactory(object):
                     processed = self.from_json(resource)
                     array.items_mapped[key][processed.sys['id']] = processed
 
+    def _create_array_or_sync_page(self, json):
+        if 'nextSyncUrl' in json or 'nextPageUrl' in json:
+            return self.create_sync_page(json)
+        return self.create_array(json)
+
+    def create_sync_page(self, json):
+        """Create :class:`.resources.SyncPage` from JSON.
+
+        :param json: JSON dict.
+        :return: SyncPage instance.
+        """
+        result = SyncPage(json['sys'])
+        result.next_page_url = json.get('nextPageUrl')
+        result.next_sync_url = json.get('nextSyncUrl')
+
+        for item in json['items']:
+            if item['sys']['type'] == ResourceType.Entry.value:
+                result.items.append(self.create_entry(item, localized=True))
+            else:
+                result.items.append(self.from_json(item))
+
+        return result
+
     def create_array(self, json):
         """Create :class:`.resources.Array` from JSON.
 
@@ -0,0 +1,34 @@
+"""sessions module.
+
+Functions provided include:
+
+- :func:`create_session` - Create a pooled keep-alive HTTP session.
+"""
+from . import const
+from requests.adapters import HTTPAdapter
+import requests
+
+
+def create_session(pool_size=None, keep_alive=True):
+    """Create a :class:`requests.Session` holding a pool of persistent connections.
+
+    A session may be shared across multiple :class:`.Client` instances (and threads), in which
+    case connections to the API are reused between all of them, see the `session` argument
+    of :class:`.Client`.
+
+    :param pool_size: (int) Optional maximum number of connections kept open per host,
+        defaults to :data:`.const.POOL_SIZE`.
+    :param keep_alive: (bool) Indicates whether connections should be kept open between requests.
+    :return: :class:`requests.Session` instance.
+    """
+    pool_size = pool_size or const.POOL_SIZE
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
@@ -0,0 +1,217 @@
+"""store module.
+
+Classes provided include:
+
+- :class:`.SQLiteStore` - Persistent local copy of the content of a Space, backed by SQLite.
+"""
+from . import const
+from .resources import ResourceType, ContentType, DeletedAsset, DeletedEntry, Entry
+from .serialization import ResourceFactory
+import json
+import sqlite3
+import threading
+
+
+class SQLiteStore(object):
+    """Persistent local copy of the content of a Space, backed by SQLite.
+
+    The raw JSON of Entries, Assets and Content Types is stored keyed by type and `sys.id`,
+    and kept up to date by applying synchronizations (see :func:`.Client.sync`). Resources are
+    created on read using a :class:`.ResourceFactory`, so custom Entry subclasses are supported::
+
+        store = SQLiteStore('space.db', custom_entries=[Cat])
+        store.sync(client)          # initial synchronization, later only changes
+        cat = store.get_entry('nyancat')
+        cats = store.find_entries('cat')
+
+    Synchronized Entries and Assets contain field values for all locales, on read only the
+    values for the configured `locale` are kept.
+
+    **Attributes**:
+
+    - path (str): Path of the SQLite database.
+    - locale (str): Locale of field values for resources created on read.
+    - resource_factory (:class:`.ResourceFactory`): Factory for creating resources on read.
+    """
+    def __init__(self, path, custom_entries=None, locale=const.DEFAULT_LOCALE):
+        """SQLiteStore constructor.
+
+        :param path: (str) Path of the SQLite database, created if it does not exist.
+        :param custom_entries: (list) Optional list of custom :class:`.Entry` subclasses.
+        :param locale: (str) Locale of field values for resources created on read.
+        :return: :class:`.SQLiteStore` instance.
+        """
+        super(SQLiteStore, self).__init__()
+        self.path = path
+        self.locale = locale
+        self.resource_factory = ResourceFactory(custom_entries)
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS resources ('
+                'type TEXT NOT NULL, id TEXT NOT NULL, content_type TEXT, revision INTEGER, json TEXT NOT NULL, '
+                'PRIMARY KEY (type, id))')
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS resources_content_type ON resources (type, content_type)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+    @property
+    def sync_token(self):
+        """Token of the last synchronization applied to this store, `None` if there was none."""
+        with self.lock:
+            row = self.connection.execute('SELECT value FROM meta WHERE key = ?', ('sync_token',)).fetchone()
+        return None if row is None else row[0]
+
+    def sync(self, client):
+        """Synchronize this store, initially or using the token of the last synchronization.
+
+        :param client: :class:`.Client` instance.
+        :return: :class:`.SyncResult` instance as applied to this store.
+        """
+        sync_token = self.sync_token
+        if sync_token is None:
+            result = client.sync(initial=True)
+        else:
+            result = client.sync(sync_token)
+
+        self.apply_sync(result)
+        return result
+
+    def apply_sync(self, result):
+        """Apply a synchronization within a single transaction.
+
+        :param result: :class:`.SyncResult` instance.
+        """
+        with self.lock, self.connection:
+            for item in result.items:
+                if isinstance(item, DeletedEntry):
+                    self._delete(ResourceType.Entry.value, item.sys['id'])
+                elif isinstance(item, DeletedAsset):
+                    self._delete(ResourceType.Asset.value, item.sys['id'])
+                else:
+                    self._save(item)
+
+            self.connection.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                                    ('sync_token', result.sync_token))
+
+    def save(self, resources):
+        """Store the given resources within a single transaction, e.g. Content Types::
+
+            store.save(client.fetch(ContentType).all())
+
+        Field values of Entries and Assets are expected to be in the configured `locale`,
+        as returned by :func:`.Client.fetch`.
+
+        :param resources: iterable of :class:`.Entry`, :class:`.Asset` or :class:`.ContentType` instances.
+        """
+        with self.lock, self.connection:
+            for resource in resources:
+                self._save(resource, localize=True)
+
+    def get_entry(self, resource_id):
+        """Retrieve an Entry.
+
+        :param resource_id: (str) Entry ID.
+        :return: :class:`.Entry` (or custom subclass) instance, `None` if not found.
+        """
+        return self.get(ResourceType.Entry.value, resource_id)
+
+    def get_asset(self, resource_id):
+        """Retrieve an Asset.
+
+        :param resource_id: (str) Asset ID.
+        :return: :class:`.Asset` instance, `None` if not found.
+        """
+        return self.get(ResourceType.Asset.value, resource_id)
+
+    def get_content_type(self, resource_id):
+        """Retrieve a Content Type.
+
+        :param resource_id: (str) Content Type ID.
+        :return: :class:`.ContentType` instance, `None` if not found.
+        """
+        return self.get(ResourceType.ContentType.value, resource_id)
+
+    def get(self, resource_type, resource_id):
+        """Retrieve a resource by type and ID.
+
+        :param resource_type: (str) Resource type as str.
+        :param resource_id: (str) Resource ID.
+        :return: :class:`.Resource` subclass, `None` if not found.
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT json FROM resources WHERE type = ? AND id = ?',
+                                          (resource_type, resource_id)).fetchone()
+        return None if row is None else self._load(row[0])
+
+    def find_entries(self, content_type=None):
+        """Retrieve all Entries, optionally only those of a given Content Type.
+
+        :param content_type: (str) Optional Content Type ID.
+        :return: list of :class:`.Entry` (or custom subclass) instances.
+        """
+        query = 'SELECT json FROM resources WHERE type = ?'
+        args = (ResourceType.Entry.value,)
+        if content_type is not None:
+            query += ' AND content_type = ?'
+            args += (content_type,)
+
+        with self.lock:
+            rows = self.connection.execute(query + ' ORDER BY id', args).fetchall()
+        return [self._load(row[0]) for row in rows]
+
+    def resolve_resource_link(self, resource_link):
+        """Resolve a :class:`.ResourceLink` using the content of this store.
+
+        :param resource_link: (:class:`.ResourceLink`) instance.
+        :return: :class:`.Resource` subclass, `None` if not found.
+        """
+        return self.get(resource_link.link_type, resource_link.resource_id)
+
+    def count(self, resource_type=None):
+        """Count the stored resources.
+
+        :param resource_type: (str) Optional resource type as str.
+        :return: number of stored resources.
+        """
+        with self.lock:
+            if resource_type is None:
+                return self.connection.execute('SELECT COUNT(*) FROM resources').fetchone()[0]
+            return self.connection.execute('SELECT COUNT(*) FROM resources WHERE type = ?',
+                                           (resource_type,)).fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self.lock:
+            self.connection.close()
+
+    def _save(self, resource, localize=False):
+        dct = ResourceFactory.to_json(resource)
+        content_type = None
+        if isinstance(resource, Entry):
+            content_type = resource.sys['contentType']['sys']['id']
+
+        if localize and not isinstance(resource, ContentType):
+            dct['fields'] = dict((field_id, {self.locale: value}) for field_id, value in dct['fields'].items())
+
+        self.connection.execute(
+            'INSERT OR REPLACE INTO resources (type, id, content_type, revision, json) VALUES (?, ?, ?, ?, ?)',
+            (resource.sys['type'], resource.sys['id'], content_type, resource.sys.get('revision'), json.dumps(dct)))
+
+    def _delete(self, resource_type, resource_id):
+        self.connection.execute('DELETE FROM resources WHERE type = ? AND id = ?', (resource_type, resource_id))
+
+    def _load(self, raw):
+        dct = json.loads(raw)
+        if dct['sys']['type'] in (ResourceType.Entry.value, ResourceType.Asset.value):
+            dct['fields'] = self._delocalize(dct['fields'])
+        return self.resource_factory.from_json(dct)
+
+    def _delocalize(self, fields):
+        result = {}
+        for field_id, value in fields.items():
+            if isinstance(value, dict) and self.locale in value:
+                result[field_id] = value[self.locale]
+        return result
@@ -0,0 +1,174 @@
+"""streaming module.
+
+Classes provided include:
+
+- :class:`.ArrayStreamParser` - Incremental parser of Array responses.
+"""
+import codecs
+import json
+import re
+import six
+
+
+class ArrayStreamParser(object):
+    """Incremental parser of Array responses, emitting every element of `items` as soon as it has been received.
+
+    Chunks of the raw response body are passed to :func:`feed`, which returns the events parsed so
+    far as `(key, value)` tuples: one event per element of the streamed arrays (by default `items`),
+    and one event per other member of the top level object (e.g. `total` or `includes`)::
+
+        parser = ArrayStreamParser()
+        for chunk in response.iter_content(64 * 1024):
+            for key, value in parser.feed(chunk):
+                dosomething(key, value)
+        parser.close()
+
+    Only a single element, or member, is kept decoded at a time, the remainder of the body is
+    buffered until it is complete.
+
+    **Attributes**:
+
+    - stream_keys (tuple): Keys of the top level arrays whose elements are emitted one by one.
+    - done (bool): Indicates whether the end of the top level object has been reached.
+    """
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    START, KEY, COLON, VALUE, ELEMENT, DONE = range(6)
+
+    def __init__(self, stream_keys=('items',)):
+        """ArrayStreamParser constructor.
+
+        :param stream_keys: (tuple) Keys of the top level arrays whose elements are emitted one by one.
+        :return: :class:`.ArrayStreamParser` instance.
+        """
+        super(ArrayStreamParser, self).__init__()
+        self.stream_keys = stream_keys
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = six.text_type()
+        self.pos = 0
+        self.state = ArrayStreamParser.START
+        self.key = None
+        self.first = True
+        self.wanted = 0
+
+    @property
+    def done(self):
+        return self.state == ArrayStreamParser.DONE
+
+    def feed(self, chunk):
+        """Parse the next chunk of the body.
+
+        :param chunk: (bytes) Next chunk of the raw response body.
+        :return: list of `(key, value)` events.
+        :raises ValueError: in case the body is not a JSON object.
+        """
+        self.buffer += self.text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self):
+        """Parse the remainder of the body, once all chunks were passed to :func:`feed`.
+
+        :return: list of `(key, value)` events.
+        :raises ValueError: in case the body is incomplete or not a JSON object.
+        """
+        self.buffer += self.text_decoder.decode(b'', final=True)
+        events = self._parse(final=True)
+        if not self.done:
+            raise ValueError('Incomplete JSON object.')
+        return events
+
+    def _parse(self, final):
+        events = []
+        while self.state != ArrayStreamParser.DONE:
+            self.pos = ArrayStreamParser.WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos >= len(self.buffer):
+                break
+
+            char = self.buffer[self.pos]
+            if self.state == ArrayStreamParser.START:
+                self._expect(char, '{')
+                self.state = ArrayStreamParser.KEY
+                self.first = True
+
+            elif self.state == ArrayStreamParser.KEY:
+                if char == '}':
+                    self.pos += 1
+                    self.state = ArrayStreamParser.DONE
+                elif not self.first:
+                    self._expect(char, ',')
+                    self.first = True
+                else:
+                    key = self._decode(final)
+                    if key is None:
+                        break
+                    if not isinstance(key, six.text_type):
+                        raise ValueError('Expected a key at position {0}.'.format(self.pos))
+                    self.key = key
+                    self.state = ArrayStreamParser.COLON
+
+            elif self.state == ArrayStreamParser.COLON:
+                self._expect(char, ':')
+                self.state = ArrayStreamParser.VALUE
+
+            elif self.state == ArrayStreamParser.VALUE:
+                if char == '[' and self.key in self.stream_keys:
+                    self.pos += 1
+                    self.state = ArrayStreamParser.ELEMENT
+                    self.first = True
+                else:
+                    value = self._decode(final)
+                    if value is None:
+                        break
+                    events.append((self.key, value))
+                    self.state = ArrayStreamParser.KEY
+                    self.first = False
+
+            elif self.state == ArrayStreamParser.ELEMENT:
+                if char == ']':
+                    self.pos += 1
+                    self.state = ArrayStreamParser.KEY
+                    self.first = False
+                elif not self.first:
+                    self._expect(char, ',')
+                    self.first = True
+                else:
+                    value = self._decode(final)
+                    if value is None:
+                        break
+                    events.append((self.key, value))
+                    self.first = False
+
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        return events
+
+    def _expect(self, char, expected):
+        if char != expected:
+            raise ValueError('Expected "{0}" at position {1}, found "{2}".'.format(expected, self.pos, char))
+        self.pos += 1
+
+    def _decode(self, final):
+        # Decode a single value starting at the current position, `None` if it is not complete yet.
+        # A value reaching up to the end of the buffer may still be incomplete (e.g. a number).
+        # Failed attempts are only repeated once the pending input doubled, to avoid quadratic
+        # behavior for large values arriving in many chunks.
+        pending = len(self.buffer) - self.pos
+        if not final and pending < self.wanted:
+            return None
+
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.pos)
+        except ValueError:
+            if final:
+                raise
+            self.wanted = 2 * pending
+            return None
+
+        if end >= len(self.buffer) and not final:
+            self.wanted = pending + 1
+            return None
+
+        self.pos = end
+        self.wanted = 0
+        return value
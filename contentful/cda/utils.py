@@ -22,3 +22,32 @@ def class_for_type(resource_type):
         return Entry
     elif resource_type == ResourceType.Space.value:
         return Space
+
+
+def chunk_ids(ids, max_length=const.MAX_IDS_QUERY_LENGTH, max_count=const.MAX_PAGE_SIZE):
+    """Split resource IDs into chunks fitting a single `sys.id[in]` query.
+
+    :param ids: iterable of resource IDs.
+    :param max_length: (int) Maximum length of the comma separated IDs of a chunk.
+    :param max_count: (int) Maximum number of IDs in a chunk.
+    :return: list of lists of resource IDs.
+    """
+    chunks = []
+    chunk = []
+    length = 0
+
+    for resource_id in ids:
+        added = len(resource_id) + (1 if chunk else 0)
+        if chunk and (length + added > max_length or len(chunk) >= max_count):
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+            added = len(resource_id)
+
+        chunk.append(resource_id)
+        length += added
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
@@ -5,6 +5,7 @@ CHANGES='CHANGES.rst'
 RELEASE_NOTES='release_notes.tmp'
 GITHUB_RELEASE='github-release'
 SPHINX_BUILD='sphinx-build'
+BENCHMARK_BASELINE='benchmarks/baseline.json'
 
 ROOT=`pwd`
 set -e
@@ -52,6 +53,11 @@ function release_perform() {
     # Execute tests
     python setup.py test
 
+    # Check for performance regressions
+    if [ -f "${BENCHMARK_BASELINE}" ]; then
+        python -m benchmarks.suite --compare ${BENCHMARK_BASELINE}
+    fi
+
     # Update version
     set_version ${version}
 
@@ -36,6 +36,9 @@ deps = [
     'python-dateutil==2.3'
 ]
 
+if sys.version_info < (3, 2):
+    deps.append('futures==3.0.5')
+
 test_deps = [
     'mock',
     'vcrpy==1.7.4',
@@ -56,6 +59,7 @@ setup(
     description='Python SDK for Contentful\'s Content Delivery API',
     long_description=readme,
     install_requires=deps,
+    extras_require={'aio': ['aiohttp'], 'speedups': ['orjson']},
     tests_require=test_deps,
     cmdclass={'test': PyTest},
     classifiers=[
@@ -0,0 +1,11 @@
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 7):
+    # The asyncio client requires async generators and asyncio.run()
+    collect_ignore.append('test_aio.py')
+
+if sys.version_info < (3, 4):
+    # The benchmarks measure memory using tracemalloc
+    collect_ignore.append('test_benchmarks.py')
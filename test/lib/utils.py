@@ -1,3 +1,5 @@
+import json
+from requests import Response
 from contentful.cda.client import Config, Client
 from contentful.cda.fields import Field, Text, Number, List, Date, Link
 from contentful.cda.resources import Asset, ContentType, Entry
@@ -53,7 +55,7 @@ def fetch_array_and_assert(test_case, resource_type, cassette_name, last_path_se
         # response
         req = client.fetch(resource_type)
         if query is not None:
-            req.where(query)
+            req = req.where(query)
 
         result = req.all()
         for resource in result:
@@ -100,4 +102,109 @@ class Cat(Entry):
     lives = Field(Number)
     likes = Field(List)
     birthday = Field(Date)
-    best_friend = Field(Link, field_id='bestFriend')
\ No newline at end of file
+    best_friend = Field(Link, field_id='bestFriend')
+
+
+class FakeHttpClient(object):
+    """Stand-in for the `requests` module, serving responses produced by a handler function."""
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        params = dict(params or {})
+        self.requests.append((url, params))
+        return self.handler(url, params)
+
+
+def make_response(body=None, status_code=200, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = b'' if body is None else json.dumps(body).encode('utf-8')
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+def link_json(resource_id, link_type='Entry'):
+    return {'sys': {'type': 'Link', 'linkType': link_type, 'id': resource_id}}
+
+
+def entry_json(entry_id, fields=None, content_type='cat'):
+    return {
+        'sys': {'type': 'Entry', 'id': entry_id, 'revision': 1,
+                'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}},
+        'fields': fields if fields is not None else {'name': entry_id}
+    }
+
+
+def asset_json(asset_id):
+    return {
+        'sys': {'type': 'Asset', 'id': asset_id, 'revision': 1},
+        'fields': {'title': asset_id, 'file': {'url': '//images/{0}.png'.format(asset_id), 'contentType': 'image/png'}}
+    }
+
+
+def array_json(items, total=None, skip=0, limit=100, includes=None):
+    result = {'sys': {'type': 'Array'}, 'total': len(items) if total is None else total, 'skip': skip,
+              'limit': limit, 'items': items}
+    if includes is not None:
+        result['includes'] = includes
+    return result
+
+
+def paged_handler(items, includes=None):
+    """Create a handler serving `items` honoring the `skip` and `limit` parameters."""
+    def handler(url, params):
+        skip = int(params.get('skip', 0))
+        limit = int(params.get('limit', 100))
+        page = json.loads(json.dumps(items[skip:skip + limit]))
+        return make_response(array_json(page, len(items), skip, limit, json.loads(json.dumps(includes))))
+    return handler
+
+
+def fake_client(handler, client=None, **kwargs):
+    if client is None:
+        client = Client(DEMO_SPACE_ID, DEMO_ACCESS_TOKEN, **kwargs)
+    client.dispatcher.httpclient = FakeHttpClient(handler)
+    return client
+
+
+def sync_handler(pages):
+    """Create a handler serving synchronization `pages`, mapped by `sync_token` (or `initial`)."""
+    def handler(url, params):
+        items, next_page, next_sync = pages[params.get('sync_token', 'initial')]
+        body = {'sys': {'type': 'Array'}, 'items': json.loads(json.dumps(items))}
+        if next_page is not None:
+            body['nextPageUrl'] = 'https://cdn.contentful.com/spaces/{0}/sync?sync_token={1}'.format(DEMO_SPACE_ID,
+                                                                                                        next_page)
+        else:
+            body['nextSyncUrl'] = 'https://cdn.contentful.com/spaces/{0}/sync?sync_token={1}'.format(DEMO_SPACE_ID,
+                                                                                                        next_sync)
+        return make_response(body)
+    return handler
+
+
+def localized_entry_json(entry_id, revision=1, content_type='cat', locale='en-US'):
+    result = entry_json(entry_id, {'name': {locale: entry_id}, 'bestFriend': {locale: link_json('nyancat')}},
+                        content_type)
+    result['sys']['revision'] = revision
+    return result
+
+
+def localized_asset_json(asset_id, locale='en-US'):
+    result = asset_json(asset_id)
+    result['fields'] = dict((field_id, {locale: value}) for field_id, value in result['fields'].items())
+    return result
+
+
+def deleted_json(resource_id, resource_type='DeletedEntry'):
+    return {'sys': {'type': resource_type, 'id': resource_id, 'revision': 1}}
+
+
+SYNC_PAGES = {
+    'initial': ([localized_entry_json('nyancat'), localized_asset_json('nyancat-image')], 'page2', None),
+    'page2': ([localized_entry_json('happycat')], None, 'token1'),
+    'token1': ([localized_entry_json('nyancat', 2), localized_entry_json('garfield'), deleted_json('happycat'),
+                deleted_json('nyancat-image', 'DeletedAsset')], None, 'token2')
+}
@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+from contentful.cda import utils
+from contentful.cda.aio import AsyncClient, AsyncTransport, TransportResponse
+from contentful.cda.errors import NotFound
+from contentful.cda.hooks import HistogramCollector
+from contentful.cda.resources import Entry, ResourceLink, Space
+from test import BaseTestCase
+from test.lib.utils import Cat, DEMO_SPACE_ID, DEMO_ACCESS_TOKEN, array_json, entry_json, link_json, make_response
+from test.lib.utils import paged_handler
+from test.lib.utils import sync_handler, SYNC_PAGES
+
+FRIEND_ID = 'friend-{0:032d}'
+
+
+class FakeTransport(AsyncTransport):
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.closed = False
+
+    async def get(self, url, params=None, headers=None):
+        params = dict(params or {})
+        self.requests.append((url, params))
+        await asyncio.sleep(0)
+        r = self.handler(url, params)
+        return TransportResponse(r.status_code, r.content, r.headers)
+
+    async def close(self):
+        self.closed = True
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class AsyncClientTestCase(BaseTestCase):
+    def setUp(self):
+        super(AsyncClientTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': 'cat{0}'.format(i), 'bestFriend': link_json('cat0')})
+                 for i in range(25)]
+        self.transport = FakeTransport(paged_handler(items))
+        self.client = AsyncClient(DEMO_SPACE_ID, DEMO_ACCESS_TOKEN, [Cat], transport=self.transport)
+
+    def test_all(self):
+        result = run(self.client.fetch(Cat).all())
+        self.assertEqual(25, len(result.items))
+        self.assertIsInstance(result[0], Cat)
+        self.assertIs(result[0], result[3].best_friend)
+
+        url, params = self.transport.requests[0]
+        self.assertEqual('https://cdn.contentful.com/spaces/cfexampleapi/entries', url)
+        self.assertEqual({'content_type': 'cat'}, params)
+
+    def test_first(self):
+        request = self.client.fetch(Entry)
+        result = run(request.first())
+        self.assertEqual('cat0', result.sys['id'])
+        self.assertEqual({}, request.params)
+        self.assertEqual(1, self.transport.requests[0][1]['limit'])
+
+    def test_iter_all(self):
+        async def collect():
+            return [entry async for entry in self.client.fetch(Entry).iter_all(page_size=10)]
+
+        result = run(collect())
+        self.assertEqual(['cat{0}'.format(i) for i in range(25)], [e.sys['id'] for e in result])
+        self.assertEqual([0, 10, 20], [params['skip'] for url, params in self.transport.requests])
+
+    def test_iter_all_shared_includes(self):
+        async def collect():
+            return [cat async for cat in self.client.fetch(Cat).iter_all(page_size=10, shared_includes=True)]
+
+        result = run(collect())
+        self.assertEqual(25, len(result))
+        for cat in result:
+            self.assertIs(result[0], cat.best_friend)
+
+    def test_all_pages(self):
+        result = run(self.client.fetch(Cat).all_pages(page_size=10, max_workers=2))
+        self.assertEqual(['cat{0}'.format(i) for i in range(25)], [e.sys['id'] for e in result])
+        for cat in result:
+            self.assertIs(result[0], cat.best_friend)
+
+    def test_resolve(self):
+        link = ResourceLink(link_json('cat7')['sys'])
+        resolved = run(self.client.resolve_resource_link(link))
+        self.assertIsInstance(resolved, Cat)
+
+    def test_resolve_array_links(self):
+        def handler(url, params):
+            if 'sys.id[in]' not in params:
+                friends = [link_json(FRIEND_ID.format(i)) for i in range(300)]
+                return make_response(array_json([entry_json('lister', {'friends': friends})]))
+            ids = params['sys.id[in]'].split(',')
+            return make_response(array_json([entry_json(resource_id) for resource_id in ids]))
+
+        self.transport.handler = handler
+        array = run(self.client.fetch(Entry).all())
+        result = run(self.client.resolve_array_links(array, max_workers=2))
+
+        self.assertIs(array, result)
+        self.assertEqual([FRIEND_ID.format(i) for i in range(300)],
+                         [e.sys['id'] for e in array[0].fields['friends']])
+        self.assertEqual(set(), array.unresolved_links())
+        chunks = utils.chunk_ids(sorted(FRIEND_ID.format(i) for i in range(300)))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(1 + len(chunks), len(self.transport.requests))
+
+    def test_fetch_space(self):
+        self.transport.handler = lambda url, params: TransportResponse(
+            200, json.dumps({'sys': {'type': 'Space', 'id': DEMO_SPACE_ID}, 'name': 'Demo'}).encode('utf-8'))
+        space = run(self.client.fetch_space())
+        self.assertIsInstance(space, Space)
+        self.assertEqual('Demo', space.name)
+
+    def test_sync(self):
+        self.transport.handler = sync_handler(SYNC_PAGES)
+        result = run(self.client.sync(initial=True))
+        self.assertEqual(['nyancat', 'nyancat-image', 'happycat'], [r.sys['id'] for r in result])
+        self.assertEqual('token1', result.sync_token)
+
+    def test_observers(self):
+        collector = HistogramCollector()
+        client = AsyncClient(DEMO_SPACE_ID, DEMO_ACCESS_TOKEN, [Cat], transport=self.transport, observers=[collector])
+        run(client.fetch(Cat).all())
+
+        self.assertEqual(1, collector.histogram('entries', 'network_time').count)
+        self.assertEqual(1, collector.histogram('entries', 'build_time').count)
+        self.assertEqual(1, collector.histogram('entries', 'resolve_time').count)
+
+    def test_stream(self):
+        async def collect():
+            return [cat async for cat in self.client.fetch(Cat).where({'limit': 25}).stream(chunk_size=64)]
+
+        result = run(collect())
+        self.assertEqual(['cat{0}'.format(i) for i in range(25)], [cat.sys['id'] for cat in result])
+        self.assertIsInstance(result[0], Cat)
+        self.assertIs(result[0], result[3].best_friend)
+
+    def test_stream_observers(self):
+        collector = HistogramCollector()
+        client = AsyncClient(DEMO_SPACE_ID, DEMO_ACCESS_TOKEN, [Cat], transport=self.transport, observers=[collector])
+
+        async def collect():
+            return [cat async for cat in client.fetch(Cat).stream()]
+
+        run(collect())
+        self.assertEqual(1, collector.histogram('entries', 'total_time').count)
+        self.assertTrue(collector.histogram('entries', 'response_bytes').maximum > 0)
+
+    def test_stream_raises_mapped_apierror(self):
+        self.transport.handler = lambda url, params: TransportResponse(404, b'Not Found')
+
+        async def collect():
+            return [entry async for entry in self.client.fetch(Entry).stream()]
+
+        self.assertRaises(NotFound, run, collect())
+
+    def test_raises_mapped_apierror(self):
+        self.transport.handler = lambda url, params: TransportResponse(404, b'Not Found')
+        self.assertRaises(NotFound, run, self.client.fetch(Entry).all())
+
+    def test_close(self):
+        async def use():
+            async with self.client:
+                pass
+
+        run(use())
+        self.assertFalse(self.transport.closed)
+
+    def test_sync_context_manager_fails(self):
+        with self.assertRaises(TypeError):
+            with self.client:
+                pass
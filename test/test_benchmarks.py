@@ -0,0 +1,114 @@
+from benchmarks import loadtest, payloads, suite
+from benchmarks.fake_cda import FakeCDA, FakeSpace
+from contentful.cda.client import Client
+from contentful.cda.errors import RateLimitExceeded
+from contentful.cda.ratelimit import RetryPolicy
+from contentful.cda.resources import Asset, ContentType, Entry
+from contentful.cda.serialization import ResourceFactory
+from test import BaseTestCase
+import json
+import os
+import tempfile
+
+
+class PayloadsTestCase(BaseTestCase):
+    def test_synthetic_array(self):
+        payload = payloads.synthetic_array(8, fields=5, link_density=0.4, include_depth=2)
+        self.assertEqual(8, len(payload['items']))
+        self.assertEqual(4, len(payload['includes']['Entry']))
+
+        clazz = payloads.synthetic_entry_class(fields=5, link_density=0.4)
+        array = ResourceFactory([clazz]).from_json(payload)
+        array.resolve_links()
+        item = array.items[0]
+        self.assertIsInstance(item, clazz)
+        self.assertEqual('include1-0', item.link0.sys['id'])
+        self.assertEqual('include2-0', item.link0.link0.sys['id'])
+        self.assertIs(item, item.link0.link0.link0)
+
+    def test_synthetic_array_localized(self):
+        payload = payloads.synthetic_array(2, fields=2, link_density=0.5, include_depth=0, locales=['en-US', 'de'])
+        self.assertNotIn('includes', payload)
+        self.assertEqual(['de', 'en-US'], sorted(payload['items'][0]['fields']['field0']))
+
+
+class SuiteTestCase(BaseTestCase):
+    def test_run(self):
+        results = suite.run([10], fields=4, link_density=0.5, include_depth=1, locales=None, repeat=1)
+        self.assertEqual(set(['from_json', 'from_json custom', 'create_entry', 'create_entry custom',
+                              'resolve_links']), set(results))
+        self.assertTrue(all(result['10']['time'] > 0 for result in results.values()))
+
+    def test_compare(self):
+        baseline = {'from_json': {'10': {'time': 1.0, 'peak': 100}, '100': {'time': 1.0, 'peak': 100}}}
+        results = {'from_json': {'10': {'time': 1.2, 'peak': 100}, '100': {'time': 1.0, 'peak': 200}},
+                   'resolve_links': {'10': {'time': 9.0, 'peak': 100}}}
+        self.assertEqual(['from_json (100 entries): peak +100.0 %'], suite.compare(results, baseline, 0.25))
+        self.assertEqual(2, len(suite.compare(results, baseline, 0.1)))
+
+
+class FakeCDATestCase(BaseTestCase):
+    def setUp(self):
+        super(FakeCDATestCase, self).setUp()
+        self.space = FakeSpace.synthetic(20, fields=4, link_density=0.5, include_depth=2, assets=3)
+        self.server = FakeCDA(self.space, sync_page_size=10, seed=1).start()
+        self.client = self.create_client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        super(FakeCDATestCase, self).tearDown()
+
+    def create_client(self, **kwargs):
+        return Client(self.server.space_id, 'token', endpoint=self.server.endpoint, secure=False, **kwargs)
+
+    def test_entries(self):
+        array = self.client.fetch(Entry).where({'skip': 5, 'limit': 10, 'include': 2}).all()
+        self.assertEqual(30, array.total)
+        self.assertEqual(['item{0}'.format(i) for i in range(5, 15)], [item.sys['id'] for item in array.items])
+        self.assertEqual('include2-0', array.items[0].fields['link0'].fields['link0'].sys['id'])
+
+        array = self.client.fetch(Entry).where({'sys.id[in]': 'item3,item1,missing', 'include': 0}).all()
+        self.assertEqual(['item3', 'item1'], [item.sys['id'] for item in array.items])
+        self.assertEqual('item7', self.client.fetch(Entry).where({'sys.id': 'item7'}).first().sys['id'])
+
+    def test_assets_content_types_and_space(self):
+        self.assertEqual(3, len(self.client.fetch(Asset).all().items))
+        content_type = self.client.fetch(ContentType).all().items[0]
+        self.assertEqual(4, len(content_type.fields))
+        self.assertEqual(self.server.space_id, self.client.fetch_space().sys['id'])
+
+    def test_sync(self):
+        result = self.client.sync(initial=True)
+        self.assertEqual(33, len(result.items))
+        self.assertEqual('synced', result.sync_token)
+        self.assertEqual(0, len(self.client.sync(result.sync_token).items))
+
+    def test_throttling(self):
+        self.server.throttle_ratio = 1
+        client = self.create_client(retry_policy=RetryPolicy(max_retries=2, backoff=0.01))
+        with self.assertRaises(RateLimitExceeded):
+            client.fetch(Asset).all()
+        self.assertEqual({'requests': 3, 'throttled': 3}, self.server.stats())
+
+    def test_load(self):
+        path = os.path.join(tempfile.mkdtemp(), 'response.json')
+        with open(path, 'w') as f:
+            json.dump(payloads.array(5), f)
+
+        space = FakeSpace.load(path)
+        self.assertEqual(9, len(space.entries))
+        self.assertEqual(10, len(space.assets))
+        self.assertEqual(['cat1'], [entry['sys']['id'] for entry in space.find('Entry', {'sys.id': 'cat1'})])
+
+
+class LoadTestTestCase(BaseTestCase):
+    def test_run(self):
+        space = FakeSpace.synthetic(20, fields=4)
+        with FakeCDA(space) as server:
+            with Client(server.space_id, 'token', endpoint=server.endpoint, secure=False) as client:
+                for scenario in sorted(loadtest.SCENARIOS):
+                    result = loadtest.run(client, space, scenario, 8, 4, page_size=5)
+                    self.assertEqual(0, result['errors'])
+                    self.assertEqual(8, result['latency']['count'])
+                    self.assertTrue(result['throughput'] > 0)
@@ -0,0 +1,377 @@
+from mock import patch
+import threading
+import time
+
+from contentful.cda.cache import IdentityMap, RequestCoalescer, ResponseCache
+from contentful.cda.errors import NotFound
+from contentful.cda.hooks import RequestObserver
+from contentful.cda.resources import Entry, ResourceLink
+from contentful.cda.serialization import ResourceFactory
+from test import BaseTestCase
+from test.lib.utils import Cat, array_json, asset_json, entry_json, link_json, make_response, paged_handler
+from test.lib.utils import fake_client
+
+
+class ResponseCacheTestCase(BaseTestCase):
+    def test_key_normalizes_params(self):
+        self.assertEqual(ResponseCache.key_for('url', {'limit': 1, 'skip': '0'}),
+                         ResponseCache.key_for('url', {'skip': 0, 'limit': '1'}))
+        self.assertNotEqual(ResponseCache.key_for('url', {'limit': 1}), ResponseCache.key_for('url', {'limit': 2}))
+
+    def test_hits_and_misses(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get('key'))
+        cache.set('key', 'value', 10, 'entries')
+        self.assertEqual('value', cache.get('key'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'evictions': 0, 'revalidations': 0, 'entries': 1, 'size': 10},
+                         cache.stats())
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=30)
+        for key in ['a', 'b', 'c']:
+            cache.set(key, key, 10, 'entries')
+
+        cache.get('a')
+        cache.set('d', 'd', 10, 'entries')
+        self.assertIsNone(cache.get('b'))
+        for key in ['a', 'c', 'd']:
+            self.assertEqual(key, cache.get(key))
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(30, cache.size)
+
+    def test_skips_oversized_values(self):
+        cache = ResponseCache(max_size=10)
+        cache.set('key', 'value', 11, 'entries')
+        self.assertEqual(0, len(cache))
+
+    @patch('contentful.cda.cache.time')
+    def test_path_ttls(self, time_mock):
+        cache = ResponseCache(ttl=10, path_ttls={'content_types': 100})
+        time_mock.time.return_value = 0
+        cache.set('entries', 'entries', 1, 'entries')
+        cache.set('content_types', 'content_types', 1, 'content_types')
+
+        time_mock.time.return_value = 50
+        self.assertIsNone(cache.get('entries'))
+        self.assertEqual('content_types', cache.get('content_types'))
+        self.assertEqual(1, cache.size)
+
+    @patch('contentful.cda.cache.time')
+    def test_keeps_expired_revalidatable_entries(self, time_mock):
+        cache = ResponseCache(ttl=10)
+        time_mock.time.return_value = 0
+        cache.set('key', 'value', 1, 'entries', etag='"abc"')
+
+        time_mock.time.return_value = 50
+        entry, fresh = cache.lookup('key')
+        self.assertFalse(fresh)
+        self.assertEqual({'If-None-Match': '"abc"'}, entry.conditional_headers())
+
+        cache.revalidated('key', entry, 'entries')
+        self.assertEqual('value', cache.get('key'))
+        self.assertEqual(1, cache.revalidations)
+
+    def test_fails_invalid_store(self):
+        self.assertRaises(ValueError, ResponseCache, store='invalid')
+
+
+class DispatcherCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super(DispatcherCacheTestCase, self).setUp()
+        self.items = [entry_json('cat{0}'.format(i), {'name': 'cat', 'bestFriend': link_json('cat0')})
+                      for i in range(3)]
+
+    def test_caches_json(self):
+        cache = ResponseCache()
+        client = fake_client(paged_handler(self.items), custom_entries=[Cat], cache=cache)
+
+        first = client.fetch(Cat).where({'skip': 0}).all()
+        second = client.fetch(Cat).where({'skip': '0'}).all()
+        self.assertEqual(1, len(client.dispatcher.httpclient.requests))
+        self.assertIsNot(first, second)
+        self.assertIs(second[0], second[1].best_friend)
+        self.assertEqual({'name': 'cat', 'bestFriend': link_json('cat0')}, second[1].raw_fields)
+        self.assertEqual(1, cache.hits)
+
+    def test_caches_resources(self):
+        client = fake_client(paged_handler(self.items), cache=ResponseCache(store=ResponseCache.STORE_RESOURCES))
+        self.assertIs(client.fetch(Entry).all(), client.fetch(Entry).all())
+        self.assertEqual(1, len(client.dispatcher.httpclient.requests))
+
+    def test_all_pages_leaves_cached_pages_unchanged(self):
+        items = [entry_json('cat{0}'.format(i)) for i in range(25)]
+        client = fake_client(paged_handler(items), cache=ResponseCache(store=ResponseCache.STORE_RESOURCES))
+        self.assertEqual(25, len(client.fetch(Entry).all_pages(page_size=10).items))
+
+        page = client.fetch(Entry).where({'skip': 0, 'limit': 10}).all()
+        self.assertEqual(10, len(page.items))
+        self.assertEqual(10, page.limit)
+        self.assertEqual(3, len(client.dispatcher.httpclient.requests))
+
+    def test_distinct_queries(self):
+        client = fake_client(paged_handler(self.items), cache=ResponseCache())
+        client.fetch(Entry).all()
+        client.fetch(Entry).first()
+        self.assertEqual(2, len(client.dispatcher.httpclient.requests))
+
+
+@patch('contentful.cda.cache.time')
+class DispatcherRevalidationTestCase(BaseTestCase):
+    def setUp(self):
+        super(DispatcherRevalidationTestCase, self).setUp()
+        self.headers = []
+        self.status_code = 200
+
+        def handler(url, params):
+            if self.status_code == 304:
+                return make_response(status_code=304)
+            body = array_json([entry_json('nyancat')])
+            return make_response(body, headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 18 Jan 2016 10:00:00 GMT'})
+
+        self.client = fake_client(handler, cache=ResponseCache(ttl=10))
+        get = self.client.dispatcher.httpclient.get
+
+        def record_headers(url, params=None, headers=None, **kwargs):
+            self.headers.append(headers)
+            return get(url, params, headers, **kwargs)
+        self.client.dispatcher.httpclient.get = record_headers
+
+    def test_revalidates_expired_response(self, time_mock):
+        time_mock.time.return_value = 0
+        first = self.client.fetch(Entry).all()
+        self.assertNotIn('If-None-Match', self.headers[0])
+
+        time_mock.time.return_value = 20
+        self.status_code = 304
+        second = self.client.fetch(Entry).all()
+        self.assertEqual('"v1"', self.headers[1]['If-None-Match'])
+        self.assertEqual('Mon, 18 Jan 2016 10:00:00 GMT', self.headers[1]['If-Modified-Since'])
+        self.assertEqual('nyancat', second[0].sys['id'])
+        self.assertIsNot(first[0], second[0])
+
+        time_mock.time.return_value = 25
+        self.client.fetch(Entry).all()
+        self.assertEqual(2, len(self.headers))
+
+    def test_replaces_modified_response(self, time_mock):
+        time_mock.time.return_value = 0
+        self.client.fetch(Entry).all()
+
+        time_mock.time.return_value = 20
+        result = self.client.fetch(Entry).all()
+        self.assertEqual('nyancat', result[0].sys['id'])
+        self.assertEqual(0, self.client.dispatcher.cache.revalidations)
+        self.assertEqual(1, len(self.client.dispatcher.cache))
+
+
+def create_entry(entry_id, revision=1, fields=None):
+    json = entry_json(entry_id, fields)
+    json['sys']['revision'] = revision
+    return ResourceFactory([]).from_json(json)
+
+
+class IdentityMapTestCase(BaseTestCase):
+    def test_add_and_get(self):
+        identity_map = IdentityMap()
+        entry = create_entry('nyancat')
+        identity_map.add(entry)
+        self.assertIs(entry, identity_map.get('Entry', 'nyancat'))
+        self.assertIsNone(identity_map.get('Asset', 'nyancat'))
+        self.assertEqual((1, 1), (identity_map.hits, identity_map.misses))
+
+    def test_keeps_latest_revision(self):
+        identity_map = IdentityMap()
+        second = create_entry('nyancat', 2)
+        identity_map.add(second)
+        identity_map.add(create_entry('nyancat', 1))
+        self.assertIs(second, identity_map.get('Entry', 'nyancat'))
+
+        third = create_entry('nyancat', 3)
+        identity_map.add(third)
+        self.assertIs(third, identity_map.get('Entry', 'nyancat'))
+        self.assertEqual(1, len(identity_map))
+
+    def test_lru_eviction(self):
+        identity_map = IdentityMap(max_size=2)
+        for entry_id in ['a', 'b']:
+            identity_map.add(create_entry(entry_id))
+        identity_map.get('Entry', 'a')
+        identity_map.add(create_entry('c'))
+
+        self.assertIsNone(identity_map.get('Entry', 'b'))
+        self.assertIsNotNone(identity_map.get('Entry', 'a'))
+        self.assertIsNotNone(identity_map.get('Entry', 'c'))
+
+    def test_add_all(self):
+        identity_map = IdentityMap()
+        array = ResourceFactory([]).from_json(array_json([entry_json('nyancat')],
+                                                         includes={'Asset': [asset_json('image')]}))
+        identity_map.add_all(array)
+        self.assertIs(array[0], identity_map.get('Entry', 'nyancat'))
+        self.assertIsNotNone(identity_map.get('Asset', 'image'))
+
+
+class ClientIdentityMapTestCase(BaseTestCase):
+    def setUp(self):
+        super(ClientIdentityMapTestCase, self).setUp()
+        items = [entry_json('nyancat', {'bestFriend': link_json('happycat')}), entry_json('happycat')]
+
+        def handler(url, params):
+            return make_response(array_json([i for i in items if i['sys']['id'] == params['sys.id']]))
+
+        self.client = fake_client(handler, custom_entries=[Cat], identity_map=IdentityMap())
+
+    def test_resolves_from_identity_map(self):
+        happy_cat = self.client.fetch(Cat).where({'sys.id': 'happycat'}).first()
+        nyan_cat = self.client.fetch(Cat).where({'sys.id': 'nyancat'}).first()
+        self.assertIs(happy_cat, nyan_cat.best_friend)
+        self.assertIs(happy_cat, nyan_cat.fields['bestFriend'])
+        self.assertEqual(2, len(self.client.dispatcher.httpclient.requests))
+
+    def test_resolve_consults_identity_map(self):
+        happy_cat = self.client.fetch(Cat).where({'sys.id': 'happycat'}).first()
+        link = ResourceLink(link_json('happycat')['sys'])
+        self.assertIs(happy_cat, self.client.resolve_resource_link(link))
+        self.assertEqual(1, len(self.client.dispatcher.httpclient.requests))
+
+    def test_unresolved_without_identity_map(self):
+        self.client.dispatcher.identity_map = None
+        self.client.fetch(Cat).where({'sys.id': 'happycat'}).first()
+        nyan_cat = self.client.fetch(Cat).where({'sys.id': 'nyancat'}).first()
+        self.assertIsInstance(nyan_cat.best_friend, ResourceLink)
+
+
+def run_concurrently(count, function):
+    """Invoke `function` from `count` threads, returning the results (or exceptions) in order."""
+    results = [None] * count
+
+    def target(index):
+        try:
+            results[index] = function()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+class RequestCoalescerTestCase(BaseTestCase):
+    def setUp(self):
+        super(RequestCoalescerTestCase, self).setUp()
+        self.coalescer = RequestCoalescer()
+        self.release = threading.Event()
+        self.calls = []
+
+    def blocking_call(self, result):
+        def call():
+            self.calls.append(result)
+            self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return call
+
+    def test_key_includes_headers(self):
+        self.assertEqual(RequestCoalescer.key_for('url', {'limit': 1}, {'a': 'b'}),
+                         RequestCoalescer.key_for('url', {'limit': '1'}, {'a': 'b'}))
+        self.assertNotEqual(RequestCoalescer.key_for('url', {}, {'a': 'b'}),
+                            RequestCoalescer.key_for('url', {}, {'a': 'c'}))
+
+    def test_shares_in_flight_call(self):
+        threads, results = run_concurrently(5, lambda: self.coalescer.call('key', self.blocking_call('value')))
+        wait_for(lambda: self.coalescer.coalesced == 4)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(['value'], self.calls)
+        self.assertEqual(['value'] * 5, [result for result, _ in results])
+        self.assertEqual(1, len([shared for _, shared in results if not shared]))
+        self.assertEqual(0, len(self.coalescer))
+
+    def test_shares_error(self):
+        error = ValueError('failed')
+        threads, results = run_concurrently(3, lambda: self.coalescer.call('key', self.blocking_call(error)))
+        wait_for(lambda: self.coalescer.coalesced == 2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([error] * 3, results)
+        self.assertEqual(1, len(self.calls))
+
+    def test_calls_again_once_completed(self):
+        self.release.set()
+        self.assertEqual(('a', False), self.coalescer.call('key', self.blocking_call('a')))
+        self.assertEqual(('b', False), self.coalescer.call('key', self.blocking_call('b')))
+        self.assertEqual(0, self.coalescer.coalesced)
+
+
+class CoalescingObserver(RequestObserver):
+    def __init__(self):
+        super(CoalescingObserver, self).__init__()
+        self.events = []
+
+    def request_finished(self, event):
+        self.events.append(event)
+
+
+class DispatcherCoalescingTestCase(BaseTestCase):
+    def setUp(self):
+        super(DispatcherCoalescingTestCase, self).setUp()
+        self.release = threading.Event()
+        items = [entry_json('nyancat', {'name': 'Nyan Cat', 'bestFriend': link_json('happycat')})]
+        handler = paged_handler(items, {'Entry': [entry_json('happycat')]})
+
+        def blocking_handler(url, params):
+            self.release.wait(5)
+            if params.get('sys.id') == 'missing':
+                return make_response({}, status_code=404)
+            return handler(url, params)
+
+        self.observer = CoalescingObserver()
+        self.client = fake_client(blocking_handler, custom_entries=[Cat], observers=[self.observer])
+
+    def fetch_concurrently(self, count, function):
+        threads, results = run_concurrently(count, function)
+        wait_for(lambda: self.client.dispatcher.coalescer.coalesced == count - 1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesces_identical_requests(self):
+        results = self.fetch_concurrently(4, lambda: self.client.fetch(Cat).where({'sys.id': 'nyancat'}).all())
+
+        self.assertEqual(1, len(self.client.dispatcher.httpclient.requests))
+        self.assertEqual(['Nyan Cat'] * 4, [result.items[0].name for result in results])
+        self.assertEqual(4, len(set(id(result.items[0]) for result in results)))
+        self.assertEqual(4, len(set(id(result.items[0].best_friend) for result in results)))
+        self.assertEqual(3, len([event for event in self.observer.events if event.coalesced]))
+
+    def test_shares_errors(self):
+        results = self.fetch_concurrently(3, lambda: self.client.fetch(Cat).where({'sys.id': 'missing'}).all())
+
+        self.assertEqual(1, len(self.client.dispatcher.httpclient.requests))
+        self.assertTrue(all(isinstance(result, NotFound) for result in results))
+
+    def test_distinct_requests(self):
+        self.release.set()
+        self.client.fetch(Cat).where({'limit': 1}).all()
+        self.client.fetch(Cat).where({'limit': 1}).all()
+        self.assertEqual(2, len(self.client.dispatcher.httpclient.requests))
+
+    def test_disabled(self):
+        client = fake_client(self.client.dispatcher.httpclient.handler, coalesce_requests=False)
+        self.assertIsNone(client.dispatcher.coalescer)
+        self.release.set()
+        client.fetch(Cat).all()
+        self.assertEqual(1, len(client.dispatcher.httpclient.requests))
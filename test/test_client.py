@@ -1,14 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from mock import patch
-from requests import Response
+from requests import Response, Session
+import six
 
 from contentful.cda import const
 from contentful.cda.client import Client
 from contentful.cda.errors import ApiError, Unauthorized
-from contentful.cda.resources import Entry, Asset, ContentType, ResourceLink, Space
+from contentful.cda.cache import ResponseCache
+from contentful.cda.resources import Entry, Asset, ContentType, ResourceLink, Space, DeletedEntry, DeletedAsset
+from contentful.cda.sessions import create_session
 from test import BaseTestCase
 from test.lib import utils
-from test.lib.utils import Cat, DemoClient, SDKClient
+from test.lib.utils import Cat, DemoClient, SDKClient, entry_json, link_json, paged_handler, fake_client
+from test.lib.utils import sync_handler, SYNC_PAGES, array_json, asset_json, make_response
 
 
 class ClientConfigTestCase(BaseTestCase):
@@ -30,6 +35,36 @@ class ClientConfigTestCase(BaseTestCase):
                                 'space_id', 'token', [Entry])
 
 
+class ClientSessionTestCase(BaseTestCase):
+    def test_creates_pooled_session(self):
+        cli = Client('space_id', 'token', pool_size=3)
+        self.assertIsInstance(cli.dispatcher.httpclient, Session)
+        adapter = cli.dispatcher.httpclient.get_adapter('https://cdn.contentful.com')
+        self.assertEqual(3, adapter._pool_maxsize)
+
+    def test_keep_alive_disabled(self):
+        cli = Client('space_id', 'token', keep_alive=False)
+        self.assertEqual('close', cli.dispatcher.httpclient.headers['Connection'])
+
+    def test_shared_session(self):
+        session = create_session()
+        clients = [Client('space_id', 'token', session=session), Client('other_space_id', 'token', session=session)]
+        for cli in clients:
+            self.assertIs(session, cli.dispatcher.httpclient)
+
+        with patch.object(session, 'close') as close_mock:
+            for cli in clients:
+                cli.close()
+            self.assertFalse(close_mock.called)
+
+    def test_close_own_session(self):
+        cli = Client('space_id', 'token')
+        with patch.object(cli.dispatcher.httpclient, 'close') as close_mock:
+            with cli:
+                pass
+            self.assertTrue(close_mock.called)
+
+
 class ClientTestCase(BaseTestCase):
     def setUp(self):
         super(ClientTestCase, self).setUp()
@@ -154,14 +189,260 @@ class ClientTestCase(BaseTestCase):
         self.assertEqual('Contentful Example API', space.name)
         self.assertIsNotNone(space.sys)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_raises_mapped_apierror(self, get_mock):
         get_mock.return_value = Response()
         get_mock.return_value.status_code = 401
         self.assertRaises(Unauthorized, self.client.fetch_space)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_raises_general_apierror(self, get_mock):
         get_mock.return_value = Response()
         get_mock.return_value.status_code = 504
         self.assertRaises(ApiError, self.client.fetch_space)
+
+
+class QueryTestCase(BaseTestCase):
+    def setUp(self):
+        super(QueryTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': 'cat{0}'.format(i)}) for i in range(5)]
+        self.client = fake_client(paged_handler(items), custom_entries=[Cat])
+
+    def test_where_returns_new_request(self):
+        request = self.client.fetch(Cat)
+        refined = request.where({'include': 2})
+        self.assertIsNot(request, refined)
+        self.assertIsInstance(refined, type(request))
+        self.assertEqual({'content_type': 'cat'}, request.params)
+        self.assertEqual({'content_type': 'cat', 'include': 2}, refined.params)
+        self.assertEqual({'content_type': 'cat', 'include': 3}, refined.where({'include': 3}).params)
+
+    def test_first_does_not_mutate_request(self):
+        request = self.client.fetch(Cat)
+        self.assertEqual('cat0', request.first().sys['id'])
+        self.assertEqual({'content_type': 'cat'}, request.params)
+        self.assertEqual(5, len(request.all().items))
+        self.assertEqual([1, None], [params.get('limit') for url, params in self.client.dispatcher.httpclient.requests])
+
+    def test_request_copies_params(self):
+        params = {'limit': 1}
+        request = self.client.fetch(Cat).where(params)
+        params['limit'] = 2
+        self.assertEqual(1, request.params['limit'])
+
+
+class ThreadSafetyTestCase(BaseTestCase):
+    def setUp(self):
+        super(ThreadSafetyTestCase, self).setUp()
+        self.items = [entry_json('cat{0}'.format(i), {'name': 'cat{0}'.format(i), 'lives': i,
+                                                      'birthday': '2015-01-{0:02d}T00:00:00Z'.format(i % 28 + 1),
+                                                      'bestFriend': link_json('cat{0}'.format((i + 1) % 50))})
+                      for i in range(50)]
+
+        def handler(url, params):
+            if 'sys.id' in params:
+                return make_response(array_json([item for item in self.items if item['sys']['id'] == params['sys.id']]))
+            return paged_handler(self.items)(url, params)
+
+        self.client = fake_client(handler, custom_entries=[Cat])
+
+    def test_shared_request(self):
+        base = self.client.fetch(Cat).where({'include': 1})
+
+        def fetch(index):
+            cat = base.where({'sys.id': 'cat{0}'.format(index)}).first()
+            return cat.sys['id'], cat.name, cat.lives, cat.birthday
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fetch, list(range(50)) * 4))
+
+        self.assertEqual([('cat{0}'.format(i), 'cat{0}'.format(i), i, date(2015, 1, i % 28 + 1))
+                          for i in list(range(50)) * 4], [(r[0], r[1], r[2], r[3].date()) for r in results])
+        self.assertEqual({'content_type': 'cat', 'include': 1}, base.params)
+
+    def test_shared_client_pagination(self):
+        def fetch(page_size):
+            return [cat.sys['id'] for cat in self.client.fetch(Cat).iter_all(page_size=page_size)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fetch, [3, 7, 10, 50] * 4))
+
+        self.assertEqual([['cat{0}'.format(i) for i in range(50)]] * 16, results)
+
+
+class PaginationTestCase(BaseTestCase):
+    def setUp(self):
+        super(PaginationTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': 'cat{0}'.format(i), 'bestFriend': link_json('cat0')})
+                 for i in range(25)]
+        self.client = fake_client(paged_handler(items), custom_entries=[Cat])
+
+    def test_iter_all(self):
+        result = list(self.client.fetch(Entry).iter_all(page_size=10))
+        self.assertEqual(['cat{0}'.format(i) for i in range(25)], [e.sys['id'] for e in result])
+
+        requests = self.client.dispatcher.httpclient.requests
+        self.assertEqual([0, 10, 20], [params['skip'] for url, params in requests])
+        self.assertTrue(all(params['limit'] == 10 for url, params in requests))
+
+    def test_iter_all_resolves_links_per_page(self):
+        pages = list(self.client.fetch(Cat).iter_pages(page_size=10))
+        self.assertEqual(3, len(pages))
+        self.assertIs(pages[0][0], pages[0][5].best_friend)
+        self.assertIsInstance(pages[1][0].best_friend, ResourceLink)
+
+    def test_iter_all_respects_skip(self):
+        result = list(self.client.fetch(Entry).where({'skip': 20}).iter_all(page_size=10))
+        self.assertEqual(5, len(result))
+
+    def test_iter_all_does_not_mutate_request(self):
+        request = self.client.fetch(Entry)
+        list(request.iter_all(page_size=10))
+        self.assertEqual({}, request.params)
+
+    def test_iter_pages_shared_includes(self):
+        items = [entry_json('cat{0}'.format(i), {'bestFriend': link_json('happycat' if i < 15 else 'cat0')})
+                 for i in range(25)]
+        includes = {'Entry': [entry_json('happycat', {'bestFriend': link_json('grumpycat')}), entry_json('grumpycat')]}
+        client = fake_client(paged_handler(items, includes), custom_entries=[Cat])
+
+        pages = list(client.fetch(Cat).iter_pages(page_size=10, shared_includes=True))
+        self.assertIs(pages[0][0].best_friend, pages[1][0].best_friend)
+        self.assertEqual('grumpycat', pages[0][0].best_friend.best_friend.sys['id'])
+        self.assertIs(pages[0][0], pages[2][0].best_friend)
+
+        pages = list(client.fetch(Cat).iter_pages(page_size=10))
+        self.assertIsNot(pages[0][0].best_friend, pages[1][0].best_friend)
+        self.assertIsInstance(pages[2][0].best_friend, ResourceLink)
+
+    def test_all_pages(self):
+        result = self.client.fetch(Entry).all_pages(page_size=10, max_workers=3)
+        self.assertEqual(['cat{0}'.format(i) for i in range(25)], [e.sys['id'] for e in result])
+        self.assertEqual(25, result.total)
+        self.assertEqual(25, len(result.items_mapped['Entry']))
+
+        requests = self.client.dispatcher.httpclient.requests
+        self.assertEqual([0, 10, 20], sorted(params['skip'] for url, params in requests))
+
+    def test_all_pages_resolves_links_across_pages(self):
+        result = self.client.fetch(Cat).all_pages(page_size=10)
+        for cat in result:
+            self.assertIs(result[0], cat.best_friend)
+            self.assertIs(result[0], cat.fields['bestFriend'])
+
+    def test_all_pages_single_page(self):
+        result = self.client.fetch(Entry).all_pages(page_size=100)
+        self.assertEqual(25, len(result.items))
+        self.assertEqual(1, len(self.client.dispatcher.httpclient.requests))
+
+
+class SyncTestCase(BaseTestCase):
+    def setUp(self):
+        super(SyncTestCase, self).setUp()
+        self.client = fake_client(sync_handler(SYNC_PAGES), custom_entries=[Cat], cache=ResponseCache())
+
+    def test_initial_sync(self):
+        result = self.client.sync(initial=True)
+        self.assertEqual(['nyancat', 'nyancat-image', 'happycat'], [r.sys['id'] for r in result])
+        self.assertEqual(3, len(result.added))
+        self.assertEqual([], result.updated)
+        self.assertEqual('token1', result.sync_token)
+
+        entry = result.items[0]
+        self.assertIs(type(entry), Entry)
+        self.assertEqual({'en-US': 'nyancat'}, entry.fields['name'])
+        self.assertIsInstance(result.items[1], Asset)
+
+        requests = self.client.dispatcher.httpclient.requests
+        self.assertEqual('https://cdn.contentful.com/spaces/cfexampleapi/sync', requests[0][0])
+        self.assertEqual([{'initial': 'true'}, {'sync_token': 'page2'}], [params for url, params in requests])
+
+    def test_delta_sync(self):
+        result = self.client.sync('token1')
+        self.assertEqual(['garfield'], [r.sys['id'] for r in result.added])
+        self.assertEqual(['nyancat'], [r.sys['id'] for r in result.updated])
+        self.assertEqual([DeletedEntry, DeletedAsset], [type(r) for r in result.deleted])
+        self.assertEqual('token2', result.sync_token)
+
+    def test_sync_is_not_cached(self):
+        self.client.sync(initial=True)
+        self.client.sync(initial=True)
+        self.assertEqual(4, len(self.client.dispatcher.httpclient.requests))
+
+    def test_fails_without_token(self):
+        self.assertRaisesRegex(Exception, '^Either "initial" or a "sync_token" must be provided\\.$', self.client.sync)
+
+
+CAT_ID = 'cat-with-a-rather-long-identifier-{0}'
+
+
+class StreamingTestCase(BaseTestCase):
+    def setUp(self):
+        super(StreamingTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': six.u('cat {0} \u2605').format(i),
+                                                 'bestFriend': link_json('happycat')})
+                 for i in range(5)]
+        includes = {'Entry': [entry_json('happycat', {'name': 'Happy Cat'})]}
+        self.body = array_json(items, includes=includes)
+        self.client = fake_client(lambda url, params: make_response(self.body), custom_entries=[Cat])
+
+    def test_stream(self):
+        result = []
+        for cat in self.client.fetch(Cat).stream(chunk_size=7):
+            self.assertIsInstance(cat.best_friend, ResourceLink)
+            result.append(cat)
+
+        self.assertEqual(['cat{0}'.format(i) for i in range(5)], [cat.sys['id'] for cat in result])
+        self.assertEqual(six.u('cat 0 \u2605'), result[0].name)
+        self.assertEqual('Happy Cat', result[0].best_friend.name)
+        self.assertIs(result[0].best_friend, result[4].best_friend)
+
+    def test_stream_without_resolving_links(self):
+        self.client.config.resolve_links = False
+        result = list(self.client.fetch(Cat).stream())
+        self.assertEqual(5, len(result))
+        self.assertIsInstance(result[0].best_friend, ResourceLink)
+
+    def test_stream_raises_api_error(self):
+        self.client.dispatcher.httpclient.handler = lambda url, params: make_response({}, status_code=401)
+        with self.assertRaises(Unauthorized):
+            list(self.client.fetch(Cat).stream())
+
+
+class BatchResolutionTestCase(BaseTestCase):
+    def setUp(self):
+        super(BatchResolutionTestCase, self).setUp()
+        self.entries = dict((CAT_ID.format(i), entry_json(CAT_ID.format(i))) for i in range(300))
+
+        def handler(url, params):
+            if 'sys.id[in]' not in params:
+                items = [entry_json('lister', {'friends': [link_json(CAT_ID.format(i)) for i in range(300)] + ['x'],
+                                               'image': link_json('image', 'Asset'),
+                                               'self': link_json('lister')})]
+                return make_response(array_json(items))
+
+            ids = params['sys.id[in]'].split(',')
+            if url.endswith('assets'):
+                return make_response(array_json([asset_json(i) for i in ids]))
+            return make_response(array_json([self.entries[i] for i in ids if i in self.entries]))
+
+        self.client = fake_client(handler)
+
+    def test_resolve_array_links(self):
+        array = self.client.fetch(Entry).all()
+        lister = array[0]
+        self.assertEqual(300, len(array.unresolved_links()) - 1)
+
+        self.client.resolve_array_links(array)
+        self.assertEqual([CAT_ID.format(i) for i in range(300)], [e.sys['id'] for e in lister.fields['friends'][:-1]])
+        self.assertEqual('x', lister.fields['friends'][-1])
+        self.assertIsInstance(lister.fields['image'], Asset)
+        self.assertIs(lister, lister.fields['self'])
+        self.assertEqual(set(), array.unresolved_links())
+        self.assertEqual([lister], array.items)
+
+        requests = self.client.dispatcher.httpclient.requests[1:]
+        self.assertEqual(1, len([url for url, params in requests if url.endswith('assets')]))
+        entry_requests = [params for url, params in requests if url.endswith('entries')]
+        self.assertTrue(len(entry_requests) > 1)
+        self.assertEqual(300, sum(params['limit'] for params in entry_requests))
@@ -0,0 +1,55 @@
+from datetime import datetime
+from dateutil import parser, tz
+
+from contentful.cda.dates import DateParser
+from contentful.cda.fields import Date, Field
+from contentful.cda.serialization import ResourceFactory
+from test import BaseTestCase
+from test.lib.utils import Cat, entry_json
+
+
+class DateParserTestCase(BaseTestCase):
+    def test_matches_dateutil(self):
+        date_parser = DateParser()
+        for value in ['2013-11-18', '2013-11-18T09:13', '2013-11-18T09:13:37', '2013-11-18T09:13:37.808Z',
+                      '2013-11-18T09:13:37.1234567Z', '2013-11-18 09:13:37Z', '2013-11-18T09:13:37+00:00',
+                      '2013-11-18T09:13+02:00', '2013-11-18T09:13:37-0530', '2013-11-18T09:13:37+05',
+                      'Nov 18 2013 09:13', 20131118]:
+            expected = parser.parse(str(value))
+            result = date_parser.parse(value)
+            self.assertEqual(expected, result, value)
+            self.assertEqual(expected.utcoffset(), result.utcoffset(), value)
+
+    def test_time_zones(self):
+        self.assertIsNone(DateParser.parse_value('2013-11-18T09:13').tzinfo)
+        self.assertEqual(tz.tzutc(), DateParser.parse_value('2013-11-18T09:13:37.808Z').tzinfo)
+        self.assertEqual(tz.tzoffset(None, -19800), DateParser.parse_value('2013-11-18T09:13-05:30').tzinfo)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, DateParser().parse, '2013-11-18T24:00:00Z')
+        self.assertRaises(ValueError, DateParser().parse, '2013-13-18')
+        self.assertRaises(ValueError, DateParser().parse, 'not a date')
+
+    def test_memo(self):
+        date_parser = DateParser(memo_size=2)
+        first = date_parser.parse('2013-11-18T09:13:37.808Z')
+        self.assertIs(first, date_parser.parse('2013-11-18T09:13:37.808Z'))
+
+        date_parser.parse('2014-11-18')
+        date_parser.parse('2015-11-18')
+        self.assertEqual(2, len(date_parser.memo))
+        self.assertIsNot(first, date_parser.parse('2013-11-18T09:13:37.808Z'))
+
+    def test_factory_date_parser(self):
+        factory = ResourceFactory([Cat], date_parser=DateParser(memo_size=10))
+        cats = [factory.from_json(entry_json('cat{0}'.format(i), {'birthday': '2011-04-04T22:00:00.000Z'}))
+                for i in range(2)]
+        self.assertEqual(datetime(2011, 4, 4, 22, tzinfo=tz.tzutc()), cats[0].birthday)
+        self.assertIs(cats[0].birthday, cats[1].birthday)
+
+        factory = ResourceFactory([Cat], lazy_fields=True, date_parser=DateParser(memo_size=10))
+        cats = [factory.from_json(entry_json('cat{0}'.format(i), {'birthday': '2011-04-04'})) for i in range(2)]
+        self.assertIs(cats[0].birthday, cats[1].birthday)
+
+    def test_convert_value_without_parser(self):
+        self.assertEqual(datetime(2011, 4, 4), ResourceFactory.convert_value('2011-04-04', Field(Date)))
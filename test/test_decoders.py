@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from mock import patch
+import six
+
+from contentful.cda import decoders
+from contentful.cda.decoders import JSONDecoder, available_decoders, default_decoder
+from contentful.cda.resources import Entry
+from test import BaseTestCase
+from test.lib.utils import array_json, entry_json, make_response, fake_client
+
+
+class DecodersTestCase(BaseTestCase):
+    def test_decode(self):
+        content = six.u('{"name": "Nyan Cat \u2605", "lives": 9, "likes": ["rainbows"], "x": null}').encode('utf-8')
+        for decoder in available_decoders():
+            self.assertEqual({'name': six.u('Nyan Cat \u2605'), 'lives': 9, 'likes': ['rainbows'], 'x': None},
+                             decoder.decode(content), decoder.name)
+
+    def test_decode_invalid(self):
+        for decoder in available_decoders():
+            with self.assertRaises(ValueError):
+                decoder.decode(b'{"name": ')
+
+    def test_default_decoder_fallback(self):
+        with patch.object(decoders, 'orjson', None), patch.object(decoders, 'ujson', None):
+            self.assertIs(JSONDecoder, type(default_decoder()))
+
+    def test_client_uses_decoder(self):
+        class CountingDecoder(JSONDecoder):
+            calls = 0
+
+            def decode(self, content):
+                CountingDecoder.calls += 1
+                return super(CountingDecoder, self).decode(content)
+
+        client = fake_client(lambda url, params: make_response(array_json([entry_json('nyancat')])),
+                             json_decoder=CountingDecoder())
+        self.assertEqual('nyancat', client.fetch(Entry).all().items[0].sys['id'])
+        self.assertEqual(1, CountingDecoder.calls)
@@ -0,0 +1,129 @@
+from contentful.cda.cache import ResponseCache
+from contentful.cda.errors import Unauthorized
+from contentful.cda.hooks import Histogram, HistogramCollector, RequestEvent, RequestObserver
+from test import BaseTestCase
+from test.lib.utils import Cat, array_json, entry_json, link_json, make_response, fake_client, paged_handler
+
+
+class RecordingObserver(RequestObserver):
+    def __init__(self):
+        super(RecordingObserver, self).__init__()
+        self.events = []
+
+    def request_started(self, event):
+        self.events.append(('started', event))
+
+    def request_finished(self, event):
+        self.events.append(('finished', event))
+
+    def links_resolved(self, event):
+        self.events.append(('resolved', event))
+
+
+class HistogramTestCase(BaseTestCase):
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.add(value)
+
+        self.assertEqual(50, histogram.percentile(50))
+        self.assertEqual(99, histogram.percentile(99))
+        self.assertEqual(1, histogram.percentile(0))
+        summary = histogram.summary()
+        self.assertEqual(100, summary['count'])
+        self.assertEqual(50.5, summary['mean'])
+        self.assertEqual(100, summary['max'])
+
+    def test_keeps_recent_samples(self):
+        histogram = Histogram(max_samples=10)
+        for value in range(100):
+            histogram.add(value)
+
+        self.assertEqual(10, len(histogram.samples))
+        self.assertEqual(90, histogram.percentile(1))
+        self.assertEqual(100, histogram.count)
+
+    def test_empty(self):
+        self.assertIsNone(Histogram().percentile(50))
+        self.assertIsNone(Histogram().summary()['mean'])
+
+
+class ObserverTestCase(BaseTestCase):
+    def setUp(self):
+        super(ObserverTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': 'cat', 'bestFriend': link_json('happycat')}) for i in range(5)]
+        self.handler = paged_handler(items, {'Entry': [entry_json('happycat')]})
+        self.observer = RecordingObserver()
+
+    def test_request_lifecycle(self):
+        client = fake_client(self.handler, custom_entries=[Cat], observers=[self.observer])
+        client.fetch(Cat).where({'limit': 5}).all()
+
+        self.assertEqual(['started', 'finished', 'resolved'], [name for name, _ in self.observer.events])
+        event = self.observer.events[1][1]
+        self.assertIs(self.observer.events[0][1], event)
+        self.assertEqual('entries', event.remote_path)
+        self.assertEqual({'content_type': 'cat', 'limit': 5}, event.params)
+        self.assertEqual(200, event.status_code)
+        self.assertEqual(1, event.attempts)
+        self.assertFalse(event.cached)
+        self.assertIsNone(event.error)
+        self.assertTrue(event.response_bytes > 0)
+        for name in ('network_time', 'decode_time', 'build_time', 'total_time'):
+            self.assertTrue(getattr(event, name) >= 0)
+        self.assertTrue(self.observer.events[2][1].resolve_time >= 0)
+
+    def test_request_error(self):
+        client = fake_client(lambda url, params: make_response({}, status_code=401), observers=[self.observer])
+        with self.assertRaises(Unauthorized):
+            client.fetch(Cat).all()
+
+        event = self.observer.events[-1][1]
+        self.assertIsInstance(event.error, Unauthorized)
+        self.assertEqual(401, event.status_code)
+        self.assertIsNone(event.decode_time)
+
+    def test_cached_request(self):
+        client = fake_client(self.handler, custom_entries=[Cat], cache=ResponseCache(), observers=[self.observer])
+        client.fetch(Cat).invoke()
+        client.fetch(Cat).invoke()
+
+        event = self.observer.events[-1][1]
+        self.assertTrue(event.cached)
+        self.assertIsNone(event.network_time)
+        self.assertTrue(event.build_time >= 0)
+
+    def test_stream(self):
+        body = array_json([entry_json('nyancat')])
+        client = fake_client(lambda url, params: make_response(body), observers=[self.observer])
+        list(client.fetch(Cat).stream())
+
+        event = [event for name, event in self.observer.events if name == 'finished'][0]
+        self.assertEqual(len(make_response(body).content), event.response_bytes)
+        self.assertTrue(event.total_time >= 0)
+
+
+class HistogramCollectorTestCase(BaseTestCase):
+    def test_collects_per_path(self):
+        collector = HistogramCollector()
+        items = [entry_json('cat{0}'.format(i)) for i in range(5)]
+        client = fake_client(paged_handler(items), observers=[collector])
+        list(client.fetch(Cat).iter_all(page_size=2))
+
+        self.assertEqual(3, collector.histogram('entries', 'total_time').count)
+        self.assertEqual(3, collector.histogram('entries', 'resolve_time').count)
+        self.assertIsNone(collector.histogram('assets', 'total_time'))
+        summary = collector.summary()
+        self.assertEqual(['entries'], list(summary.keys()))
+        self.assertTrue(summary['entries']['network_time']['p99'] >= summary['entries']['network_time']['p50'])
+
+        collector.clear()
+        self.assertEqual({}, collector.summary())
+
+    def test_custom_key(self):
+        collector = HistogramCollector(key=lambda event: (event.remote_path, event.params.get('content_type')))
+        event = RequestEvent('entries', {'content_type': 'cat'})
+        event.total_time = 0.5
+        collector.request_finished(event)
+
+        self.assertEqual(0.5, collector.histogram(('entries', 'cat'), 'total_time').percentile(50))
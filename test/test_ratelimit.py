@@ -0,0 +1,127 @@
+import threading
+import time
+
+from mock import patch
+
+from contentful.cda.errors import RateLimitExceeded, rate_limit_reset
+from contentful.cda.ratelimit import AdaptiveConcurrencyLimiter, RetryPolicy
+from contentful.cda.resources import Entry
+from test import BaseTestCase
+from test.lib.utils import array_json, entry_json, make_response, fake_client
+
+
+class RetryPolicyTestCase(BaseTestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry(0, make_response(status_code=429)))
+        self.assertTrue(policy.should_retry(1, make_response(status_code=429)))
+        self.assertFalse(policy.should_retry(2, make_response(status_code=429)))
+        self.assertFalse(policy.should_retry(0, make_response(status_code=503)))
+        self.assertTrue(RetryPolicy(statuses=(503,)).should_retry(0, make_response(status_code=503)))
+
+    def test_delay_honors_rate_limit_reset(self):
+        policy = RetryPolicy(backoff=0.5)
+        delay = policy.delay(0, make_response(status_code=429, headers={'X-Contentful-RateLimit-Reset': '3'}))
+        self.assertTrue(3 <= delay <= 3.5)
+
+    def test_rate_limit_reset(self):
+        for value, expected in [('3', 3), ('1.5', 1.5), ('soon', None), (None, None)]:
+            headers = {} if value is None else {'X-Contentful-RateLimit-Reset': value}
+            response = make_response(status_code=429, headers=headers)
+            self.assertEqual(expected, rate_limit_reset(response))
+            self.assertEqual(expected, RateLimitExceeded(response).reset_time)
+
+        delay = RetryPolicy(backoff=0.5).delay(0, make_response(status_code=429, headers={
+            'X-Contentful-RateLimit-Reset': 'soon'}))
+        self.assertTrue(0 <= delay <= 0.5)
+
+    def test_delay_exponential_backoff(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        for attempt, maximum in [(0, 1), (1, 2), (2, 4), (3, 5), (10, 5)]:
+            delay = policy.delay(attempt, make_response(status_code=429))
+            self.assertTrue(0 <= delay <= maximum)
+
+
+class AdaptiveConcurrencyLimiterTestCase(BaseTestCase):
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=3)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(False)
+        self.assertEqual(3, int(limiter.limit))
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(False)
+        self.assertEqual(3, limiter.limit)
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, minimum=2)
+        limiter.acquire()
+        limiter.release(True)
+        self.assertEqual(4, limiter.limit)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(True)
+        self.assertEqual(2, limiter.limit)
+
+        limiter.acquire()
+        limiter.release(None)
+        self.assertEqual(2, limiter.limit)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_limits_concurrency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        limiter.acquire()
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(False)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+
+@patch('contentful.cda.client.time.sleep')
+class DispatcherRetryTestCase(BaseTestCase):
+    def setUp(self):
+        super(DispatcherRetryTestCase, self).setUp()
+        self.statuses = []
+
+        def handler(url, params):
+            status_code = self.statuses.pop(0) if self.statuses else 200
+            if status_code == 429:
+                return make_response(status_code=429, headers={'X-Contentful-RateLimit-Reset': '1'})
+            return make_response(array_json([entry_json('nyancat')]))
+
+        self.limiter = AdaptiveConcurrencyLimiter(initial=4)
+        self.client = fake_client(handler, limiter=self.limiter, retry_policy=RetryPolicy(max_retries=2))
+
+    def test_retries_rate_limited_requests(self, sleep_mock):
+        self.statuses = [429, 429]
+        result = self.client.fetch(Entry).all()
+        self.assertEqual('nyancat', result[0].sys['id'])
+        self.assertEqual(3, len(self.client.dispatcher.httpclient.requests))
+        self.assertEqual(2, sleep_mock.call_count)
+        self.assertTrue(sleep_mock.call_args[0][0] >= 1)
+        self.assertTrue(self.limiter.limit < 4)
+
+    def test_raises_when_retries_exhausted(self, sleep_mock):
+        self.statuses = [429, 429, 429]
+        try:
+            self.client.fetch(Entry).all()
+            self.fail('RateLimitExceeded not raised')
+        except RateLimitExceeded as e:
+            self.assertEqual(1, e.reset_time)
+        self.assertEqual(0, self.limiter.in_flight)
+
+    def test_max_workers_follows_limiter(self, sleep_mock):
+        self.assertEqual(self.limiter.maximum, self.client.dispatcher.max_workers())
+        self.assertEqual(2, self.client.dispatcher.max_workers(2))
@@ -1,5 +1,14 @@
-from contentful.cda.resources import Asset, ContentType, Entry, Space
+from contentful.cda.resources import Array, Asset, ContentType, Entry, LinkResolver, ResourceLink, Space
+from contentful.cda.serialization import ResourceFactory
 from test import BaseTestCase
+from test.lib.utils import Cat, array_json, asset_json, entry_json, link_json
+import pickle
+import weakref
+
+
+class Mouse(Entry):
+    __content_type__ = 'mouse'
+    __dynamic_attributes__ = True
 
 
 class ResourcesTestCase(BaseTestCase):
@@ -18,3 +27,171 @@ class ResourcesTestCase(BaseTestCase):
         for clz in [Asset, ContentType, Entry, Space]:
             self.assertEqual(clz({'id': 'id'}).__repr__(), '<{0}(sys.id=id)>'.format(clz.__name__))
             self.assertEqual(clz().__repr__(), '<{0}>'.format(clz.__name__))
+
+    def test_slots(self):
+        for resource in [Array(), Asset(), ContentType(), Entry(), Space(), Cat(),
+                         ResourceLink({'id': 'nyancat', 'linkType': 'Entry'})]:
+            self.assertFalse(hasattr(resource, '__dict__'), resource)
+            with self.assertRaises(AttributeError):
+                resource.unknown = True
+
+        self.assertIsNotNone(weakref.ref(Cat()))
+
+    def test_slots_custom_entry(self):
+        cat = Cat()
+        cat.name = 'Nyan Cat'
+        self.assertEqual('Nyan Cat', cat.name)
+        self.assertEqual({'name': 'Nyan Cat'}, cat._cf_cda)
+        self.assertFalse(hasattr(cat, '__dict__'))
+        self.assertEqual((), Cat.__slots__)
+
+        class Dog(Entry):
+            __content_type__ = 'dog'
+            __dynamic_attributes__ = True
+
+        dog = Dog()
+        dog.unknown = True
+        self.assertTrue(dog.unknown)
+
+    def test_pickle(self):
+        factory = ResourceFactory([Cat])
+        items = [entry_json('nyancat', {'name': 'Nyan Cat', 'bestFriend': link_json('happycat')}),
+                 entry_json('grumpycat', {'name': 'Grumpy Cat'}, content_type='dog')]
+        array = factory.from_json(array_json(items, includes={'Asset': [asset_json('image')]}))
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(array, protocol))
+            nyancat, grumpycat = result.items
+            self.assertEqual(array.total, result.total)
+            self.assertIsInstance(nyancat, Cat)
+            self.assertEqual('Nyan Cat', nyancat.name)
+            self.assertIsInstance(nyancat.best_friend, ResourceLink)
+            self.assertEqual('happycat', nyancat.best_friend.resource_id)
+            self.assertIs(nyancat, result.items_mapped['Entry']['nyancat'])
+            self.assertEqual({'name': 'Grumpy Cat'}, grumpycat.fields)
+            self.assertEqual('image', result.items_mapped['Asset']['image'].sys['id'])
+
+        mouse = Mouse({'id': 'jerry'})
+        mouse.unknown = True
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(mouse, protocol))
+            self.assertTrue(result.unknown)
+            self.assertEqual('jerry', result.sys['id'])
+
+
+class LinkResolutionTestCase(BaseTestCase):
+    def setUp(self):
+        super(LinkResolutionTestCase, self).setUp()
+        self.factory = ResourceFactory([Cat])
+
+    def test_records_link_positions(self):
+        cat = self.factory.from_json(entry_json('nyancat', {'name': 'Nyan', 'bestFriend': link_json('happycat'),
+                                                            'likes': ['fish', link_json('image', 'Asset')]}))
+        positions = cat.link_positions()
+        self.assertEqual(2, len(positions))
+        self.assertTrue(all(isinstance(container[key], ResourceLink) for container, key in positions))
+        self.assertIs(cat._cf_links, positions)
+
+    def test_resolves_mixed_lists(self):
+        items = [entry_json('nyancat', {'friends': ['happycat', link_json('happycat'), 3, link_json('image', 'Asset'),
+                                                    link_json('unknown')]})]
+        includes = {'Entry': [entry_json('happycat')], 'Asset': [asset_json('image')]}
+        array = self.factory.from_json(array_json(items, includes=includes))
+        array.resolve_links()
+
+        friends = array.items[0].fields['friends']
+        self.assertEqual('happycat', friends[0])
+        self.assertIs(array.items_mapped['Entry']['happycat'], friends[1])
+        self.assertEqual(3, friends[2])
+        self.assertIs(array.items_mapped['Asset']['image'], friends[3])
+        self.assertIsInstance(friends[4], ResourceLink)
+        self.assertEqual(set([('Entry', 'unknown')]), array.unresolved_links())
+
+    def test_resolves_included_entries(self):
+        items = [entry_json('nyancat', {'bestFriend': link_json('happycat')})]
+        includes = {'Entry': [entry_json('happycat', {'bestFriend': link_json('nyancat')})]}
+        array = self.factory.from_json(array_json(items, includes=includes))
+        array.resolve_links()
+        self.assertIs(array.items[0], array.items[0].best_friend.best_friend)
+
+    def test_resolves_custom_entry_accessed_before(self):
+        factory = ResourceFactory([Cat], lazy_fields=True)
+        items = [entry_json('nyancat', {'bestFriend': link_json('happycat')}), entry_json('happycat')]
+        array = factory.from_json(array_json(items))
+        self.assertIsInstance(array.items[0].best_friend, ResourceLink)
+
+        array.resolve_links()
+        self.assertIs(array.items[1], array.items[0].best_friend)
+
+    def test_resolves_single_link_in_list_field(self):
+        items = [entry_json('nyancat', {'likes': link_json('image', 'Asset')})]
+        array = self.factory.from_json(array_json(items, includes={'Asset': [asset_json('image')]}))
+        cat = array.items[0]
+        self.assertIsInstance(cat.likes[0], ResourceLink)
+
+        array.resolve_links()
+        self.assertIs(array.items_mapped['Asset']['image'], cat.fields['likes'])
+        self.assertEqual([array.items_mapped['Asset']['image']], cat.likes)
+
+    def test_resolves_entry_without_recorded_positions(self):
+        cat = Entry({'type': 'Entry', 'id': 'nyancat'})
+        cat.fields = {'bestFriend': ResourceLink(link_json('happycat')['sys']), 'likes': ['fish']}
+        array = self.factory.from_json(array_json([entry_json('happycat')]))
+        array.map_resource(cat)
+        array.resolve_links()
+        self.assertIs(array.items[0], cat.fields['bestFriend'])
+
+
+class LinkResolverTestCase(BaseTestCase):
+    def setUp(self):
+        super(LinkResolverTestCase, self).setUp()
+        self.factory = ResourceFactory([Cat])
+
+    def chain(self, ids, includes=None):
+        items = [entry_json(ids[0], {'bestFriend': link_json(ids[1])})]
+        included = [entry_json(a, {'bestFriend': link_json(b)}) for a, b in zip(ids[1:], ids[2:])]
+        return self.factory.from_json(array_json(items, includes={'Entry': included + (includes or [])}))
+
+    def test_depth(self):
+        array = self.chain(['a', 'b', 'c', 'd', 'e'])
+        resolver = LinkResolver(depth=2)
+        array = resolver.add(array)
+        resolver.resolve(array.items)
+
+        b = array.items[0].best_friend
+        self.assertEqual('b', b.sys['id'])
+        self.assertEqual('c', b.best_friend.sys['id'])
+        self.assertIsInstance(b.best_friend.best_friend, ResourceLink)
+
+    def test_cycles(self):
+        array = self.chain(['a', 'b', 'c', 'a'])
+        resolver = LinkResolver()
+        array = resolver.add(array)
+        resolver.resolve(array.items)
+
+        a = array.items[0]
+        self.assertIs(a, a.best_friend.best_friend.best_friend)
+
+    def test_shared_across_pages(self):
+        first = self.chain(['a', 'b', 'c'])
+        second = self.factory.from_json(array_json([entry_json('d', {'bestFriend': link_json('b')})],
+                                                   includes={'Entry': [entry_json('b')]}))
+        resolver = LinkResolver(depth=1)
+        first, second = [resolver.add(page) for page in [first, second]]
+        for page in [first, second]:
+            resolver.resolve(page.items)
+
+        self.assertIs(first.items[0].best_friend, second.items[0].best_friend)
+        self.assertIs(first.items_mapped['Entry']['b'], second.items_mapped['Entry']['b'])
+
+    def test_add_leaves_array_unchanged(self):
+        first = self.chain(['a', 'b', 'c'])
+        second = self.factory.from_json(array_json([entry_json('b')]))
+        original = second.items[0]
+        resolver = LinkResolver()
+        resolver.add(first)
+        result = resolver.add(second)
+
+        self.assertIs(original, second.items[0])
+        self.assertIs(first.items_mapped['Entry']['b'], result.items[0])
+        self.assertEqual(second.total, result.total)
@@ -1,8 +1,14 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from contentful.cda.dates import DateParser
 from contentful.cda.fields import Boolean, Date, Number, Object, Text, List
 from contentful.cda.fields import Field
+from contentful.cda.resources import ResourceLink
 from contentful.cda.serialization import ResourceFactory
 from test import BaseTestCase
+from test.lib.utils import Cat, array_json, entry_json, link_json
 
 
 class ResourceFactoryTests(BaseTestCase):
@@ -56,4 +62,145 @@ class ResourceFactoryTests(BaseTestCase):
         lst = ResourceFactory.convert_value(item, Field(List))
         self.assertIsInstance(lst, list)
         self.assertEqual(1, len(lst))
-        self.assertEqual(item, lst[0])
\ No newline at end of file
+        self.assertEqual(item, lst[0])
+
+
+class LazyFieldsTests(BaseTestCase):
+    def setUp(self):
+        super(LazyFieldsTests, self).setUp()
+        self.factory = ResourceFactory([Cat], lazy_fields=True)
+
+    def test_convert_on_access(self):
+        cat = self.factory.from_json(entry_json('nyancat', {'name': 'Nyan', 'lives': '9',
+                                                            'birthday': '2011-04-04T22:00:00+00:00'}))
+        self.assertIsInstance(cat, Cat)
+        self.assertEqual({}, getattr(cat, '_cf_cda', {}))
+
+        self.assertEqual(9, cat.lives)
+        self.assertEqual(2011, cat.birthday.year)
+        self.assertEqual('Nyan', cat.name)
+        self.assertIsNone(cat.color)
+        self.assertEqual(set(['likes', 'bestFriend']), set(cat._cf_cda_pending))
+
+    def test_convert_once(self):
+        cat = self.factory.from_json(entry_json('nyancat', {'lives': '9'}))
+        self.assertIs(cat.lives, cat.lives)
+        cat.fields['lives'] = '1'
+        self.assertEqual(9, cat.lives)
+
+    def test_pickle_and_copy(self):
+        factory = ResourceFactory([Cat], lazy_fields=True, date_parser=DateParser(memo_size=10))
+        cat = factory.from_json(entry_json('nyancat', {'name': 'Nyan', 'lives': '9',
+                                                       'birthday': '2011-04-04T22:00:00+00:00'}))
+        self.assertEqual('Nyan', cat.name)
+
+        for result in [pickle.loads(pickle.dumps(cat)), copy.deepcopy(cat)]:
+            self.assertEqual('Nyan', result.name)
+            self.assertEqual(9, result.lives)
+            self.assertEqual(2011, result.birthday.year)
+            self.assertEqual(set(['color', 'likes', 'bestFriend']), set(result._cf_cda_pending))
+
+    def test_set_before_access(self):
+        cat = self.factory.from_json(entry_json('nyancat', {'lives': '9'}))
+        cat.lives = 3
+        self.assertEqual(3, cat.lives)
+
+    def test_resolved_link(self):
+        items = [entry_json('nyancat', {'bestFriend': link_json('happycat')}),
+                 entry_json('happycat', {'name': 'Happy Cat'})]
+        array = self.factory.from_json(array_json(items))
+        array.resolve_links()
+        self.assertEqual('Happy Cat', array.items[0].best_friend.name)
+
+
+class LazyRawFieldsTests(BaseTestCase):
+    def setUp(self):
+        super(LazyRawFieldsTests, self).setUp()
+        self.factory = ResourceFactory([], lazy_raw_fields=True)
+
+    def test_rebuild_on_access(self):
+        fields = {'name': 'Nyan', 'likes': ['rainbows', 'fish'], 'bestFriend': link_json('happycat'),
+                  'image': link_json('nyanimage', 'Asset'), 'meta': {'links': [link_json('a'), 1]}}
+        expected = copy.deepcopy(fields)
+        entry = self.factory.from_json(entry_json('nyancat', fields))
+
+        self.assertIsNone(entry._raw_fields)
+        self.assertEqual(expected, entry.raw_fields)
+        self.assertIs(entry.raw_fields, entry.raw_fields)
+
+    def test_rebuild_resolved_links(self):
+        items = [entry_json('nyancat', {'bestFriend': link_json('happycat'), 'friends': [link_json('happycat')]}),
+                 entry_json('happycat', {'name': 'Happy Cat'})]
+        array = self.factory.from_json(array_json(items))
+        array.resolve_links()
+
+        nyancat = array.items[0]
+        self.assertEqual('Happy Cat', nyancat.fields['bestFriend'].fields['name'])
+        self.assertEqual({'bestFriend': link_json('happycat'), 'friends': [link_json('happycat')]},
+                         nyancat.raw_fields)
+
+    def test_copy_independent(self):
+        entry = self.factory.from_json(entry_json('nyancat', {'likes': ['rainbows']}))
+        entry.raw_fields['likes'].append('fish')
+        self.assertEqual(['rainbows'], entry.fields['likes'])
+
+
+class PlanTests(BaseTestCase):
+    def test_plan_for(self):
+        factory = ResourceFactory([Cat])
+        plan = dict((attribute, (field_id, converter)) for attribute, field_id, converter in factory.plans['cat'])
+        self.assertEqual(set(Cat.__entry_fields__), set(plan))
+        self.assertEqual(('bestFriend', None), plan['best_friend'])
+        self.assertIs(factory.date_parser, plan['birthday'][1])
+        self.assertIs(ResourceFactory.CONVERTERS[Number], plan['lives'][1])
+
+    def test_create_entry_with_plan(self):
+        factory = ResourceFactory([Cat])
+        cat = factory.from_json(entry_json('nyancat', {'name': 'Nyan', 'lives': '9', 'likes': 'rainbows',
+                                                        'bestFriend': link_json('happycat')}))
+        self.assertEqual(9, cat.lives)
+        self.assertEqual(['rainbows'], cat.likes)
+        self.assertIsInstance(cat.best_friend, ResourceLink)
+        self.assertIsNone(cat.color)
+        self.assertNotIn('color', cat._cf_cda)
+
+    def test_from_json_unknown_type(self):
+        self.assertIsNone(ResourceFactory([]).from_json({'sys': {'type': 'Unknown'}}))
+
+
+class ThreadSafetyTests(BaseTestCase):
+    def test_shared_factory(self):
+        items = [entry_json('cat{0}'.format(i), {'name': 'cat{0}'.format(i), 'lives': str(i),
+                                                 'birthday': '2015-01-{0:02d}T00:00:00Z'.format(i % 5 + 1)})
+                 for i in range(20)]
+        factory = ResourceFactory([Cat], date_parser=DateParser(memo_size=3))
+
+        def create(_):
+            array = factory.from_json(array_json(copy.deepcopy(items)))
+            return [(cat.name, cat.lives, cat.birthday.day) for cat in array.items]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(create, range(40)))
+
+        expected = [('cat{0}'.format(i), i, i % 5 + 1) for i in range(20)]
+        self.assertEqual([expected] * 40, results)
+
+    def test_concurrent_lazy_fields(self):
+        factory = ResourceFactory([Cat], lazy_fields=True)
+        cats = [factory.from_json(entry_json('nyancat', {'name': 'Nyan Cat', 'lives': '9'})) for _ in range(20)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda cat: (cat.name, cat.lives), cats * 4))
+
+        self.assertEqual([('Nyan Cat', 9)] * 80, results)
+
+    def test_concurrent_lazy_fields_same_entry(self):
+        factory = ResourceFactory([Cat], lazy_fields=True)
+        cat = factory.from_json(entry_json('nyancat', {'name': 'Nyan Cat', 'lives': '9', 'color': 'rainbow'}))
+        self.assertEqual({}, Field.dict_for_instance(cat))
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda name: getattr(cat, name), ['name', 'lives', 'color']))
+
+        self.assertEqual(['Nyan Cat', 9, 'rainbow'], results)
+        self.assertEqual({'name': 'Nyan Cat', 'lives': 9, 'color': 'rainbow'}, Field.dict_for_instance(cat))
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+
+from contentful.cda.resources import Asset, ContentType, Entry, ResourceLink
+from contentful.cda.serialization import ResourceFactory
+from contentful.cda.store import SQLiteStore
+from test import BaseTestCase
+from test.lib.utils import Cat, SYNC_PAGES, sync_handler, fake_client
+
+
+class SQLiteStoreTestCase(BaseTestCase):
+    def setUp(self):
+        super(SQLiteStoreTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'space.db')
+        self.store = SQLiteStore(self.path, custom_entries=[Cat])
+        self.client = fake_client(sync_handler(SYNC_PAGES))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+        super(SQLiteStoreTestCase, self).tearDown()
+
+    def test_initial_sync(self):
+        self.assertIsNone(self.store.sync_token)
+        self.store.sync(self.client)
+        self.assertEqual('token1', self.store.sync_token)
+        self.assertEqual(2, self.store.count(Entry.__name__))
+        self.assertEqual(1, self.store.count(Asset.__name__))
+
+        cat = self.store.get_entry('nyancat')
+        self.assertIsInstance(cat, Cat)
+        self.assertEqual('nyancat', cat.name)
+        self.assertIsInstance(cat.best_friend, ResourceLink)
+        self.assertIs(type(self.store.resolve_resource_link(cat.best_friend)), Cat)
+
+        asset = self.store.get_asset('nyancat-image')
+        self.assertEqual('//images/nyancat-image.png', asset.url)
+
+    def test_delta_sync(self):
+        self.store.sync(self.client)
+        self.store.sync(self.client)
+
+        self.assertEqual('token2', self.store.sync_token)
+        self.assertIsNone(self.store.get_entry('happycat'))
+        self.assertIsNone(self.store.get_asset('nyancat-image'))
+        self.assertEqual(['garfield', 'nyancat'], [cat.sys['id'] for cat in self.store.find_entries('cat')])
+        self.assertEqual(2, self.store.get_entry('nyancat').sys['revision'])
+
+    def test_sync_is_transactional(self):
+        self.store.sync(self.client)
+        result = self.client.sync('token1')
+        result.items.append(object())
+
+        self.assertRaises(Exception, self.store.apply_sync, result)
+        self.assertEqual('token1', self.store.sync_token)
+        self.assertIsNotNone(self.store.get_entry('happycat'))
+
+    def test_persists(self):
+        self.store.sync(self.client)
+        self.store.close()
+
+        self.store = SQLiteStore(self.path)
+        self.assertEqual('token1', self.store.sync_token)
+        self.assertIs(type(self.store.get_entry('nyancat')), Entry)
+
+    def test_save_content_types(self):
+        content_type = ResourceFactory.create_content_type({
+            'sys': {'type': 'ContentType', 'id': 'cat'}, 'name': 'Cat', 'displayField': 'name',
+            'fields': [{'id': 'name', 'name': 'Name', 'type': 'Text'}]})
+        self.store.save([content_type])
+
+        result = self.store.get_content_type('cat')
+        self.assertIsInstance(result, ContentType)
+        self.assertEqual('Cat', result.name)
+        self.assertEqual({'name': {'name': 'Name', 'type': 'Text'}}, result.fields)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import json
+import six
+
+from contentful.cda.streaming import ArrayStreamParser
+from test import BaseTestCase
+from test.lib.utils import array_json, entry_json, link_json
+
+
+class ArrayStreamParserTestCase(BaseTestCase):
+    def setUp(self):
+        super(ArrayStreamParserTestCase, self).setUp()
+        items = [entry_json('cat{0}'.format(i), {'name': six.u('Nyan Cat \u2605'), 'lives': i,
+                                                 'bestFriend': link_json('cat0')})
+                 for i in range(10)]
+        self.body = array_json(items, includes={'Entry': [entry_json('cat10')]})
+        self.content = json.dumps(self.body, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def parse(self, chunk_size, parser=None):
+        parser = parser or ArrayStreamParser()
+        events = []
+        for i in range(0, len(self.content), chunk_size):
+            events.extend(parser.feed(self.content[i:i + chunk_size]))
+        events.extend(parser.close())
+        return events
+
+    def test_parse(self):
+        for chunk_size in [1, 5, 64, len(self.content)]:
+            events = self.parse(chunk_size)
+            self.assertEqual(self.body['items'], [value for key, value in events if key == 'items'])
+            self.assertEqual(dict((k, v) for k, v in self.body.items() if k != 'items'),
+                             dict((k, v) for k, v in events if k != 'items'))
+
+    def test_items_emitted_before_end(self):
+        parser = ArrayStreamParser()
+        half = len(self.content) // 2
+        events = parser.feed(self.content[:half])
+        self.assertTrue(any(key == 'items' for key, value in events))
+        self.assertFalse(parser.done)
+
+    def test_numbers_split_across_chunks(self):
+        parser = ArrayStreamParser()
+        self.assertEqual([], parser.feed(b'{"total": 12'))
+        self.assertEqual([('total', 123)], parser.feed(b'3, "items": []}'))
+        self.assertEqual([], parser.close())
+
+    def test_stream_keys(self):
+        events = self.parse(64, ArrayStreamParser(stream_keys=()))
+        self.assertEqual([self.body['items']], [value for key, value in events if key == 'items'])
+
+    def test_incomplete(self):
+        parser = ArrayStreamParser()
+        parser.feed(self.content[:-10])
+        self.assertRaises(ValueError, parser.close)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, ArrayStreamParser().feed, b'["items"]')
+        self.assertRaises(ValueError, ArrayStreamParser().feed, b'{"items" [1]}')
@@ -9,3 +9,9 @@ class UtilsTestCase(BaseTestCase):
         self.assertIs(utils.class_for_type('ContentType'), ContentType)
         self.assertIs(utils.class_for_type('Entry'), Entry)
         self.assertIs(utils.class_for_type('Space'), Space)
+
+    def test_chunk_ids(self):
+        self.assertEqual([], utils.chunk_ids([]))
+        self.assertEqual([['a', 'b', 'c']], utils.chunk_ids(['a', 'b', 'c']))
+        self.assertEqual([['aa', 'bb'], ['cc']], utils.chunk_ids(['aa', 'bb', 'cc'], max_length=5))
+        self.assertEqual([['a', 'b'], ['c']], utils.chunk_ids(['a', 'b', 'c'], max_count=2))